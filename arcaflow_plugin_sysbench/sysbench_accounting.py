@@ -0,0 +1,155 @@
+import os
+import threading
+
+IO_FIELDS = {
+    "rchar": "read_chars",
+    "wchar": "written_chars",
+    "syscr": "read_syscalls",
+    "syscw": "write_syscalls",
+    "read_bytes": "read_bytes",
+    "write_bytes": "write_bytes",
+}
+STATUS_FIELDS = {
+    "VmHWM": "peak_rss_KiB",
+    "voluntary_ctxt_switches": "voluntary_context_switches",
+    "nonvoluntary_ctxt_switches": "involuntary_context_switches",
+}
+RUSAGE_FIELDS = {
+    "ru_utime": "user_time",
+    "ru_stime": "system_time",
+    "ru_nvcsw": "voluntary_context_switches",
+    "ru_nivcsw": "involuntary_context_switches",
+    "ru_majflt": "major_faults",
+    "ru_minflt": "minor_faults",
+    "ru_maxrss": "peak_rss_KiB",
+}
+# Counters which are not summed over processes
+PEAK_FIELDS = ("peak_rss_KiB",)
+
+
+def read_proc_fields(path, fields):
+    values = {}
+    with open(path, "r") as proc_file:
+        for line in proc_file:
+            name, _, value = line.partition(":")
+            if name in fields:
+                values[fields[name]] = int(value.split()[0])
+    return values
+
+
+def read_process(pid):
+    """
+    I/O counters from /proc/<pid>/io and peak memory and context switches
+    from /proc/<pid>/status of a process.
+    """
+    values = {}
+    for name, fields in (("io", IO_FIELDS), ("status", STATUS_FIELDS)):
+        try:
+            values.update(read_proc_fields(f"/proc/{pid}/{name}", fields))
+        except (OSError, ValueError):
+            pass
+    return values
+
+
+class ProcessSampler:
+    """
+    Keep the latest /proc counters of a running process, read every interval
+    seconds from a background thread, as they vanish once the process exits.
+    """
+
+    def __init__(self, pid, interval=1.0):
+        self.pid = pid
+        self.interval = interval
+        self.values = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        # the process has usually closed its output and is about to exit,
+        # so these are the final counters
+        self.sample()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        values = read_process(self.pid)
+        if values:
+            self.values = values
+
+
+def wait_with_rusage(process):
+    """
+    Reap the process with wait4, which returns the resource usage of this
+    child alone, unlike RUSAGE_CHILDREN which mixes in concurrent instances.
+    Returns the exit code and the resource usage, or None when the process
+    was already reaped.
+    """
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        # Popen reaps the process itself when it is signalled after exiting
+        return process.wait(), None
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, rusage
+
+
+def counters(rusage, proc_values):
+    """
+    Combine the resource usage of a process with its /proc counters, the
+    resource usage taking precedence where both provide a counter.
+    """
+    values = dict(proc_values)
+    if rusage is not None:
+        for field, name in RUSAGE_FIELDS.items():
+            values[name] = getattr(rusage, field)
+    return values
+
+
+def efficiency(values, totaltime, events):
+    """
+    Add the efficiency metrics derived from the counters of a run.
+    """
+    values = dict(values)
+    if "user_time" in values:
+        cpu_time = values["user_time"] + values["system_time"]
+        if cpu_time > 0 and events:
+            values["events_per_cpu_second"] = events / cpu_time
+        if totaltime:
+            values["cpu_utilization"] = cpu_time / totaltime
+    if "voluntary_context_switches" in values and events:
+        values["context_switches_per_event"] = (
+            values["voluntary_context_switches"]
+            + values["involuntary_context_switches"]
+        ) / events
+    syscalls = values.get("read_syscalls", 0) + values.get("write_syscalls", 0)
+    if syscalls:
+        values["bytes_per_syscall"] = (
+            values["read_chars"] + values["written_chars"]
+        ) / syscalls
+    return values
+
+
+def merge(accountings, totaltime, events):
+    """
+    Add up the counters of concurrent processes, keeping the largest peak
+    memory, and derive the efficiency metrics of the combined run.
+    """
+    counter_fields = (
+        set(IO_FIELDS.values())
+        | set(STATUS_FIELDS.values())
+        | set(RUSAGE_FIELDS.values())
+    )
+    merged = {}
+    for key in set.intersection(*(set(item) for item in accountings)):
+        if key in PEAK_FIELDS:
+            merged[key] = max(item[key] for item in accountings)
+        elif key in counter_fields:
+            merged[key] = sum(item[key] for item in accountings)
+    return efficiency(merged, totaltime, events)
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+
+# Tests the plugin runs, probed ahead of time when the cache is prepared
+TESTS = ("cpu", "memory", "fileio", "threads", "mutex")
+# Environment variable overriding the cache directory, such as a volume
+# mounted into the container so that the cache outlives it
+CACHE_DIRECTORY_VARIABLE = "SYSBENCH_CAPABILITIES_CACHE"
+# Option lines of the help output, such as
+#   --file-test-mode=STRING   test mode {seqwr, seqrewr, seqrd, rndrd, rndwr}
+OPTION_LINE = re.compile(r"^\s+--([a-z0-9-]+)(?:\[?=\S*)?\s*(.*)$")
+CHOICES = re.compile(r"\{([^}]*)\}")
+CHOICE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+# Capabilities probed in this process, keyed by the binary path and mtime
+_probed = {}
+
+
+def default_cache_directory():
+    if os.environ.get(CACHE_DIRECTORY_VARIABLE):
+        return os.environ[CACHE_DIRECTORY_VARIABLE]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "arcaflow-plugin-sysbench")
+
+
+def parse_options(help_output):
+    """
+    Parse the options listed by sysbench help into a dictionary of the
+    option names and their allowed values, or None when any value is allowed.
+    """
+    options = {}
+    for line in help_output.splitlines():
+        match = OPTION_LINE.match(line)
+        if match is None:
+            continue
+        choices = CHOICES.search(match.group(2))
+        if choices is not None:
+            choices = [choice.strip() for choice in choices.group(1).split(",")]
+            if not all(CHOICE.match(choice) for choice in choices):
+                # a description in braces rather than a list of values
+                choices = None
+        options[match.group(1)] = choices
+    return options
+
+
+def run_probe(binary, *args):
+    result = subprocess.run(
+        [binary, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+    )
+    return result.returncode, result.stdout
+
+
+def probe_binary(binary):
+    returncode, version = run_probe(binary, "--version")
+    if returncode != 0:
+        raise Exception(
+            returncode,
+            "{} failed with return code {}:\n{}".format(binary, returncode, version),
+        )
+    _, general_help = run_probe(binary, "--help")
+    return {
+        "version": version.strip(),
+        "options": parse_options(general_help),
+        "tests": {},
+    }
+
+
+def probe_test(binary, test):
+    """
+    Options of a test from "sysbench <test> help", or None when the binary
+    does not support the test.
+    """
+    returncode, test_help = run_probe(binary, test, "help")
+    if returncode != 0:
+        return None
+    return parse_options(test_help)
+
+
+def write_cache(cache_file, key, capabilities):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file + ".tmp", "w") as cached:
+            json.dump({"key": key, "capabilities": capabilities}, cached)
+        os.replace(cache_file + ".tmp", cache_file)
+    except OSError:
+        # an unwritable cache only costs probing again next time
+        pass
+
+
+def probe(binary="sysbench", cache_directory=None, test=None):
+    """
+    Return the version, general options and per test options of the sysbench
+    binary. Tests are only probed once asked for, so that a step running one
+    test starts no more than three probes. The result is cached on disk, keyed
+    by the path and modification time of the binary, so that sysbench is only
+    probed again once it changed.
+    """
+    path = shutil.which(binary)
+    if path is None:
+        raise Exception(1, f"{binary} was not found")
+    path = os.path.realpath(path)
+    key = {"path": path, "mtime_ns": os.stat(path).st_mtime_ns}
+    key_id = json.dumps(key, sort_keys=True)
+
+    if cache_directory is None:
+        cache_directory = default_cache_directory()
+    cache_file = os.path.join(
+        cache_directory,
+        "capabilities-{}.json".format(hashlib.sha1(path.encode()).hexdigest()),
+    )
+    capabilities = _probed.get(key_id)
+    if capabilities is None:
+        try:
+            with open(cache_file, "r") as cached:
+                stored = json.load(cached)
+            if stored.get("key") == key:
+                capabilities = stored["capabilities"]
+        except (OSError, ValueError, KeyError):
+            pass
+    probed = capabilities is None
+    if probed:
+        capabilities = probe_binary(path)
+    if test is not None and test not in capabilities["tests"]:
+        capabilities["tests"][test] = probe_test(path, test)
+        probed = True
+    if probed:
+        write_cache(cache_file, key, capabilities)
+    _probed[key_id] = capabilities
+    return capabilities
+
+
+def check_flags(capabilities, test, flags):
+    """
+    Raise an error when the sysbench binary does not support the test, one of
+    the options or one of the option values. Without a test, as for Lua
+    scripts, only the general options are checked.
+    """
+    if test is not None and capabilities["tests"].get(test) is None:
+        raise Exception(
+            1, f"{capabilities['version']} does not support the {test} test"
+        )
+    if not capabilities["options"]:
+        # help output in an unknown format, leave the checks to sysbench
+        return
+    options = dict(capabilities["options"])
+    if test is not None:
+        options.update(capabilities["tests"][test])
+    for flag in flags:
+        name, _, value = flag[2:].partition("=")
+        if name not in options:
+            raise Exception(
+                1,
+                f"{capabilities['version']} does not support the --{name} option"
+                + ("" if test is None else f" of the {test} test"),
+            )
+        choices = options[name]
+        # list options take several comma separated values
+        if choices is not None and not set(value.split(",")) <= set(choices):
+            raise Exception(
+                1,
+                f"{capabilities['version']} does not support {value} for --{name},"
+                f" supported values are {', '.join(choices)}",
+            )
+
+
+if __name__ == "__main__":
+    # prepare the cache, such as when building the container image, so that
+    # the steps start no probes
+    for test in TESTS:
+        probe(test=test)
@@ -0,0 +1,77 @@
+import glob
+import json
+import os
+
+# Manifest of the prepared fileio test files, stored next to them
+MANIFEST = ".sysbench-fileio-manifest.json"
+TEST_FILES = "test_file.*"
+
+
+def fileset_key(params, directory):
+    """
+    Return the parameters identifying a prepared set of fileio test files.
+    """
+    return {
+        "file-num": params.file_num,
+        "file-total-size": params.file_total_size,
+        "file-block-size": params.file_block_size,
+        "directory": os.path.abspath(directory),
+    }
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST), "r") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(directory, key):
+    """
+    Record the size and modification time of every test file, so that a
+    later run can verify the files were not changed behind its back.
+    """
+    files = {}
+    for path in sorted(glob.glob(os.path.join(directory, TEST_FILES))):
+        stat = os.stat(path)
+        files[os.path.basename(path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+    manifest_path = os.path.join(directory, MANIFEST)
+    with open(manifest_path + ".tmp", "w") as manifest_file:
+        json.dump({"key": key, "files": files}, manifest_file)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def is_prepared(directory, key):
+    manifest = read_manifest(directory)
+    if manifest is None or manifest.get("key") != key or not manifest.get("files"):
+        return False
+    for name, recorded in manifest["files"].items():
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) != (
+            recorded["size"],
+            recorded["mtime_ns"],
+        ):
+            return False
+    return True
+
+
+def evict(directory):
+    """
+    Remove the test files recorded in the manifest along with the manifest.
+    """
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return
+    for name in manifest.get("files", {}):
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+    os.remove(os.path.join(directory, MANIFEST))
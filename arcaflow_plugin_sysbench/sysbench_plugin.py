@@ -1,18 +1,75 @@
 #!/usr/bin/env python3
 
+import array
+import concurrent.futures
+import dataclasses
+import functools
+import glob
+import itertools
+import math
+import os
 import re
+import signal
+import sqlite3
 import sys
+import tempfile
+import threading
+import time
 import typing
-from arcaflow_plugin_sdk import plugin
+from arcaflow_plugin_sdk import plugin, schema
 import subprocess
+import yaml
+import sysbench_accounting
+import sysbench_capabilities
+import sysbench_fileset
+import sysbench_statistics
+import sysbench_store
+import sysbench_telemetry
 from sysbench_schema import (
+    FileCleanup,
+    FileIoMode,
+    OnOff,
+    PLUGIN_PARAMETERS,
     SysbenchCpuInputParams,
     SysbenchMemoryInputParams,
     SysbenchIoInputParams,
+    SysbenchThreadsInputParams,
+    SysbenchMutexInputParams,
+    SysbenchLuaInputParams,
+    SysbenchCpuInstance,
+    SysbenchMemoryInstance,
+    SysbenchIoInstance,
+    SysbenchThreadsInstance,
+    SysbenchMutexInstance,
+    SysbenchLuaInstance,
+    SysbenchThreadScalingInputParams,
+    SysbenchMemoryCacheInputParams,
+    SysbenchIoMatrixInputParams,
+    SysbenchIoQueueDepthInputParams,
+    SysbenchRateSweepInputParams,
+    SysbenchMaxRateInputParams,
+    SysbenchInterferenceInputParams,
+    SysbenchComparisonInputParams,
+    SysbenchQueryInputParams,
+    SysbenchResults,
     WorkloadResultsCpu,
     WorkloadResultsMemory,
     WorkloadResultsIo,
+    WorkloadResultsThreads,
+    WorkloadResultsMutex,
+    WorkloadResultsLua,
+    WorkloadResultsThreadScaling,
+    WorkloadResultsMemoryCache,
+    WorkloadResultsIoMatrix,
+    WorkloadResultsIoQueueDepth,
+    WorkloadResultsRateSweep,
+    WorkloadResultsMaxRate,
+    WorkloadResultsInterference,
+    WorkloadComparison,
+    WorkloadResultsQuery,
     WorkloadError,
+    WorkloadPartialResults,
+    RepetitionStatistics,
     sysbench_cpu_input_schema,
     sysbench_cpu_output_schema,
     sysbench_cpu_results_schema,
@@ -22,242 +79,2910 @@ from sysbench_schema import (
     sysbench_io_input_schema,
     sysbench_io_output_schema,
     sysbench_io_results_schema,
+    sysbench_threads_input_schema,
+    sysbench_threads_output_schema,
+    sysbench_threads_results_schema,
+    sysbench_mutex_input_schema,
+    sysbench_mutex_output_schema,
+    sysbench_mutex_results_schema,
+    sysbench_lua_input_schema,
+    sysbench_lua_output_schema,
+    sysbench_lua_results_schema,
+    sysbench_interval_schema,
+    sysbench_metric_statistics_schema,
+    sysbench_thread_scaling_results_schema,
+    sysbench_memory_cache_results_schema,
+    sysbench_partial_results_schema,
+    sysbench_telemetry_schema,
+    sysbench_io_matrix_results_schema,
+    sysbench_io_queue_depth_results_schema,
+    sysbench_rate_sweep_results_schema,
+    sysbench_max_rate_results_schema,
+    sysbench_interference_results_schema,
+    sysbench_results_schema,
+    sysbench_comparison_schema,
+    sysbench_query_results_schema,
 )
 
+# Schemas to rebuild the results of each workload when merging instances
+INSTANCE_SCHEMAS = {
+    WorkloadResultsCpu: (
+        sysbench_cpu_output_schema,
+        sysbench_cpu_results_schema,
+        SysbenchCpuInstance,
+    ),
+    WorkloadResultsMemory: (
+        sysbench_memory_output_schema,
+        sysbench_memory_results_schema,
+        SysbenchMemoryInstance,
+    ),
+    WorkloadResultsIo: (
+        sysbench_io_output_schema,
+        sysbench_io_results_schema,
+        SysbenchIoInstance,
+    ),
+    WorkloadResultsThreads: (
+        sysbench_threads_output_schema,
+        sysbench_threads_results_schema,
+        SysbenchThreadsInstance,
+    ),
+    WorkloadResultsMutex: (
+        sysbench_mutex_output_schema,
+        sysbench_mutex_results_schema,
+        SysbenchMutexInstance,
+    ),
+    WorkloadResultsLua: (
+        sysbench_lua_output_schema,
+        sysbench_lua_results_schema,
+        SysbenchLuaInstance,
+    ),
+}
+
+# sysbench test and input schema of each workload
+WORKLOAD_TESTS = {
+    SysbenchCpuInputParams: ("cpu", sysbench_cpu_input_schema),
+    SysbenchMemoryInputParams: ("memory", sysbench_memory_input_schema),
+    SysbenchIoInputParams: ("fileio", sysbench_io_input_schema),
+    SysbenchThreadsInputParams: ("threads", sysbench_threads_input_schema),
+    SysbenchMutexInputParams: ("mutex", sysbench_mutex_input_schema),
+    # Lua scripts define their own options, only the general ones are checked
+    SysbenchLuaInputParams: (None, sysbench_lua_input_schema),
+}
+
+# Results of the workloads run by run_sysbench_workload
+WORKLOAD_RESULTS = {
+    SysbenchCpuInputParams: WorkloadResultsCpu,
+    SysbenchMemoryInputParams: WorkloadResultsMemory,
+    SysbenchThreadsInputParams: WorkloadResultsThreads,
+    SysbenchMutexInputParams: WorkloadResultsMutex,
+}
+# Input parameters a workload also returns in its output
+OUTPUT_PARAMETERS = {
+    SysbenchMemoryInputParams: ("memory_access_mode",),
+}
+
+# Names of the workloads in the result store and the comparison inputs
+STORED_WORKLOADS = {
+    SysbenchCpuInputParams: "cpu",
+    SysbenchMemoryInputParams: "memory",
+    SysbenchIoInputParams: "io",
+    SysbenchThreadsInputParams: "threads",
+    SysbenchMutexInputParams: "mutex",
+    SysbenchLuaInputParams: "lua",
+}
+
+# Intermediate reports are printed as "[ 10s ] thds: 2 eps: 2918.69 ..."
+INTERVAL_LINE = re.compile(r"^\[\s*([0-9.]+)s\s*\]\s*(.*)$")
+INTERVAL_PERCENTILE = re.compile(r"lat(?:ency)?\s*\(ms,\s*([0-9]+)%\):\s*([0-9.]+)")
+INTERVAL_METRICS = (
+    ("threads", re.compile(r"thds:\s*([0-9]+)"), int),
+    ("eventspersecond", re.compile(r"\b[et]ps:\s*([0-9.]+)"), float),
+    ("queriespersecond", re.compile(r"\bqps:\s*([0-9.]+)"), float),
+    ("transferred_MiBpersec", re.compile(r"([0-9.]+)\s*MiB/sec"), float),
+    ("read_MiB_s", re.compile(r"reads:\s*([0-9.]+)\s*MiB/s"), float),
+    ("written_MiB_s", re.compile(r"writes:\s*([0-9.]+)\s*MiB/s"), float),
+    ("fsyncs_s", re.compile(r"fsyncs:\s*([0-9.]+)/s"), float),
+    ("queuelength", re.compile(r"queue length:\s*([0-9]+)"), int),
+    ("concurrency", re.compile(r"concurrency:\s*([0-9]+)"), int),
+)
+# Every statistics dump triggered by report-checkpoints starts with this line
+CHECKPOINT_LINE = re.compile(r"^\[\s*([0-9.]+)s\s*\]\s*Checkpoint report:$")
+# Histogram rows are printed as "  0.672 |*****   27633"
+HISTOGRAM_ROW = re.compile(r"^([0-9.]+)\s*\|\**\s*([0-9]+)$")
+# Memory throughput is printed as "68399.07 MiB transferred (6839.08 MiB/sec)"
+TRANSFERRED = re.compile(r"^([0-9.]+) MiB transferred \(([0-9.]+) MiB/sec\)$")
+TOTAL_OPERATIONS = re.compile(r"^([0-9]+) \(([0-9.]+) per second\)$")
+PERCENTILE_KEY = re.compile(r"^([0-9]+)(?:st|nd|rd|th)percentile$")
+# sysbench 1.1 prints the fileio rates as "read:  IOPS=77301.57 1207.84 MiB/s"
+IOPS = re.compile(r"^IOPS=([0-9.]+)(?:\s+([0-9.]+) MiB/s)?")
+UNITS = re.compile(r"\(.*?\)")
+# Values of the custom "key: value" lines of Lua scripts, a number or a count
+# and its rate like "transactions: 19994 (999.52 per sec.)"
+CUSTOM_VALUE = re.compile(
+    r"^(-?[0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)(?:\s+\((-?[0-9.]+) per sec\.\))?$"
+)
+# Lua script options, passed to sysbench as --name=value
+SCRIPT_OPTION = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+
+
+def seconds(value):
+    return float(value.rstrip("s"))
+
+
+def avg_stddev(value):
+    avg, stddev = value.split("/")
+    return {"avg": float(avg), "stddev": float(stddev)}
+
+
+def total_operations(value):
+    match = TOTAL_OPERATIONS.match(value)
+    return {
+        "Totaloperations": int(match.group(1)),
+        "Totaloperationspersecond": float(match.group(2)),
+    }
+
+
+# "key: value" lines of the option and general statistics sections, keyed
+# by the key without spaces. Fields mapped to None return several values.
+OUTPUT_FIELDS = {
+    "Numberofthreads": ("Numberofthreads", int),
+    "Validationchecks": ("Validationchecks", str),
+    "Primenumberslimit": ("Primenumberslimit", int),
+    "blocksize": ("blocksize", str),
+    "totalsize": ("totalsize", str),
+    "operation": ("operation", str),
+    "scope": ("scope", str),
+    "Extrafileopenflags": ("Extrafileopenflags", str),
+    "NumberofIOrequests": ("NumberofIOrequests", int),
+    "Read/WriteratioforcombinedrandomIOtest": (
+        "ReadWriteratioforcombinedrandomIOtest",
+        float,
+    ),
+    "Totaloperations": (None, total_operations),
+    "totaltime": ("totaltime", seconds),
+    "totalnumberofevents": ("totalnumberofevents", int),
+}
+# Result sections, keyed by their header without spaces and units
+RESULT_SECTIONS = {
+    "CPUspeed": "CPUspeed",
+    "Fileoperations": "Fileoperations",
+    "Throughput": "Throughput",
+    "Latency": "Latency",
+    "Threadsfairness": "Threadsfairness",
+}
+# "key: value" lines of the result sections
+RESULT_FIELDS = {
+    "eventspersecond": ("eventspersecond", float),
+    "reads/s": ("reads_s", float),
+    "writes/s": ("writes_s", float),
+    "fsyncs/s": ("fsyncs_s", float),
+    "read,MiB/s": ("read_MiB_s", float),
+    "written,MiB/s": ("written_MiB_s", float),
+    "min": ("min", float),
+    "avg": ("avg", float),
+    "max": ("max", float),
+    "sum": ("sum", float),
+    "events(avg/stddev)": ("events", avg_stddev),
+    "executiontime(avg/stddev)": ("executiontime", avg_stddev),
+}
+# sysbench 1.1 fileio rate lines, mapped to the operation and throughput
+# fields printed by sysbench 1.0
+IOPS_FIELDS = {
+    "read": ("reads_s", "read_MiB_s"),
+    "write": ("writes_s", "written_MiB_s"),
+    "fsync": ("fsyncs_s", None),
+}
+
+
+def parse_interval(line):
+    """
+    Parse a sysbench intermediate report line into a dictionary, or return
+    None if the line is not an intermediate report.
+    """
+    match = INTERVAL_LINE.match(line.strip())
+    if match is None:
+        return None
+    report = {}
+    for key, pattern, cast in INTERVAL_METRICS:
+        metric = pattern.search(match.group(2))
+        if metric is not None:
+            report[key] = cast(metric.group(1))
+    latency = INTERVAL_PERCENTILE.search(match.group(2))
+    if latency is not None:
+        report["percentile"] = int(latency.group(1))
+        report["percentile_value"] = float(latency.group(2))
+    if not report:
+        return None
+    report["time"] = float(match.group(1))
+    return report
+
+
+def read_output(stream):
+    """
+    Consume sysbench output line by line, collecting intermediate reports as
+    they arrive and keeping only the remaining lines for parse_output.
+    """
+    summary = []
+    intervals = []
+    for line in stream:
+        interval = parse_interval(line)
+        if interval is None:
+            summary.append(line)
+        elif intervals and intervals[-1]["time"] == interval["time"]:
+            # with a rate set, the queue statistics are a separate line
+            # sharing the timestamp of the main report
+            intervals[-1].update(interval)
+        else:
+            intervals.append(interval)
+    return "".join(summary).strip(), intervals
+
+
+def new_statistics():
+    return {
+        "output": {},
+        "results": {},
+        "histogram_values": array.array("d"),
+        "histogram_counts": array.array("Q"),
+    }
+
+
+def finish_statistics(statistics):
+    results = statistics["results"]
+    if statistics["histogram_values"]:
+        results["Latencyhistogram"] = {
+            "values": statistics["histogram_values"].tolist(),
+            "counts": statistics["histogram_counts"].tolist(),
+        }
+    return statistics["output"], results
+
 
 def parse_output(output):
-    output = output.replace(" ", "")
+    """
+    Parse the statistics printed by sysbench in a single pass, dispatching
+    every line through the field tables above. Lines that no table knows,
+    like warnings, are skipped. The full statistics dumped at every report
+    checkpoint are returned as the checkpoints of the final results.
+    """
+    final = statistics = new_statistics()
+    checkpoints = []
+    checkpoint = None
     section = None
-    sysbench_output = {}
-    sysbench_results = {}
     for line in output.splitlines():
-        if ":" in line:
-            key, value = line.split(":")
-
-            if key[0].isdigit():
-                percentile_value = value
-                value = re.match(r"([0-9]+)", key).group(0)
-                key = "percentile"
-
-            if value == "":
-                key = re.sub(r"\((.*?)\)", "", key)
-                if "options" in key or "General" in key:
-                    dictionary = sysbench_output
-                else:
-                    dictionary = sysbench_results
-                    section = key
-                    dictionary[section] = {}
-                continue
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == "[":
+            # intermediate reports are collected by read_output
+            match = CHECKPOINT_LINE.match(line)
+            if match is not None:
+                checkpoint = float(match.group(1))
+                statistics = new_statistics()
+                section = None
+            continue
+        if "|" in line:
+            row = HISTOGRAM_ROW.match(line)
+            if row is not None:
+                statistics["histogram_values"].append(float(row.group(1)))
+                statistics["histogram_counts"].append(int(row.group(2)))
+            continue
 
-            if dictionary == sysbench_output:
-                if "/" in key:
-                    key = key.replace("/", "")
-                if "totaltime" in key:
-                    value = value.replace("s", "")
-                    dictionary[key] = float(value)
-                elif "Totaloperations" in key:
-                    to, tops = value.split("(")
-                    tops = tops.replace("persecond)", "")
-                    dictionary["Totaloperations"] = int(to)
-                    dictionary["Totaloperationspersecond"] = float(tops)
-                else:
-                    try:
-                        dictionary[key] = int(value)
-                    except ValueError:
-                        try:
-                            dictionary[key] = float(value)
-                        except ValueError:
-                            dictionary[key] = value
+        key, colon, value = line.partition(":")
+        if not colon:
+            match = TRANSFERRED.match(line)
+            if match is not None:
+                statistics["results"]["transferred_MiB"] = float(match.group(1))
+                statistics["results"]["transferred_MiBpersec"] = float(match.group(2))
+            continue
+        key = key.replace(" ", "")
+        value = value.strip()
 
+        if not value:
+            name = RESULT_SECTIONS.get(UNITS.sub("", key))
+            # option and general statistics headers belong to the output
+            section = None if name is None else {}
+            if section is not None:
+                statistics["results"][name] = section
+            continue
+
+        if section is None:
+            field = OUTPUT_FIELDS.get(key)
+            if field is None:
+                continue
+            name, convert = field
+            if name is None:
+                statistics["output"].update(convert(value))
             else:
-                if "latency" in key:
-                    section = "Latency"
-                if "(avg/stddev)" in key:
-                    key = key.replace("(avg/stddev)", "")
-                    avg, stddev = value.split("/")
-                    dictionary[section][key] = {}
-                    dictionary[section][key]["avg"] = float(avg)
-                    dictionary[section][key]["stddev"] = float(stddev)
-                elif "percentile" in key:
-                    dictionary[section][key] = int(value)
-                    dictionary[section]["percentile_value"] = float(percentile_value)
-                else:
-                    # replace / and , with _ for fileio test
-                    key = re.sub(r"[\/,]", "_", key)
-                    try:
-                        dictionary[section][key] = int(value)
-                    except ValueError:
-                        try:
-                            dictionary[section][key] = float(value)
-                        except ValueError:
-                            dictionary[section][key] = value
-
-        if "transferred" in line:
-            mem_t, mem_tps = line.split("transferred")
-            mem_tps = re.sub("[()]", "", mem_tps)
-            mem_t = float(mem_t.replace("MiB", ""))
-            mem_tps = float(mem_tps.replace("MiB/sec", ""))
-
-            sysbench_results["transferred_MiB"] = mem_t
-            sysbench_results["transferred_MiBpersec"] = mem_tps
-    print("sysbench output : ", sysbench_output)
-    print("sysbench results:", sysbench_results)
+                statistics["output"][name] = convert(value)
+            continue
+
+        field = RESULT_FIELDS.get(key)
+        if field is not None:
+            name, convert = field
+            section[name] = convert(value)
+            if name == "executiontime" and checkpoint is not None:
+                # every statistics dump ends with the threads fairness section
+                checkpoint_output, results = finish_statistics(statistics)
+                results["checkpoint"] = checkpoint
+                results["totaltime"] = checkpoint_output["totaltime"]
+                results["totalnumberofevents"] = checkpoint_output[
+                    "totalnumberofevents"
+                ]
+                checkpoints.append(results)
+                statistics = final
+                checkpoint = None
+                section = None
+        elif key[0].isdigit():
+            match = PERCENTILE_KEY.match(key)
+            if match is not None:
+                section["percentile"] = int(match.group(1))
+                section["percentile_value"] = float(value)
+        elif key in IOPS_FIELDS:
+            match = IOPS.match(value)
+            if match is not None:
+                operations, throughput = IOPS_FIELDS[key]
+                results = statistics["results"]
+                results.setdefault("Fileoperations", {})[operations] = float(
+                    match.group(1)
+                )
+                if throughput is not None and match.group(2) is not None:
+                    section[throughput] = float(match.group(2))
+
+    sysbench_output, sysbench_results = finish_statistics(final)
+    if checkpoints:
+        sysbench_results["Checkpoints"] = checkpoints
+    return sysbench_output, sysbench_results
+
+
+def parse_custom_metrics(output):
+    """
+    Collect the numeric "key: value" lines which are not standard statistics,
+    as printed by Lua scripts. Keys printed several times, like once per
+    thread, add up.
+    """
+    metrics = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if not line or line[0] == "[":
+            continue
+        key, colon, value = line.partition(":")
+        match = CUSTOM_VALUE.match(value.strip())
+        if not colon or match is None:
+            continue
+        field = key.replace(" ", "")
+        if field in OUTPUT_FIELDS or field in RESULT_FIELDS:
+            continue
+        if PERCENTILE_KEY.match(field) is not None:
+            continue
+        key = key.strip()
+        metrics[key] = metrics.get(key, 0.0) + float(match.group(1))
+        if match.group(2) is not None:
+            rate = f"{key} per second"
+            metrics[rate] = metrics.get(rate, 0.0) + float(match.group(2))
+    return metrics
+
+
+def parse_lua_output(output):
+    sysbench_output, sysbench_results = parse_output(output)
+    metrics = parse_custom_metrics(output)
+    if metrics:
+        sysbench_results["custommetrics"] = metrics
     return sysbench_output, sysbench_results
 
 
-def run_sysbench(flags, operation, test_mode="run"):
+def histogram_percentiles(histogram, percentiles):
+    """
+    Derive any number of latency percentiles with a single cumulative pass
+    over the histogram buckets, choosing buckets the same way sysbench does
+    for its own percentile.
+    """
+    values = histogram["values"]
+    counts = histogram["counts"]
+    if not values:
+        return []
+    total = sum(counts)
+    derived = [None] * len(percentiles)
+    bucket = 0
+    cumulative = counts[0]
+    for index in sorted(range(len(percentiles)), key=percentiles.__getitem__):
+        target = max(1, math.ceil(total * percentiles[index] / 100))
+        while cumulative < target and bucket < len(values) - 1:
+            bucket += 1
+            cumulative += counts[bucket]
+        derived[index] = {"percentile": percentiles[index], "value": values[bucket]}
+    return derived
+
+
+def add_percentiles(results, percentiles):
+    if not percentiles:
+        return
+    for statistics in [results] + results.get("Checkpoints", []):
+        if "Latencyhistogram" in statistics:
+            statistics["Latency"]["percentiles"] = histogram_percentiles(
+                statistics["Latencyhistogram"], percentiles
+            )
+
+
+def get_sysbench_flags(input_schema, params):
+    serialized_params = input_schema.serialize(params)
+    if params.percentiles:
+        # the percentiles are derived from the latency histogram
+        serialized_params["histogram"] = OnOff.ON.value
+
+    flags = []
+    for param, value in serialized_params.items():
+        if param in PLUGIN_PARAMETERS:
+            continue
+        if isinstance(value, list):
+            value = ",".join(str(item) for item in value)
+        flags.append(f"--{param}={value}")
+    return flags
+
+
+def parse_cpu_list(cpu_list):
+    """
+    Parse a kernel style CPU list such as "0-3,8" into a set of CPU numbers.
+    """
+    cpus = set()
+    for item in cpu_list.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        first, _, last = item.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def format_cpu_list(cpus):
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(
+        str(first) if first == last else f"{first}-{last}" for first, last in ranges
+    )
+
+
+def get_cpu_affinity(params):
+    """
+    Return the set of CPUs requested with cpu-list and numa-node, or None when
+    sysbench is not pinned.
+    """
+    if params.cpu_list is None and params.numa_node is None:
+        return None
+    cpus = os.sched_getaffinity(0)
     try:
-        cmd = ["sysbench"]
-        cmd = cmd + flags + [operation, test_mode]
-        print("Sysbench command is: " + " ".join(cmd))
-        process_out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as error:
+        if params.cpu_list is not None:
+            cpus = cpus & parse_cpu_list(params.cpu_list)
+        if params.numa_node is not None:
+            node_path = f"/sys/devices/system/node/node{params.numa_node}/cpulist"
+            with open(node_path, "r") as node_file:
+                cpus = cpus & parse_cpu_list(node_file.read())
+    except (OSError, ValueError) as error:
+        raise Exception(1, f"Invalid CPU affinity: {error}") from error
+    if not cpus:
         raise Exception(
-            error.returncode,
-            "{} failed with return code {}:\n{}".format(
-                error.cmd[0], error.returncode, error.output
-            ),
-        ) from error
+            1, "The requested cpu-list and numa-node leave no CPU available"
+        )
+    return cpus
+
+
+# Signals the watchdog sends in turn until sysbench stops
+WATCHDOG_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGKILL)
+
+
+class WatchdogTimeout(Exception):
+    """
+    Raised when the watchdog had to stop sysbench, carrying the output
+    sysbench streamed until then.
+    """
+
+    def __init__(self, code, message, output, intervals, signal_name, elapsed):
+        super().__init__(code, message)
+        self.output = output
+        self.intervals = intervals
+        self.signal_name = signal_name
+        self.elapsed = elapsed
+
+
+def start_watchdog(process, timeout, grace):
+    """
+    Send SIGINT to the process once the timeout expires, escalating to
+    SIGTERM and SIGKILL after every grace period it keeps running. Returns
+    the event stopping the watchdog and the list of signals it sent.
+    """
+    finished = threading.Event()
+    sent = []
+
+    def watch():
+        delay = timeout
+        for signum in WATCHDOG_SIGNALS:
+            if finished.wait(delay):
+                return
+            sent.append(signum)
+            try:
+                process.send_signal(signum)
+            except ProcessLookupError:
+                return
+            delay = grace
+
+    threading.Thread(target=watch, daemon=True).start()
+    return finished, sent
+
+
+def sysbench_command(flags, operation, test_mode, cpus=None):
+    """
+    Command line running sysbench, pinned to the CPUs with taskset rather
+    than in a preexec_fn, as running Python code between fork and exec can
+    deadlock while other threads run.
+    """
+    cmd = ["sysbench"] + flags + [operation, test_mode]
+    if cpus is not None:
+        cmd = ["taskset", "-c", format_cpu_list(cpus)] + cmd
+    return cmd
+
+
+def run_sysbench(
+    flags,
+    operation,
+    test_mode="run",
+    cpus=None,
+    cwd=None,
+    timeout=None,
+    grace=10,
+    parse=parse_output,
+):
+    cmd = sysbench_command(flags, operation, test_mode, cpus)
+    print("Sysbench command is: " + " ".join(cmd))
+    started = time.monotonic()
+    # taskset fails rather than run sysbench on other CPUs than requested
+    affinity = os.sched_getaffinity(0) if cpus is None else cpus
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        cwd=cwd,
+    ) as process:
+        if timeout is not None:
+            finished, sent = start_watchdog(process, timeout, grace)
+        sampler = sysbench_accounting.ProcessSampler(process.pid)
+        sampler.start()
+        stdoutput, intervals = read_output(process.stdout)
+        sampler.stop()
+        returncode, rusage = sysbench_accounting.wait_with_rusage(process)
+        if timeout is not None:
+            finished.set()
+    if timeout is not None and sent:
+        raise WatchdogTimeout(
+            returncode,
+            f"sysbench {operation} did not finish within {timeout} seconds"
+            f" and was stopped with {sent[-1].name}",
+            stdoutput,
+            intervals,
+            sent[-1].name,
+            time.monotonic() - started,
+        )
+    if returncode != 0:
+        raise Exception(
+            returncode,
+            "sysbench failed with return code {}:\n{}".format(returncode, stdoutput),
+        )
     # io tests are made of 3 phases prepare, run, and cleanup
     # the prepare and cleanup doesn't have a meaningful output so parsing is skipped
-    stdoutput = process_out.strip().decode("utf-8")
     if test_mode == "run":
         try:
-            output, results = parse_output(stdoutput)
+            output, results = parse(stdoutput)
         except (KeyError, ValueError) as error:
             raise Exception(
                 1, "Failure in parsing sysbench output:\n{}".format(stdoutput)
             ) from error
+        output["cpuaffinity"] = format_cpu_list(affinity)
+        accounting = sysbench_accounting.counters(rusage, sampler.values)
+        if accounting:
+            # Lua scripts replacing the report hooks print no general statistics
+            output["processaccounting"] = sysbench_accounting.efficiency(
+                accounting,
+                output.get("totaltime"),
+                output.get("totalnumberofevents"),
+            )
 
-        return output, results
+        return output, results, intervals
 
 
 def get_sysbench_version():
+    return sysbench_capabilities.probe()["version"]
+
+
+def check_capabilities(params):
+    """
+    Fail before running anything when the installed sysbench does not support
+    the test or one of the options of the workload.
+    """
+    test, input_schema = WORKLOAD_TESTS[type(params)]
+    sysbench_capabilities.check_flags(
+        sysbench_capabilities.probe(test=test),
+        test,
+        get_sysbench_flags(input_schema, params),
+    )
+
+
+def unserialize_telemetry(telemetry):
+    results = telemetry.results()
+    return None if results is None else sysbench_telemetry_schema.unserialize(results)
+
+
+def partial_results(timeout):
+    """
+    Summarize the intermediate reports and completed report checkpoints
+    sysbench streamed before the watchdog stopped it.
+    """
+    metrics = {}
+    for interval in timeout.intervals:
+        for metric, value in interval.items():
+            if metric not in ("time", "threads", "percentile"):
+                metrics.setdefault(metric, []).append(value)
+    partial = {
+        "status": "timeout",
+        "error": timeout.args[1],
+        "signal": timeout.signal_name,
+        "elapsed": timeout.elapsed,
+    }
+    if timeout.intervals:
+        partial["sysbench_intervals"] = timeout.intervals
+        partial["sysbench_interval_statistics"] = [
+            dict(sysbench_statistics.summarize(samples), metric=metric)
+            for metric, samples in metrics.items()
+        ]
     try:
-        cmd = ["sysbench", "--version"]
-        version = (
-            subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            .strip()
-            .decode("utf-8")
+        _, results = parse_output(timeout.output)
+    except (KeyError, ValueError):
+        results = {}
+    if results.get("Checkpoints"):
+        partial["sysbench_checkpoints"] = [
+            {
+                "checkpoint": checkpoint["checkpoint"],
+                "totaltime": checkpoint["totaltime"],
+                "totalnumberofevents": checkpoint["totalnumberofevents"],
+            }
+            for checkpoint in results["Checkpoints"]
+        ]
+    return sysbench_partial_results_schema.unserialize(partial)
+
+
+def unserialize_intervals(intervals):
+    return [sysbench_interval_schema.unserialize(i) for i in intervals] or None
+
+
+def run_sysbench_workload(params, version, ready=None):
+    """
+    Run a workload made of a single sysbench run, such as cpu, memory,
+    threads or mutex, as set by the type of its parameters.
+    """
+    test, input_schema = WORKLOAD_TESTS[type(params)]
+    workload_results = WORKLOAD_RESULTS[type(params)]
+    output_schema, results_schema, _ = INSTANCE_SCHEMAS[workload_results]
+    run_params = steady_state_checkpoints(params)
+    flags = get_sysbench_flags(input_schema, run_params)
+    cpus = get_cpu_affinity(params)
+    if ready is not None:
+        ready()
+    with sysbench_telemetry.TelemetrySampler(params.telemetry_interval) as telemetry:
+        output, results, intervals = run_sysbench(
+            flags,
+            test,
+            cpus=cpus,
+            timeout=params.watchdog_timeout,
+            grace=params.watchdog_grace,
         )
-    except subprocess.CalledProcessError as error:
+    apply_steady_state(params, output, results, intervals)
+    add_percentiles(results, params.percentiles)
+
+    for name in OUTPUT_PARAMETERS.get(type(params), ()):
+        output[name] = getattr(params, name)
+    output["sysbenchversion"] = version
+
+    return workload_results(
+        output_schema.unserialize(output),
+        results_schema.unserialize(results),
+        unserialize_intervals(intervals),
+        sysbench_telemetry=unserialize_telemetry(telemetry),
+    )
+
+
+def script_option_value(name, value):
+    if isinstance(value, bool):
+        return OnOff.ON.value if value else OnOff.OFF.value
+    if isinstance(value, (int, float, str)):
+        return str(value)
+    raise Exception(1, f"Unsupported value of the script option {name}: {value!r}")
+
+
+def script_option_flags(params):
+    """
+    Turn the options of a Lua script into sysbench flags.
+    """
+    flags = []
+    for name, value in (params.script_options or {}).items():
+        if SCRIPT_OPTION.match(name) is None:
+            raise Exception(1, f"Invalid script option name {name!r}")
+        if name in sysbench_lua_input_schema.properties:
+            raise Exception(
+                1, f"{name} is a step parameter rather than a script option"
+            )
+        if isinstance(value, list):
+            value = ",".join(script_option_value(name, item) for item in value)
+        else:
+            value = script_option_value(name, value)
+        flags.append(f"--{name}={value}")
+    return flags
+
+
+def lua_script(params, directory):
+    """
+    Path of the script of a Lua workload, writing an inline script into the
+    directory.
+    """
+    if (params.script is None) == (params.script_file is None):
+        raise Exception(1, "Exactly one of script and script-file must be set")
+    if params.script_file is not None:
+        return params.script_file
+    path = os.path.join(directory, "script.lua")
+    with open(path, "w") as script:
+        script.write(params.script)
+    return path
+
+
+def run_lua_workload(params, version, ready=None):
+    """
+    Run a custom Lua workload. With prepare set, the prepare command of the
+    script runs before and its cleanup command after the run.
+    """
+    run_params = steady_state_checkpoints(params)
+    lua_flags = get_sysbench_flags(
+        sysbench_lua_input_schema, run_params
+    ) + script_option_flags(params)
+    cpus = get_cpu_affinity(params)
+    with tempfile.TemporaryDirectory() as directory:
+        script = lua_script(params, directory)
+        if params.prepare:
+            run_sysbench(
+                lua_flags,
+                script,
+                "prepare",
+                cpus=cpus,
+                timeout=params.watchdog_timeout,
+                grace=params.watchdog_grace,
+            )
+        if ready is not None:
+            ready()
+        try:
+            with sysbench_telemetry.TelemetrySampler(
+                params.telemetry_interval
+            ) as telemetry:
+                output, results, intervals = run_sysbench(
+                    lua_flags,
+                    script,
+                    cpus=cpus,
+                    timeout=params.watchdog_timeout,
+                    grace=params.watchdog_grace,
+                    parse=parse_lua_output,
+                )
+        finally:
+            if params.prepare:
+                run_sysbench(
+                    lua_flags,
+                    script,
+                    "cleanup",
+                    cpus=cpus,
+                    timeout=params.watchdog_timeout,
+                    grace=params.watchdog_grace,
+                )
+    # the custom metrics cover the whole run, not the steady state
+    custom_metrics = results.pop("custommetrics", None)
+    apply_steady_state(params, output, results, intervals)
+    add_percentiles(results, params.percentiles)
+    if custom_metrics is not None:
+        results["custommetrics"] = custom_metrics
+
+    output["script"] = params.script_file
+    output["sysbenchversion"] = version
+
+    return WorkloadResultsLua(
+        sysbench_lua_output_schema.unserialize(output),
+        sysbench_lua_results_schema.unserialize(results),
+        unserialize_intervals(intervals),
+        sysbench_telemetry=unserialize_telemetry(telemetry),
+    )
+
+
+def prepare_io_files(params, io_flags, cpus):
+    """
+    Prepare the test files of the I/O workload, unless its file cleanup
+    policy allows reusing a verified file set prepared by an earlier run.
+    Returns whether the files were reused.
+    """
+    directory = params.file_directory
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    fileset_directory = directory if directory is not None else os.getcwd()
+    cached = params.file_cleanup in (FileCleanup.KEEP, FileCleanup.EVICT)
+    key = sysbench_fileset.fileset_key(params, fileset_directory)
+    if cached and sysbench_fileset.is_prepared(fileset_directory, key):
+        print("==>> Reusing the prepared test files ...")
+        return True
+    # files of a stale or different file set must not linger
+    sysbench_fileset.evict(fileset_directory)
+    run_sysbench(
+        io_flags,
+        "fileio",
+        "prepare",
+        cpus=cpus,
+        cwd=directory,
+        timeout=params.watchdog_timeout,
+        grace=params.watchdog_grace,
+    )
+    if cached:
+        sysbench_fileset.write_manifest(fileset_directory, key)
+    return False
+
+
+def finish_io_files(params, io_flags, cpus):
+    """
+    Keep or remove the test files after the run, following the file cleanup
+    policy of the I/O workload.
+    """
+    directory = params.file_directory
+    fileset_directory = directory if directory is not None else os.getcwd()
+    if params.file_cleanup == FileCleanup.KEEP:
+        # writing modes change the files, so record them as they are now
+        sysbench_fileset.write_manifest(
+            fileset_directory, sysbench_fileset.fileset_key(params, fileset_directory)
+        )
+    else:
+        run_sysbench(
+            io_flags,
+            "fileio",
+            "cleanup",
+            cpus=cpus,
+            cwd=directory,
+            timeout=params.watchdog_timeout,
+            grace=params.watchdog_grace,
+        )
+        sysbench_fileset.evict(fileset_directory)
+
+
+def run_io_workload(params, version, ready=None, prepared=False):
+    """
+    Run the I/O workload. Unless the test files were already prepared by the
+    caller, they are prepared before and cleaned up after the run.
+    """
+    run_params = steady_state_checkpoints(params)
+    io_flags = get_sysbench_flags(sysbench_io_input_schema, run_params)
+    cpus = get_cpu_affinity(params)
+    reused = prepared or prepare_io_files(params, io_flags, cpus)
+    if ready is not None:
+        ready()
+    try:
+        with sysbench_telemetry.TelemetrySampler(
+            params.telemetry_interval
+        ) as telemetry:
+            output, results, intervals = run_sysbench(
+                io_flags,
+                "fileio",
+                "run",
+                cpus=cpus,
+                cwd=params.file_directory,
+                timeout=params.watchdog_timeout,
+                grace=params.watchdog_grace,
+            )
+    finally:
+        if not prepared:
+            finish_io_files(params, io_flags, cpus)
+    apply_steady_state(params, output, results, intervals)
+    add_percentiles(results, params.percentiles)
+
+    output["sysbenchversion"] = version
+    output["Preparedfilesreused"] = reused
+
+    return WorkloadResultsIo(
+        sysbench_io_output_schema.unserialize(output),
+        sysbench_io_results_schema.unserialize(results),
+        unserialize_intervals(intervals),
+        sysbench_telemetry=unserialize_telemetry(telemetry),
+    )
+
+
+# Output parameters which add up over concurrent instances
+SUMMED_OUTPUT = (
+    "totalnumberofevents",
+    "Numberofthreads",
+    "Totaloperations",
+    "Totaloperationspersecond",
+)
+# Results which add up over concurrent instances
+SUMMED_RESULTS = (
+    "CPUspeed",
+    "Fileoperations",
+    "Throughput",
+    "transferred_MiB",
+    "transferred_MiBpersec",
+    "custommetrics",
+)
+
+
+def merge_histograms(histograms):
+    counts = {}
+    for histogram in histograms:
+        for value, count in zip(histogram["values"], histogram["counts"]):
+            counts[value] = counts.get(value, 0) + count
+    values = sorted(counts)
+    return {"values": values, "counts": [counts[value] for value in values]}
+
+
+def merge_latency(latencies, events, histogram):
+    """
+    Merge the latency of concurrent instances, using the exact percentiles of
+    the merged histogram when available and the worst case otherwise.
+    """
+    latency = {
+        "min": min(latency["min"] for latency in latencies),
+        "max": max(latency["max"] for latency in latencies),
+        "sum": sum(latency["sum"] for latency in latencies),
+        "percentile": latencies[0]["percentile"],
+        "percentile_value": max(latency["percentile_value"] for latency in latencies),
+    }
+    latency["avg"] = latency["sum"] / sum(events) if sum(events) else 0.0
+    if histogram is not None:
+        latency["percentile_value"] = histogram_percentiles(
+            histogram, [latency["percentile"]]
+        )[0]["value"]
+    if "percentiles" in latencies[0]:
+        percentiles = [item["percentile"] for item in latencies[0]["percentiles"]]
+        if histogram is not None:
+            latency["percentiles"] = histogram_percentiles(histogram, percentiles)
+        else:
+            latency["percentiles"] = [
+                {
+                    "percentile": percentile,
+                    "value": max(
+                        item["percentiles"][index]["value"] for item in latencies
+                    ),
+                }
+                for index, percentile in enumerate(percentiles)
+            ]
+    return latency
+
+
+def pool_fairness(aggregates, threads):
+    """
+    Pool the per-thread mean and standard deviation of several instances
+    into the mean and standard deviation over all their threads.
+    """
+    total = sum(threads)
+    mean = sum(item["avg"] * count for item, count in zip(aggregates, threads)) / total
+    variance = (
+        sum(
+            count * (item["stddev"] ** 2 + item["avg"] ** 2)
+            for item, count in zip(aggregates, threads)
+        )
+        / total
+        - mean**2
+    )
+    return {"avg": mean, "stddev": math.sqrt(max(0.0, variance))}
+
+
+def merge_instances(instance_results):
+    """
+    Merge the results of concurrent instances: throughput adds up, latency is
+    combined into the worst case and thread fairness is pooled over all the
+    threads of all instances.
+    """
+    workload_type = type(instance_results[0])
+    output_schema, results_schema, instance_type = INSTANCE_SCHEMAS[workload_type]
+    outputs = [
+        output_schema.serialize(item.sysbench_output_params)
+        for item in instance_results
+    ]
+    results = [
+        results_schema.serialize(item.sysbench_results) for item in instance_results
+    ]
+
+    output = dict(outputs[0])
+    output["totaltime"] = max(item["totaltime"] for item in outputs)
+    for key in SUMMED_OUTPUT:
+        if key in output:
+            output[key] = sum(item[key] for item in outputs)
+    output["cpuaffinity"] = format_cpu_list(
+        set().union(*(parse_cpu_list(item.get("cpuaffinity", "")) for item in outputs))
+    )
+    if all("processaccounting" in item for item in outputs):
+        output["processaccounting"] = sysbench_accounting.merge(
+            [item["processaccounting"] for item in outputs],
+            output["totaltime"],
+            output["totalnumberofevents"],
+        )
+
+    merged = {}
+    for key, value in results[0].items():
+        if key not in SUMMED_RESULTS:
+            continue
+        if isinstance(value, dict):
+            merged[key] = {
+                metric: sum(item[key][metric] for item in results) for metric in value
+            }
+        else:
+            merged[key] = sum(item[key] for item in results)
+    histogram = None
+    if all("Latencyhistogram" in item for item in results):
+        histogram = merge_histograms(item["Latencyhistogram"] for item in results)
+        merged["Latencyhistogram"] = histogram
+    merged["Latency"] = merge_latency(
+        [item["Latency"] for item in results],
+        [item["totalnumberofevents"] for item in outputs],
+        histogram,
+    )
+    threads = [item["Numberofthreads"] for item in outputs]
+    merged["Threadsfairness"] = {
+        section: pool_fairness(
+            [item["Threadsfairness"][section] for item in results], threads
+        )
+        for section in ("events", "executiontime")
+    }
+
+    return workload_type(
+        output_schema.unserialize(output),
+        results_schema.unserialize(merged),
+        sysbench_instances=[
+            instance_type(
+                index,
+                item.sysbench_output_params,
+                item.sysbench_results,
+                item.sysbench_intervals,
+            )
+            for index, item in enumerate(instance_results)
+        ],
+        # every instance sampled the same host over the same run
+        sysbench_telemetry=instance_results[0].sysbench_telemetry,
+    )
+
+
+# Result sections of rates, averaged over segments weighted by their time
+RATE_SECTIONS = ("CPUspeed", "Fileoperations", "Throughput")
+# Intermediate report rates added up into the series steady-state detection
+# looks at, as the memory and fileio reports carry no events per second
+STEADY_STATE_RATES = {
+    SysbenchMemoryInputParams: ("transferred_MiBpersec",),
+    SysbenchIoInputParams: ("read_MiB_s", "written_MiB_s"),
+}
+DEFAULT_STEADY_STATE_RATES = ("eventspersecond",)
+
+
+def steady_state_rate(params, interval):
+    """
+    Rate of an intermediate report that steady-state detection looks at, or
+    None when the report does not carry it.
+    """
+    rates = STEADY_STATE_RATES.get(type(params), DEFAULT_STEADY_STATE_RATES)
+    if not all(rate in interval for rate in rates):
+        return None
+    return sum(interval[rate] for rate in rates)
+
+
+def steady_state_checkpoints(params):
+    """
+    With steady-state detection, add a report checkpoint at every intermediate
+    report, so that the statistics can be split at the start of any report.
+    """
+    if params.steady_state_window is None:
+        return params
+    if not params.report_interval or not params.time:
+        raise Exception(1, "steady-state-window needs report-interval and time")
+    if params.report_checkpoints:
         raise Exception(
-            error.returncode,
-            "{} failed with return code {}:\n{}".format(
-                error.cmd[0], error.returncode, error.output
+            1, "steady-state-window cannot be combined with report-checkpoints"
+        )
+    if params.time < params.report_interval * params.steady_state_window:
+        raise Exception(
+            1, "time must cover at least steady-state-window report intervals"
+        )
+    return dataclasses.replace(
+        params,
+        report_checkpoints=list(
+            range(params.report_interval, params.time, params.report_interval)
+        ),
+    )
+
+
+def result_segments(output, results):
+    """
+    Split the results of a run with report checkpoints into the statistics of
+    every segment between consecutive checkpoints, along with its start time.
+    """
+    segments = []
+    start = 0.0
+    for checkpoint in results.get("Checkpoints", []):
+        segment = dict(checkpoint, start=start)
+        start = segment.pop("checkpoint")
+        segments.append(segment)
+    segment = {key: value for key, value in results.items() if key != "Checkpoints"}
+    segment["start"] = start
+    segment["totaltime"] = output["totaltime"]
+    segment["totalnumberofevents"] = output["totalnumberofevents"]
+    segments.append(segment)
+    return segments
+
+
+def merge_segments(segments):
+    """
+    Merge the statistics of consecutive segments of a run: rates are averaged
+    over the time, latency is merged like for concurrent instances and the
+    per-thread events and execution times add up.
+    """
+    totaltime = sum(segment["totaltime"] for segment in segments)
+    events = [segment["totalnumberofevents"] for segment in segments]
+    merged = {}
+    for section in RATE_SECTIONS:
+        if section in segments[0]:
+            merged[section] = {
+                metric: sum(
+                    segment[section][metric] * segment["totaltime"]
+                    for segment in segments
+                )
+                / totaltime
+                for metric in segments[0][section]
+            }
+    if "transferred_MiB" in segments[0]:
+        merged["transferred_MiB"] = sum(
+            segment["transferred_MiB"] for segment in segments
+        )
+        merged["transferred_MiBpersec"] = merged["transferred_MiB"] / totaltime
+    histogram = None
+    if all("Latencyhistogram" in segment for segment in segments):
+        histogram = merge_histograms(
+            segment["Latencyhistogram"] for segment in segments
+        )
+        merged["Latencyhistogram"] = histogram
+    merged["Latency"] = merge_latency(
+        [segment["Latency"] for segment in segments], events, histogram
+    )
+    # the same threads run every segment, assuming independent segments
+    merged["Threadsfairness"] = {
+        section: {
+            "avg": sum(
+                segment["Threadsfairness"][section]["avg"] for segment in segments
+            ),
+            "stddev": math.sqrt(
+                sum(
+                    segment["Threadsfairness"][section]["stddev"] ** 2
+                    for segment in segments
+                )
+            ),
+        }
+        for section in ("events", "executiontime")
+    }
+    return totaltime, sum(events), merged
+
+
+def apply_steady_state(params, output, results, intervals):
+    """
+    Replace the statistics of a run with steady-state detection by those of
+    the segments from the start of the first stable window of intermediate
+    reports on, or of the whole run when it never became stable.
+    """
+    if params.steady_state_window is None:
+        return
+    reports = [
+        interval
+        for interval in intervals
+        if steady_state_rate(params, interval) is not None
+    ]
+    index = sysbench_statistics.steady_state_start(
+        [steady_state_rate(params, interval) for interval in reports],
+        params.steady_state_window,
+        params.steady_state_cv,
+        params.steady_state_slope,
+    )
+    segments = result_segments(output, results)
+    start = None
+    measured = segments
+    if index is not None:
+        start = reports[index - 1]["time"] if index > 0 else 0.0
+        # report times are rounded, the checkpoints are at whole seconds
+        tolerance = params.report_interval / 2
+        measured = [
+            segment for segment in segments if segment["start"] >= start - tolerance
+        ]
+    totaltime, events, merged = merge_segments(measured)
+    discarded = segments[: len(segments) - len(measured)]
+    results.clear()
+    results.update(merged)
+    output["totaltime"] = totaltime
+    output["totalnumberofevents"] = events
+    if "Totaloperations" in output:
+        # memory operations are the events of the memory test
+        output["Totaloperations"] = events
+        output["Totaloperationspersecond"] = events / totaltime
+    output["steadystate"] = {
+        "detected": index is not None,
+        "measuredtime": totaltime,
+        "discardedtime": sum(segment["totaltime"] for segment in discarded),
+        "discardedevents": sum(segment["totalnumberofevents"] for segment in discarded),
+    }
+    if start is not None:
+        output["steadystate"]["start"] = start
+
+
+def run_together(workloads, version):
+    """
+    Run workloads concurrently, releasing them into their measured run
+    together once all of them are prepared. Every workload is a tuple of its
+    run function, its parameters, the subdirectory of its own fileio test
+    files or None, and the seconds it waits once released. Returns the
+    results in the order of the workloads.
+    """
+    barrier = threading.Barrier(len(workloads))
+
+    def run(run_workload, params, subdirectory, delay):
+        directory = None
+        if subdirectory is not None and hasattr(params, "file_directory"):
+            directory = os.path.join(params.file_directory or os.getcwd(), subdirectory)
+            params = dataclasses.replace(params, file_directory=directory)
+
+        def ready():
+            barrier.wait()
+            if delay:
+                time.sleep(delay)
+
+        try:
+            return run_workload(params, version, ready)
+        except BaseException:
+            barrier.abort()
+            raise
+        finally:
+            if directory is not None:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass
+
+    with concurrent.futures.ThreadPoolExecutor(len(workloads)) as executor:
+        futures = [executor.submit(run, *workload) for workload in workloads]
+    errors = [future.exception() for future in futures if future.exception()]
+    if errors:
+        # report the failure that stopped the other workloads
+        raise next(
+            (
+                error
+                for error in errors
+                if not isinstance(error, threading.BrokenBarrierError)
             ),
+            errors[0],
+        )
+    return [future.result() for future in futures]
+
+
+def run_instances(run_workload, params, version):
+    """
+    Run the configured number of workload instances concurrently, releasing
+    them into their measured run together once all of them are prepared.
+    """
+    if not params.instances or params.instances < 2:
+        return run_workload(params, version)
+    cpu_lists = params.instance_cpu_lists or [params.cpu_list] * params.instances
+    if len(cpu_lists) != params.instances:
+        raise Exception(1, "instance-cpu-lists must have one entry per instance")
+
+    print(f"==>> Running {params.instances} instances ...")
+    # every fileio instance needs its own set of test files
+    return merge_instances(
+        run_together(
+            [
+                (
+                    run_workload,
+                    dataclasses.replace(
+                        params,
+                        instances=None,
+                        instance_cpu_lists=None,
+                        cpu_list=cpu_lists[instance],
+                    ),
+                    f"instance-{instance}",
+                    0,
+                )
+                for instance in range(params.instances)
+            ],
+            version,
+        )
+    )
+
+
+# The early stop of repetitions needs enough runs for a meaningful interval
+MIN_REPETITIONS = 3
+# Result sections which are not summarized over repetitions
+REPETITION_SKIPPED = ("Threadsfairness", "Checkpoints", "Latencyhistogram")
+
+
+def percentile_metric(percentile):
+    """
+    Name of a derived latency percentile in the repetition statistics, such
+    as Latency.p99 or Latency.p99.9.
+    """
+    return f"Latency.p{percentile:g}"
+
+
+def result_metric(workload_results, metric):
+    """
+    Value of a metric of a workload run, named as in the repetition
+    statistics, averaged over all repetitions when the workload was repeated.
+    """
+    if workload_results.sysbench_repetitions is not None:
+        for statistics in workload_results.sysbench_repetitions.metrics:
+            if statistics.metric == metric:
+                return statistics.mean
+    if metric == "eventspersecond":
+        output_params = workload_results.sysbench_output_params
+        if not output_params.totaltime or output_params.totalnumberofevents is None:
+            raise Exception(1, "The workload reported no total time and events")
+        return output_params.totalnumberofevents / output_params.totaltime
+    latency = workload_results.sysbench_results.Latency
+    for item in getattr(latency, "percentiles", None) or []:
+        if percentile_metric(item.percentile) == metric:
+            return item.value
+    value = workload_results.sysbench_results
+    for name in metric.split("."):
+        value = getattr(value, name)
+    return value
+
+
+def events_per_second(workload_results):
+    return result_metric(workload_results, "eventspersecond")
+
+
+def repetition_metrics(workload_results):
+    """
+    Flatten the numeric results of a run into a dictionary keyed by the path
+    of each field.
+    """
+    output_params = workload_results.sysbench_output_params
+    metrics = {}
+    # Lua scripts replacing the report hooks print no general statistics
+    if output_params.totaltime and output_params.totalnumberofevents is not None:
+        metrics["eventspersecond"] = (
+            output_params.totalnumberofevents / output_params.totaltime
+        )
+    sections = [("", dataclasses.asdict(workload_results.sysbench_results))]
+    while sections:
+        prefix, section = sections.pop(0)
+        for key, value in section.items():
+            if key in REPETITION_SKIPPED or key == "percentile":
+                continue
+            if isinstance(value, dict):
+                sections.append((f"{prefix}{key}.", value))
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[prefix + key] = value
+            elif prefix == "Latency." and key == "percentiles" and value:
+                for item in value:
+                    metrics[percentile_metric(item["percentile"])] = item["value"]
+    return metrics
+
+
+def run_repeated(run_workload, params, version):
+    """
+    Run the workload until the confidence interval of its events per second
+    is narrow enough, or the maximum number of repetitions is reached.
+    """
+    workload_results = run_instances(run_workload, params, version)
+    if not params.repetitions or params.repetitions < 2:
+        store_results(params, workload_results)
+        return workload_results
+
+    samples = [repetition_metrics(workload_results)]
+    converged = False
+    while len(samples) < params.repetitions:
+        print(f"==>> Running repetition {len(samples) + 1} ...")
+        workload_results = run_instances(run_workload, params, version)
+        samples.append(repetition_metrics(workload_results))
+        if (
+            params.repetitions_tolerance is not None
+            and len(samples) >= MIN_REPETITIONS
+            and "eventspersecond" in samples[0]
+        ):
+            half_width = sysbench_statistics.relative_half_width(
+                sysbench_statistics.summarize(
+                    [sample["eventspersecond"] for sample in samples]
+                )
+            )
+            if half_width is not None and half_width <= params.repetitions_tolerance:
+                converged = True
+                break
+
+    metrics = []
+    for metric in samples[0]:
+        summary = sysbench_statistics.summarize([sample[metric] for sample in samples])
+        summary["metric"] = metric
+        metrics.append(sysbench_metric_statistics_schema.unserialize(summary))
+    workload_results.sysbench_repetitions = RepetitionStatistics(
+        len(samples), converged, metrics
+    )
+    store_results(params, workload_results)
+    return workload_results
+
+
+def default_thread_counts():
+    """
+    Powers of two up to the number of CPUs, followed by the number of CPUs
+    itself when it is not a power of two.
+    """
+    cpu_count = os.cpu_count() or 1
+    thread_counts = []
+    threads = 1
+    while threads <= cpu_count:
+        thread_counts.append(threads)
+        threads *= 2
+    if thread_counts[-1] != cpu_count:
+        thread_counts.append(cpu_count)
+    return thread_counts
+
+
+def amdahl_serial_fraction(points):
+    """
+    Least-squares fit of the Amdahl serial fraction f to the measured
+    speedups, using 1/S - 1/N = f * (1 - 1/N).
+    """
+    numerator = 0.0
+    denominator = 0.0
+    for point in points:
+        x = 1 - 1 / point["threads"]
+        numerator += x * (1 / point["speedup"] - 1 / point["threads"])
+        denominator += x * x
+    if denominator == 0:
+        return None
+    return min(1.0, max(0.0, numerator / denominator))
+
+
+# Workloads of the thread scaling sweep
+SCALED_WORKLOADS = ("cpu", "memory", "threads", "mutex")
+
+
+def thread_scaling(run_workload, params, thread_counts, version):
+    """
+    Run the workload once per thread count, always starting with a single
+    thread as the speedup baseline.
+    """
+    points = []
+    for threads in sorted(set([1] + thread_counts)):
+        print(f"==>> Running with {threads} threads ...")
+        workload_results = run_repeated(
+            run_workload, dataclasses.replace(params, threads=threads), version
+        )
+        eventspersecond = events_per_second(workload_results)
+        speedup = eventspersecond / points[0]["eventspersecond"] if points else 1.0
+        point = {
+            "threads": threads,
+            "eventspersecond": eventspersecond,
+            "speedup": speedup,
+            "efficiency": speedup / threads,
+            "latency_avg": result_metric(workload_results, "Latency.avg"),
+            "latency_percentile_value": result_metric(
+                workload_results, "Latency.percentile_value"
+            ),
+        }
+        accounting = workload_results.sysbench_output_params.processaccounting
+        if accounting is not None:
+            point["context_switches_per_event"] = accounting.context_switches_per_event
+        points.append(point)
+    return {
+        "sysbenchversion": version,
+        "serial_fraction": amdahl_serial_fraction(points),
+        "points": points,
+    }
+
+
+# Run function of each workload, keyed by the name of its parameters in the
+# steps running one of several workloads
+WORKLOAD_RUNNERS = {
+    "cpu": run_sysbench_workload,
+    "memory": run_sysbench_workload,
+    "io": run_io_workload,
+    "threads": run_sysbench_workload,
+    "mutex": run_sysbench_workload,
+    "lua": run_lua_workload,
+}
+
+
+def selected_workload(params, names=tuple(WORKLOAD_RUNNERS)):
+    """
+    Return the run function and the parameters of the one workload of the
+    given names set in the parameters of a step.
+    """
+    workloads = [
+        (WORKLOAD_RUNNERS[name], getattr(params, name))
+        for name in names
+        if getattr(params, name) is not None
+    ]
+    if len(workloads) != 1:
+        raise Exception(
+            1,
+            "Exactly one of the {} or {} workload parameters must be set".format(
+                ", ".join(names[:-1]), names[-1]
+            ),
+        )
+    return workloads[0]
+
+
+def geometric_rates(maximum, points, min_fraction):
+    """
+    Target rates growing geometrically from min_fraction of the maximum up to
+    the maximum itself, leaving out rates which round to the previous one.
+    """
+    rates = []
+    for index in range(points):
+        rate = max(
+            1, round(maximum * min_fraction ** ((points - 1 - index) / (points - 1)))
+        )
+        if not rates or rate > rates[-1]:
+            rates.append(rate)
+    return rates
+
+
+def rate_sweep(run_workload, params, sweep_params, version):
+    """
+    Run the workload at every target rate, from the lowest to the highest,
+    after an unthrottled calibration run when no target rates are given.
+    """
+    if params.report_interval is None:
+        # sysbench only reports its event queue in the intermediate reports
+        params = dataclasses.replace(params, report_interval=1)
+    unthrottled = None
+    rates = sweep_params.rates
+    if not rates:
+        print("==>> Running the unthrottled calibration ...")
+        unthrottled = events_per_second(
+            run_repeated(run_workload, dataclasses.replace(params, rate=None), version)
+        )
+        rates = geometric_rates(
+            unthrottled, sweep_params.ramp_points, sweep_params.ramp_min_fraction
+        )
+    points = []
+    for rate in sorted(set(rates)):
+        print(f"==>> Running at {rate} events per second ...")
+        workload_results = run_repeated(
+            run_workload, dataclasses.replace(params, rate=rate), version
+        )
+        eventspersecond = events_per_second(workload_results)
+        point = {
+            "target_rate": rate,
+            "eventspersecond": eventspersecond,
+            "achieved_fraction": eventspersecond / rate,
+            "latency_avg": result_metric(workload_results, "Latency.avg"),
+            "latency_percentile_value": result_metric(
+                workload_results, "Latency.percentile_value"
+            ),
+        }
+        if unthrottled:
+            point["load"] = rate / unthrottled
+        percentiles = workload_results.sysbench_results.Latency.percentiles
+        if percentiles is not None:
+            point["latency_percentiles"] = [
+                {
+                    "percentile": item.percentile,
+                    "value": result_metric(
+                        workload_results, percentile_metric(item.percentile)
+                    ),
+                }
+                for item in percentiles
+            ]
+        intervals = workload_results.sysbench_intervals or []
+        queue_lengths = [
+            interval.queuelength
+            for interval in intervals
+            if interval.queuelength is not None
+        ]
+        if queue_lengths:
+            point["queuelength_avg"] = sum(queue_lengths) / len(queue_lengths)
+            point["queuelength_max"] = max(queue_lengths)
+        concurrency = [
+            interval.concurrency
+            for interval in intervals
+            if interval.concurrency is not None
+        ]
+        if concurrency:
+            point["concurrency_max"] = max(concurrency)
+        points.append(point)
+    sweep = {"sysbenchversion": version, "points": points}
+    if unthrottled is not None:
+        sweep["unthrottled_eventspersecond"] = unthrottled
+    return sweep
+
+
+def latency_percentile(workload_results, percentile):
+    """
+    Derived latency percentile of a workload run. For a repeated workload
+    it is the worst one over all repetitions, so that a single good run does
+    not decide whether the workload meets a latency SLO.
+    """
+    if workload_results.sysbench_repetitions is not None:
+        for statistics in workload_results.sysbench_repetitions.metrics:
+            if statistics.metric == percentile_metric(percentile):
+                return max(statistics.samples)
+    for item in workload_results.sysbench_results.Latency.percentiles or []:
+        if item.percentile == percentile:
+            return item.value
+    raise Exception(1, f"The workload reported no {percentile} latency percentile")
+
+
+def max_sustainable_rate(run_workload, params, search_params, version):
+    """
+    Binary search the highest rate at which the workload meets the latency
+    SLO with short probe runs, between a sustained and a failed rate, then
+    confirm it with a run of the full workload time.
+    """
+    params = dataclasses.replace(
+        params,
+        percentiles=sorted(
+            set((params.percentiles or []) + [search_params.slo_percentile])
+        ),
+    )
+    probe_params = dataclasses.replace(params, time=search_params.probe_time, events=0)
+
+    def probe(rate, run_params):
+        print(f"==>> Probing {rate} events per second ...")
+        workload_results = run_repeated(
+            run_workload, dataclasses.replace(run_params, rate=rate), version
+        )
+        eventspersecond = events_per_second(workload_results)
+        latency = latency_percentile(workload_results, search_params.slo_percentile)
+        result = {
+            "rate": rate,
+            "eventspersecond": eventspersecond,
+            "latency": latency,
+            "latency_met": latency <= search_params.slo_latency,
+            "rate_met": eventspersecond >= search_params.min_achieved_fraction * rate,
+        }
+        result["sustained"] = result["latency_met"] and result["rate_met"]
+        return result
+
+    unthrottled = None
+    high = search_params.max_rate
+    if high is None:
+        print("==>> Running the unthrottled probe ...")
+        unthrottled = events_per_second(
+            run_repeated(
+                run_workload, dataclasses.replace(probe_params, rate=None), version
+            )
+        )
+        high = max(1, math.ceil(unthrottled))
+    low = search_params.min_rate
+    if low > high:
+        raise Exception(1, f"min-rate is above the maximum rate of {high}")
+
+    probes = [probe(high, probe_params)]
+    sustainable = high if probes[-1]["sustained"] else None
+    if sustainable is None and low < high:
+        probes.append(probe(low, probe_params))
+        if probes[-1]["sustained"]:
+            while len(probes) < search_params.max_probes and high - low > max(
+                1, search_params.rate_tolerance * high
+            ):
+                rate = (low + high) // 2
+                probes.append(probe(rate, probe_params))
+                if probes[-1]["sustained"]:
+                    low = rate
+                else:
+                    high = rate
+            sustainable = low
+
+    search = {
+        "sysbenchversion": version,
+        "probes": probes,
+        "confirmed": False,
+    }
+    if sustainable is not None:
+        print("==>> Confirming the sustainable rate ...")
+        search["sustainable_rate"] = sustainable
+        search["confirmation"] = probe(sustainable, params)
+        search["confirmed"] = search["confirmation"]["sustained"]
+    if unthrottled is not None:
+        search["unthrottled_eventspersecond"] = unthrottled
+    return search
+
+
+# Workloads of the interference mode
+INTERFERENCE_WORKLOADS = ("cpu", "memory", "io")
+# Duration of a sysbench run without a time
+DEFAULT_TIME = 10
+
+
+def interference_workload(workload, antagonist=False):
+    """
+    Return the name, run function and parameters of an interference workload.
+    """
+    run_workload, params = selected_workload(workload, INTERFERENCE_WORKLOADS)
+    name = STORED_WORKLOADS[type(params)]
+    if params.instances is not None and params.instances > 1:
+        raise Exception(1, "The interference mode does not support several instances")
+    if antagonist and (params.repetitions or params.store_database):
+        raise Exception(
+            1,
+            "Antagonists run once alongside every run of the primary workload"
+            " and take no repetitions or store-database",
+        )
+    return workload.name or name, run_workload, params
+
+
+def interference_run(workload_results):
+    return {
+        "eventspersecond": events_per_second(workload_results),
+        "latency_avg": result_metric(workload_results, "Latency.avg"),
+        "latency_percentile": workload_results.sysbench_results.Latency.percentile,
+        "latency_percentile_value": result_metric(
+            workload_results, "Latency.percentile_value"
+        ),
+    }
+
+
+def run_with_antagonists(run_primary, primary_params, antagonists, lead, version):
+    """
+    Run the primary workload alongside the antagonists, which all start their
+    measured run together and keep running for lead seconds before and after
+    the primary workload.
+    """
+    if primary_params.time == 0:
+        raise Exception(1, "The primary workload must be limited by its time")
+    duration = (primary_params.time or DEFAULT_TIME) + 2 * lead
+    # the test files of the primary workload must not be touched
+    results = run_together(
+        [(run_primary, primary_params, None, lead)]
+        + [
+            (
+                run_workload,
+                dataclasses.replace(params, time=duration, events=0),
+                f"antagonist-{index}",
+                0,
+            )
+            for index, (_, run_workload, params) in enumerate(antagonists)
+        ],
+        version,
+    )
+    return results[0], results[1:]
+
+
+def relative_increase(value, baseline):
+    return value / baseline - 1 if baseline else 0.0
+
+
+def interference(params, version):
+    """
+    Run the primary workload alone, then alongside every antagonist and
+    optionally all of them at once, and compare its throughput and latency.
+    Every phase is repeated like the primary workload, the antagonists
+    running alongside every repetition.
+    """
+    primary_name, run_primary, primary_params = interference_workload(params.primary)
+    antagonists = [
+        interference_workload(antagonist, antagonist=True)
+        for antagonist in params.antagonists
+    ]
+    check_capabilities(primary_params)
+    for _, _, workload_params in antagonists:
+        check_capabilities(workload_params)
+    runs = [(antagonist[0], [antagonist]) for antagonist in antagonists]
+    if params.combined and len(antagonists) > 1:
+        runs.append(("combined", antagonists))
+
+    print(f"==>> Running {primary_name} alone ...")
+    baseline = interference_run(run_repeated(run_primary, primary_params, version))
+    results = []
+    for name, run_antagonists in runs:
+        print(f"==>> Running {primary_name} alongside {name} ...")
+        antagonist_runs = []
+
+        def run_alongside(workload_params, version, ready=None):
+            primary_results, antagonist_results = run_with_antagonists(
+                run_primary,
+                workload_params,
+                run_antagonists,
+                params.antagonist_lead,
+                version,
+            )
+            antagonist_runs.append(
+                [events_per_second(item) for item in antagonist_results]
+            )
+            return primary_results
+
+        # only the primary workload running alone is its stored configuration
+        result = interference_run(
+            run_repeated(
+                run_alongside,
+                dataclasses.replace(primary_params, store_database=None),
+                version,
+            )
+        )
+        result.update(
+            antagonist=name,
+            throughput_loss=(
+                1 - result["eventspersecond"] / baseline["eventspersecond"]
+                if baseline["eventspersecond"]
+                else 0.0
+            ),
+            latency_avg_increase=relative_increase(
+                result["latency_avg"], baseline["latency_avg"]
+            ),
+            tail_latency_increase=relative_increase(
+                result["latency_percentile_value"],
+                baseline["latency_percentile_value"],
+            ),
+            # mean over the repetitions of every antagonist
+            antagonist_eventspersecond=[
+                sum(samples) / len(samples) for samples in zip(*antagonist_runs)
+            ],
+        )
+        results.append(result)
+    return {
+        "sysbenchversion": version,
+        "primary": primary_name,
+        "baseline": baseline,
+        "interference": results,
+    }
+
+
+SIZE = re.compile(r"^\s*([0-9]+)\s*([KMGT]?)(?:i?B)?\s*$", re.IGNORECASE)
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+# memory-total-size sysbench transfers when it is not set
+DEFAULT_MEMORY_TOTAL_SIZE = "100G"
+
+
+def parse_size(size):
+    """
+    Parse a size such as 48K, 4KiB or 1M into a number of bytes.
+    """
+    match = SIZE.match(size)
+    if match is None:
+        raise Exception(1, f"Invalid size: {size}")
+    return int(match.group(1)) * SIZE_UNITS[match.group(2).upper()]
+
+
+def format_size(size):
+    for unit in ("T", "G", "M", "K"):
+        if size % SIZE_UNITS[unit] == 0:
+            return f"{size // SIZE_UNITS[unit]}{unit}"
+    return str(size)
+
+
+def read_cache_levels(cpu):
+    """
+    Read the data and unified caches of a CPU from sysfs, ordered by level.
+    """
+    caches = []
+    for index in glob.glob(f"/sys/devices/system/cpu/cpu{cpu}/cache/index*"):
+        try:
+            with open(os.path.join(index, "level"), "r") as level_file:
+                level = int(level_file.read())
+            with open(os.path.join(index, "type"), "r") as type_file:
+                cache_type = type_file.read().strip()
+            with open(os.path.join(index, "size"), "r") as size_file:
+                size = parse_size(size_file.read())
+        except (OSError, ValueError):
+            continue
+        if cache_type in ("Data", "Unified"):
+            caches.append({"level": level, "type": cache_type, "size": size})
+    return sorted(caches, key=lambda cache: cache["level"])
+
+
+def cache_level_name(working_set, caches):
+    for cache in caches:
+        if working_set <= cache["size"]:
+            return f"L{cache['level']}"
+    return "DRAM"
+
+
+def default_working_sets(caches, llc_multiple):
+    """
+    Powers of two from 4 KiB up to the given multiple of the last level
+    cache, or up to 256 MiB when the cache sizes are unknown.
+    """
+    largest = caches[-1]["size"] * llc_multiple if caches else 256 * SIZE_UNITS["M"]
+    working_sets = []
+    working_set = 4 * SIZE_UNITS["K"]
+    while working_set <= largest:
+        working_sets.append(working_set)
+        working_set *= 2
+    return working_sets
+
+
+def point_total_size(total_size, working_set, min_passes):
+    """
+    Total size of a sweep point, at least min_passes times its working set so
+    that the largest working sets are not measured over a single pass.
+    """
+    total = parse_size(total_size or DEFAULT_MEMORY_TOTAL_SIZE)
+    return format_size(max(total, working_set * min_passes))
+
+
+def detect_plateaus(points, tolerance, caches):
+    """
+    Group consecutive sweep points whose bandwidth stays within the relative
+    tolerance of the running plateau mean, naming every plateau after the
+    cache level holding its largest working set.
+    """
+    plateaus = []
+    for point in points:
+        bandwidth = point["transferred_MiBpersec"]
+        plateau = plateaus[-1] if plateaus else None
+        if plateau is not None and (
+            abs(bandwidth - plateau["transferred_MiBpersec"])
+            <= tolerance * plateau["transferred_MiBpersec"]
+        ):
+            plateau["transferred_MiBpersec"] = (
+                plateau["transferred_MiBpersec"] * plateau["points"] + bandwidth
+            ) / (plateau["points"] + 1)
+            plateau["points"] += 1
+            plateau["max_working_set"] = point["working_set"]
+        else:
+            plateaus.append(
+                {
+                    "min_working_set": point["working_set"],
+                    "max_working_set": point["working_set"],
+                    "transferred_MiBpersec": bandwidth,
+                    "points": 1,
+                }
+            )
+    for plateau in plateaus:
+        plateau["cache_level"] = cache_level_name(plateau["max_working_set"], caches)
+    return plateaus
+
+
+def memory_cache_sweep(params, version):
+    """
+    Run the memory workload with a block size per working set size and find
+    the bandwidth plateaus of the cache hierarchy.
+    """
+    cpus = get_cpu_affinity(params.memory) or os.sched_getaffinity(0)
+    caches = read_cache_levels(min(cpus))
+    if params.working_set_sizes:
+        working_sets = sorted(parse_size(size) for size in params.working_set_sizes)
+    else:
+        working_sets = default_working_sets(caches, params.llc_multiple)
+
+    points = []
+    for working_set in working_sets:
+        block_size = format_size(working_set)
+        print(f"==>> Running with a {block_size} working set ...")
+        workload_results = run_repeated(
+            run_sysbench_workload,
+            dataclasses.replace(
+                params.memory,
+                memory_block_size=block_size,
+                memory_total_size=point_total_size(
+                    params.memory.memory_total_size, working_set, params.min_passes
+                ),
+            ),
+            version,
+        )
+        points.append(
+            {
+                "working_set": working_set,
+                "transferred_MiBpersec": result_metric(
+                    workload_results, "transferred_MiBpersec"
+                ),
+                "cache_level": cache_level_name(working_set, caches),
+            }
+        )
+    return {
+        "sysbenchversion": version,
+        "caches": caches,
+        "points": points,
+        "plateaus": detect_plateaus(points, params.plateau_tolerance, caches),
+    }
+
+
+def io_point_metrics(workload_results):
+    """
+    Operation rates, throughput and latency of an I/O workload run.
+    """
+    point = {
+        "latency_avg": result_metric(workload_results, "Latency.avg"),
+        "latency_percentile_value": result_metric(
+            workload_results, "Latency.percentile_value"
+        ),
+    }
+    for metric in ("reads_s", "writes_s", "fsyncs_s"):
+        point[metric] = result_metric(workload_results, f"Fileoperations.{metric}")
+    for metric in ("read_MiB_s", "written_MiB_s"):
+        point[metric] = result_metric(workload_results, f"Throughput.{metric}")
+    return point
+
+
+def io_matrix(params, version):
+    """
+    Run every combination of test mode, block size, I/O mode and thread
+    count against a single set of prepared test files.
+    """
+    io = params.io
+    if io.instances is not None and io.instances > 1:
+        raise Exception(1, "The I/O matrix does not support several instances")
+    file_test_modes = params.file_test_modes or [io.file_test_mode]
+    if None in file_test_modes:
+        raise Exception(1, "Either file-test-modes or file-test-mode must be set")
+    combinations = [
+        dataclasses.replace(
+            io,
+            file_test_mode=file_test_mode,
+            file_block_size=file_block_size,
+            file_io_mode=file_io_mode,
+            threads=threads,
+        )
+        for file_test_mode, file_block_size, file_io_mode, threads in itertools.product(
+            file_test_modes,
+            params.file_block_sizes or [io.file_block_size],
+            params.file_io_modes or [io.file_io_mode],
+            params.thread_counts or [io.threads],
+        )
+    ]
+    for combination in combinations:
+        check_capabilities(combination)
+
+    io_flags = get_sysbench_flags(sysbench_io_input_schema, io)
+    cpus = get_cpu_affinity(io)
+    reused = prepare_io_files(io, io_flags, cpus)
+    points = []
+    try:
+        for index, combination in enumerate(combinations):
+            print(f"==>> Running combination {index + 1} of {len(combinations)} ...")
+            workload_results = run_repeated(
+                functools.partial(run_io_workload, prepared=True), combination, version
+            )
+            point = io_point_metrics(workload_results)
+            point.update(
+                file_test_mode=combination.file_test_mode,
+                file_block_size=combination.file_block_size,
+                file_io_mode=combination.file_io_mode,
+                threads=combination.threads,
+            )
+            points.append(point)
+    finally:
+        finish_io_files(io, io_flags, cpus)
+    return {
+        "sysbenchversion": version,
+        "Preparedfilesreused": reused,
+        "points": points,
+    }
+
+
+# Asynchronous operations queued per thread, unless others are requested
+DEFAULT_QUEUE_DEPTHS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def saturation_knee(points, tolerance):
+    """
+    Find the saturation knee of sweep points ordered by queue depth: the first
+    point whose IOPS no deeper point improves by more than the relative
+    tolerance, so that deeper queues only add latency.
+    """
+    knee = len(points) - 1
+    best_deeper = 0.0
+    for index in range(len(points) - 1, -1, -1):
+        if best_deeper <= points[index]["iops"] * (1 + tolerance):
+            knee = index
+        best_deeper = max(best_deeper, points[index]["iops"])
+    point = points[knee]
+    return {
+        "threads": point["threads"],
+        "file_async_backlog": point["file_async_backlog"],
+        "queue_depth": point["queue_depth"],
+        "iops": point["iops"],
+        "latency_avg": point["latency_avg"],
+        "saturated": knee < len(points) - 1,
+        "latency_added": points[-1]["latency_avg"] - point["latency_avg"],
+    }
+
+
+def io_queue_depth_sweep(params, version):
+    """
+    Run the asynchronous I/O workload for every thread count and queue depth
+    against a single set of prepared test files, and find where deeper queues
+    stop adding IOPS.
+    """
+    io = dataclasses.replace(params.io, file_io_mode=FileIoMode.ASYNC)
+    if io.instances is not None and io.instances > 1:
+        raise Exception(1, "The queue depth sweep does not support several instances")
+    if io.file_test_mode is None:
+        raise Exception(1, "file-test-mode must be set for the queue depth sweep")
+    thread_counts = params.thread_counts or [io.threads or 1]
+    queue_depths = sorted(params.queue_depths or DEFAULT_QUEUE_DEPTHS)
+    combinations = [
+        dataclasses.replace(io, threads=threads, file_async_backlog=queue_depth)
+        for threads, queue_depth in itertools.product(thread_counts, queue_depths)
+    ]
+    for combination in combinations:
+        check_capabilities(combination)
+
+    io_flags = get_sysbench_flags(sysbench_io_input_schema, io)
+    cpus = get_cpu_affinity(io)
+    reused = prepare_io_files(io, io_flags, cpus)
+    points = []
+    try:
+        for index, combination in enumerate(combinations):
+            print(
+                f"==>> Running {combination.threads} threads with a queue depth of"
+                f" {combination.file_async_backlog} ({index + 1} of"
+                f" {len(combinations)}) ..."
+            )
+            workload_results = run_repeated(
+                functools.partial(run_io_workload, prepared=True), combination, version
+            )
+            metrics = io_point_metrics(workload_results)
+            points.append(
+                {
+                    "threads": combination.threads,
+                    "file_async_backlog": combination.file_async_backlog,
+                    "queue_depth": combination.threads * combination.file_async_backlog,
+                    "iops": metrics["reads_s"] + metrics["writes_s"],
+                    "read_MiB_s": metrics["read_MiB_s"],
+                    "written_MiB_s": metrics["written_MiB_s"],
+                    "latency_avg": metrics["latency_avg"],
+                    "latency_percentile_value": metrics["latency_percentile_value"],
+                }
+            )
+    finally:
+        finish_io_files(io, io_flags, cpus)
+    knees = [
+        saturation_knee(
+            [point for point in points if point["threads"] == threads],
+            params.knee_tolerance,
+        )
+        for threads in thread_counts
+    ]
+    return {
+        "sysbenchversion": version,
+        "Preparedfilesreused": reused,
+        "points": points,
+        "knees": knees,
+        # at equal total queue depths, the fewer threads come first
+        "knee": saturation_knee(
+            sorted(points, key=lambda point: (point["queue_depth"], point["threads"])),
+            params.knee_tolerance,
+        ),
+    }
+
+
+# Metrics compared by default, when they are in both results
+DEFAULT_COMPARISON_METRICS = (
+    "eventspersecond",
+    "Latency.avg",
+    "Latency.percentile_value",
+)
+# Metrics for which a decrease is an improvement
+LOWER_IS_BETTER = ("Latency.",)
+COMPARED_WORKLOADS = ("cpu", "memory", "io", "threads", "mutex", "lua")
+
+
+def selected_results(results, name):
+    """
+    Return the workload and the results of the one workload set in results.
+    """
+    selected = [
+        (workload, getattr(results, workload))
+        for workload in COMPARED_WORKLOADS
+        if getattr(results, workload) is not None
+    ]
+    if len(selected) != 1:
+        raise Exception(1, f"Exactly one of the {name} workload results must be set")
+    return selected[0]
+
+
+def load_baseline(path):
+    """
+    Load baseline results from a JSON or YAML file, holding either results in
+    the form of the baseline input or the saved output of a workload step.
+    """
+    try:
+        with open(path, "r") as baseline_file:
+            data = yaml.safe_load(baseline_file)
+    except (OSError, yaml.YAMLError) as error:
+        raise Exception(1, f"Failed to read the baseline file {path}: {error}")
+    if isinstance(data, dict) and "output_data" in data:
+        # the output of a step as printed by the plugin
+        data = data["output_data"]
+    if not isinstance(data, dict):
+        raise Exception(1, f"The baseline file {path} does not hold results")
+    if set(data) <= set(COMPARED_WORKLOADS):
+        try:
+            return sysbench_results_schema.unserialize(data)
+        except schema.ConstraintException as error:
+            raise Exception(
+                1, f"The baseline file {path} holds invalid results: {error}"
+            )
+    for workload in COMPARED_WORKLOADS:
+        try:
+            return sysbench_results_schema.unserialize({workload: data})
+        except schema.ConstraintException:
+            continue
+    raise Exception(1, f"The baseline file {path} does not hold workload results")
+
+
+def metric_samples(workload_results):
+    """
+    Values of every metric of the results, one per repetition when the
+    workload was repeated.
+    """
+    if workload_results.sysbench_repetitions is not None:
+        return {
+            statistics.metric: statistics.samples
+            for statistics in workload_results.sysbench_repetitions.metrics
+        }
+    return {
+        metric: [value]
+        for metric, value in repetition_metrics(workload_results).items()
+    }
+
+
+def compare_metric(metric, baseline, current, threshold, alpha):
+    higher_is_better = not metric.startswith(LOWER_IS_BETTER)
+    baseline_mean = sysbench_statistics.summarize(baseline)["mean"]
+    current_mean = sysbench_statistics.summarize(current)["mean"]
+    comparison = {
+        "metric": metric,
+        "baseline": baseline_mean,
+        "current": current_mean,
+        "delta": current_mean - baseline_mean,
+        "higher_is_better": higher_is_better,
+        "threshold": threshold,
+        "regression": False,
+    }
+    p_value = sysbench_statistics.welch_p_value(baseline, current)
+    effect_size = sysbench_statistics.hedges_g(baseline, current)
+    if p_value is not None:
+        comparison["p_value"] = p_value
+    if effect_size is not None:
+        comparison["effect_size"] = effect_size
+    if baseline_mean != 0:
+        relative_delta = comparison["delta"] / abs(baseline_mean)
+        comparison["relative_delta"] = relative_delta
+        worse = -relative_delta if higher_is_better else relative_delta
+        comparison["regression"] = worse > threshold and (
+            p_value is None or p_value < alpha
+        )
+    return comparison
+
+
+def compare_results(params, baseline_results):
+    workload, current = selected_results(params.current, "current")
+    baseline_workload, baseline = selected_results(baseline_results, "baseline")
+    if workload != baseline_workload:
+        raise Exception(
+            1, f"Cannot compare {workload} results to a {baseline_workload} baseline"
+        )
+    current_samples = metric_samples(current)
+    baseline_samples = metric_samples(baseline)
+    if params.metrics is None:
+        metrics = [
+            metric
+            for metric in DEFAULT_COMPARISON_METRICS
+            if metric in current_samples and metric in baseline_samples
+        ]
+    else:
+        metrics = params.metrics
+        missing = [
+            metric
+            for metric in metrics
+            if metric not in current_samples or metric not in baseline_samples
+        ]
+        if missing:
+            raise Exception(
+                1, "Metrics missing from the results: {}".format(", ".join(missing))
+            )
+    thresholds = params.metric_thresholds or {}
+    comparisons = [
+        compare_metric(
+            metric,
+            baseline_samples[metric],
+            current_samples[metric],
+            thresholds.get(metric, params.max_regression),
+            params.alpha,
+        )
+        for metric in metrics
+    ]
+    regressions = [item["metric"] for item in comparisons if item["regression"]]
+    return {
+        "workload": workload,
+        "passed": not regressions,
+        "regressions": regressions,
+        "metrics": comparisons,
+        "baselineversion": baseline.sysbench_output_params.sysbenchversion,
+        "currentversion": current.sysbench_output_params.sysbenchversion,
+    }
+
+
+def store_results(params, workload_results):
+    """
+    Store the results of a successful run in the result store, when one is
+    configured.
+    """
+    if params.store_database is None:
+        return
+    workload = STORED_WORKLOADS[type(params)]
+    _, input_schema = WORKLOAD_TESTS[type(params)]
+    results = sysbench_results_schema.serialize(
+        SysbenchResults(**{workload: workload_results})
+    )[workload]
+    metrics = {
+        metric: sysbench_statistics.summarize(samples)["mean"]
+        for metric, samples in metric_samples(workload_results).items()
+    }
+    try:
+        sysbench_store.store(
+            params.store_database,
+            workload,
+            input_schema.serialize(params),
+            workload_results.sysbench_output_params.sysbenchversion,
+            results,
+            metrics,
+        )
+    except (OSError, sqlite3.Error) as error:
+        raise Exception(
+            1, f"Failed to store the results in {params.store_database}: {error}"
+        ) from error
+
+
+# Percentiles of the bands of queried metrics, unless others are requested
+DEFAULT_BAND_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+SECONDS_PER_DAY = 86400
+
+
+def metric_trend(metric, results, percentiles):
+    points = [
+        (result["timestamp"], result["metrics"][metric])
+        for result in results
+        if metric in result["metrics"]
+    ]
+    if not points:
+        return None
+    values = [value for _, value in points]
+    trend = {
+        "metric": metric,
+        "count": len(values),
+        "mean": sysbench_statistics.summarize(values)["mean"],
+        "bands": [
+            {
+                "percentile": percentile,
+                "value": sysbench_statistics.quantile(values, percentile / 100),
+            }
+            for percentile in percentiles
+        ],
+    }
+    slope = sysbench_statistics.slope(
+        [timestamp / SECONDS_PER_DAY for timestamp, _ in points], values
+    )
+    if slope is not None:
+        trend["slope_per_day"] = slope
+        if trend["mean"] != 0:
+            trend["relative_slope_per_day"] = slope / abs(trend["mean"])
+    return trend
+
+
+def query_results(params):
+    """
+    Query the stored results of a configuration, returning the latest ones and
+    the trend of every requested metric over all of them.
+    """
+    configurations = [
+        getattr(params, workload)
+        for workload in COMPARED_WORKLOADS
+        if getattr(params, workload) is not None
+    ]
+    if len(configurations) > 1:
+        raise Exception(1, "At most one of the workload parameters can be set")
+    workload = None if params.workload is None else params.workload.value
+    params_hash = params.params_hash
+    if configurations:
+        workload = STORED_WORKLOADS[type(configurations[0])]
+        _, input_schema = WORKLOAD_TESTS[type(configurations[0])]
+        params_hash = sysbench_store.parameter_hash(
+            workload, input_schema.serialize(configurations[0])
+        )
+    if not os.path.exists(params.store_database):
+        raise Exception(1, f"There is no result store at {params.store_database}")
+    metrics = params.metrics or ["eventspersecond"]
+    try:
+        results = sysbench_store.query(
+            params.store_database,
+            metrics,
+            workload=workload,
+            params_hash=params_hash,
+            host=params.host,
+            since=params.since,
+        )
+    except sqlite3.Error as error:
+        raise Exception(
+            1, f"Failed to query the results in {params.store_database}: {error}"
         ) from error
-    return version
+    trends = [
+        metric_trend(
+            metric, results, params.band_percentiles or DEFAULT_BAND_PERCENTILES
+        )
+        for metric in metrics
+    ]
+    return {
+        "count": len(results),
+        "latest": results[::-1][: params.latest],
+        "trends": [trend for trend in trends if trend is not None],
+    }
+
+
+def workload_error(error):
+    """
+    Step error of an exception, keeping the exit code and message of the
+    Exception(code, message) errors of this plugin and describing any other
+    exception, such as schema validation errors, with exit code 1.
+    """
+    if (
+        type(error) in (Exception, WatchdogTimeout)
+        and len(error.args) == 2
+        and isinstance(error.args[0], int)
+    ):
+        return WorkloadError(error.args[0], str(error.args[1]))
+    return WorkloadError(1, str(error))
 
 
 @plugin.step(
     id="sysbenchcpu",
     name="Sysbench CPU Workload",
     description="Run CPU performance test using the sysbench workload",
-    outputs={"success": WorkloadResultsCpu, "error": WorkloadError},
+    outputs={
+        "success": WorkloadResultsCpu,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
 )
 def RunSysbenchCpu(
     params: SysbenchCpuInputParams,
-) -> typing.Tuple[str, typing.Union[WorkloadResultsCpu, WorkloadError]]:
-    version = get_sysbench_version()
-    print(f"Sysbench version is: {version}")
-    print("==>> Running sysbench CPU workload ...")
-
-    serialized_params = sysbench_cpu_input_schema.serialize(params)
-
-    cpu_flags = []
-    for param, value in serialized_params.items():
-        cpu_flags.append(f"--{param}={value}")
-
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsCpu, WorkloadPartialResults, WorkloadError]
+]:
     try:
-        output, results = run_sysbench(cpu_flags, "cpu")
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench CPU workload ...")
+        workload_results = run_repeated(run_sysbench_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
     except Exception as error:
-        return "error", WorkloadError(error.args[0], error.args[1])
+        return "error", workload_error(error)
 
     print("==>> Workload run complete!")
 
-    output["sysbenchversion"] = version
-
-    return "success", WorkloadResultsCpu(
-        sysbench_cpu_output_schema.unserialize(output),
-        sysbench_cpu_results_schema.unserialize(results),
-    )
+    return "success", workload_results
 
 
 @plugin.step(
     id="sysbenchmemory",
     name="Sysbench Memory Workload",
     description=("Run the Memory functions speed test using the sysbench workload"),
-    outputs={"success": WorkloadResultsMemory, "error": WorkloadError},
+    outputs={
+        "success": WorkloadResultsMemory,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
 )
 def RunSysbenchMemory(
     params: SysbenchMemoryInputParams,
-) -> typing.Tuple[str, typing.Union[WorkloadResultsMemory, WorkloadError]]:
-    version = get_sysbench_version()
-    print(f"Sysbench version is: {version}")
-    print("==>> Running sysbench Memory workload ...")
-
-    serialized_params = sysbench_memory_input_schema.serialize(params)
-
-    memory_flags = []
-    for param, value in serialized_params.items():
-        memory_flags.append(f"--{param}={value}")
-
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsMemory, WorkloadPartialResults, WorkloadError]
+]:
     try:
-        output, results = run_sysbench(memory_flags, "memory")
-        output["memory_access_mode"] = params.memory_access_mode
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench Memory workload ...")
+        workload_results = run_repeated(run_sysbench_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
     except Exception as error:
-        return "error", WorkloadError(error.args[0], error.args[1])
+        return "error", workload_error(error)
 
     print("==>> Workload run complete!")
 
-    output["sysbenchversion"] = version
-
-    return "success", WorkloadResultsMemory(
-        sysbench_memory_output_schema.unserialize(output),
-        sysbench_memory_results_schema.unserialize(results),
-    )
+    return "success", workload_results
 
 
 @plugin.step(
     id="sysbenchio",
     name="Sysbench I/O Workload",
     description=("Run the I/O test using the sysbench workload"),
-    outputs={"success": WorkloadResultsIo, "error": WorkloadError},
+    outputs={
+        "success": WorkloadResultsIo,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
 )
 def RunSysbenchIo(
     params: SysbenchIoInputParams,
-) -> typing.Tuple[str, typing.Union[WorkloadResultsIo, WorkloadError]]:
-    version = get_sysbench_version()
-    print(f"Sysbench version is: {version}")
-    print("==>> Running sysbench I/O workload ...")
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsIo, WorkloadPartialResults, WorkloadError]
+]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench I/O workload ...")
+        workload_results = run_repeated(run_io_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
+    except Exception as error:
+        return "error", workload_error(error)
 
-    serialized_params = sysbench_io_input_schema.serialize(params)
+    print("==>> Workload run complete!")
+
+    return "success", workload_results
 
-    io_flags = []
-    for param, value in serialized_params.items():
-        io_flags.append(f"--{param}={value}")
 
+@plugin.step(
+    id="sysbenchthreads",
+    name="Sysbench Threads Workload",
+    description=(
+        "Run the scheduler performance test using the sysbench workload, with"
+        " threads yielding and contending for a small set of mutexes"
+    ),
+    outputs={
+        "success": WorkloadResultsThreads,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
+)
+def RunSysbenchThreads(
+    params: SysbenchThreadsInputParams,
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsThreads, WorkloadPartialResults, WorkloadError]
+]:
     try:
-        run_sysbench(io_flags, "fileio", "prepare")
-        output, results = run_sysbench(io_flags, "fileio", "run")
-        run_sysbench(io_flags, "fileio", "cleanup")
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench Threads workload ...")
+        workload_results = run_repeated(run_sysbench_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
     except Exception as error:
-        return "error", WorkloadError(error.args[0], error.args[1])
+        return "error", workload_error(error)
 
     print("==>> Workload run complete!")
 
-    output["sysbenchversion"] = version
+    return "success", workload_results
 
-    return "success", WorkloadResultsIo(
-        sysbench_io_output_schema.unserialize(output),
-        sysbench_io_results_schema.unserialize(results),
+
+@plugin.step(
+    id="sysbenchmutex",
+    name="Sysbench Mutex Workload",
+    description=(
+        "Run the mutex performance test using the sysbench workload, with every"
+        " thread locking random mutexes of a shared array"
+    ),
+    outputs={
+        "success": WorkloadResultsMutex,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
+)
+def RunSysbenchMutex(
+    params: SysbenchMutexInputParams,
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsMutex, WorkloadPartialResults, WorkloadError]
+]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench Mutex workload ...")
+        workload_results = run_repeated(run_sysbench_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", workload_results
+
+
+@plugin.step(
+    id="sysbenchlua",
+    name="Sysbench Lua Workload",
+    description=(
+        "Run a custom sysbench Lua script, given inline or as a file, with its"
+        " own options. Numeric key: value lines the script prints are returned"
+        " as custom metrics along with the standard statistics"
+    ),
+    outputs={
+        "success": WorkloadResultsLua,
+        "partial": WorkloadPartialResults,
+        "error": WorkloadError,
+    },
+)
+def RunSysbenchLua(
+    params: SysbenchLuaInputParams,
+) -> typing.Tuple[
+    str, typing.Union[WorkloadResultsLua, WorkloadPartialResults, WorkloadError]
+]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params)
+        print("==>> Running sysbench Lua workload ...")
+        workload_results = run_repeated(run_lua_workload, params, version)
+    except WatchdogTimeout as timeout:
+        return "partial", partial_results(timeout)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", workload_results
+
+
+@plugin.step(
+    id="sysbenchthreadscaling",
+    name="Sysbench Thread Scaling",
+    description=(
+        "Run the CPU, Memory, Threads or Mutex workload over a range of thread"
+        " counts and analyze its parallel efficiency and lock contention"
+    ),
+    outputs={"success": WorkloadResultsThreadScaling, "error": WorkloadError},
+)
+def RunSysbenchThreadScaling(
+    params: SysbenchThreadScalingInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsThreadScaling, WorkloadError]]:
+    try:
+        run_workload, workload_params = selected_workload(params, SCALED_WORKLOADS)
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(workload_params)
+        print("==>> Running sysbench thread scaling sweep ...")
+        scaling = thread_scaling(
+            run_workload,
+            workload_params,
+            params.thread_counts or default_thread_counts(),
+            version,
+        )
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_thread_scaling_results_schema.unserialize(scaling)
+
+
+@plugin.step(
+    id="sysbenchratesweep",
+    name="Sysbench Rate Sweep",
+    description=(
+        "Run a workload at a range of target rates and return its latency"
+        " versus throughput curve, including the queueing of events the system"
+        " cannot keep up with"
+    ),
+    outputs={"success": WorkloadResultsRateSweep, "error": WorkloadError},
+)
+def RunSysbenchRateSweep(
+    params: SysbenchRateSweepInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsRateSweep, WorkloadError]]:
+    try:
+        run_workload, workload_params = selected_workload(params)
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(dataclasses.replace(workload_params, rate=1))
+        print("==>> Running sysbench rate sweep ...")
+        sweep = rate_sweep(run_workload, workload_params, params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_rate_sweep_results_schema.unserialize(sweep)
+
+
+@plugin.step(
+    id="sysbenchmaxrate",
+    name="Sysbench Maximum Sustainable Rate",
+    description=(
+        "Search the highest rate at which a workload meets a latency SLO with"
+        " short probe runs, and confirm it with a full length run"
+    ),
+    outputs={"success": WorkloadResultsMaxRate, "error": WorkloadError},
+)
+def RunSysbenchMaxRate(
+    params: SysbenchMaxRateInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsMaxRate, WorkloadError]]:
+    try:
+        run_workload, workload_params = selected_workload(params)
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(dataclasses.replace(workload_params, rate=1))
+        print("==>> Running sysbench maximum sustainable rate search ...")
+        search = max_sustainable_rate(run_workload, workload_params, params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_max_rate_results_schema.unserialize(search)
+
+
+@plugin.step(
+    id="sysbenchinterference",
+    name="Sysbench Interference",
+    description=(
+        "Run a CPU, Memory or I/O workload alone and alongside background"
+        " workloads, and report the throughput and tail latency it loses to"
+        " every antagonist"
+    ),
+    outputs={"success": WorkloadResultsInterference, "error": WorkloadError},
+)
+def RunSysbenchInterference(
+    params: SysbenchInterferenceInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsInterference, WorkloadError]]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        print("==>> Running sysbench interference mode ...")
+        results = interference(params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_interference_results_schema.unserialize(results)
+
+
+@plugin.step(
+    id="sysbenchmemorycache",
+    name="Sysbench Memory Cache Sweep",
+    description=(
+        "Run the Memory workload over a range of working set sizes to measure"
+        " the bandwidth of every level of the cache hierarchy"
+    ),
+    outputs={"success": WorkloadResultsMemoryCache, "error": WorkloadError},
+)
+def RunSysbenchMemoryCache(
+    params: SysbenchMemoryCacheInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsMemoryCache, WorkloadError]]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        check_capabilities(params.memory)
+        print("==>> Running sysbench memory cache sweep ...")
+        sweep = memory_cache_sweep(params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_memory_cache_results_schema.unserialize(sweep)
+
+
+@plugin.step(
+    id="sysbenchiomatrix",
+    name="Sysbench I/O Test Matrix",
+    description=(
+        "Run the I/O workload for every combination of test mode, block size,"
+        " I/O mode and thread count against a single set of prepared files"
+    ),
+    outputs={"success": WorkloadResultsIoMatrix, "error": WorkloadError},
+)
+def RunSysbenchIoMatrix(
+    params: SysbenchIoMatrixInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsIoMatrix, WorkloadError]]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        print("==>> Running sysbench I/O test matrix ...")
+        matrix = io_matrix(params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_io_matrix_results_schema.unserialize(matrix)
+
+
+@plugin.step(
+    id="sysbenchioqueuedepth",
+    name="Sysbench I/O Queue Depth Sweep",
+    description=(
+        "Run the asynchronous I/O workload for every thread count and queue"
+        " depth, returning the IOPS and latency curve and its saturation knee"
+    ),
+    outputs={"success": WorkloadResultsIoQueueDepth, "error": WorkloadError},
+)
+def RunSysbenchIoQueueDepth(
+    params: SysbenchIoQueueDepthInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsIoQueueDepth, WorkloadError]]:
+    try:
+        version = get_sysbench_version()
+        print(f"Sysbench version is: {version}")
+        print("==>> Running sysbench I/O queue depth sweep ...")
+        sweep = io_queue_depth_sweep(params, version)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print("==>> Workload run complete!")
+
+    return "success", sysbench_io_queue_depth_results_schema.unserialize(sweep)
+
+
+@plugin.step(
+    id="sysbenchcompare",
+    name="Sysbench Baseline Comparison",
+    description=(
+        "Compare the results of a CPU, Memory, I/O, Threads, Mutex or Lua"
+        " workload to a baseline and detect statistically significant"
+        " regressions"
+    ),
+    outputs={"success": WorkloadComparison, "error": WorkloadError},
+)
+def RunSysbenchCompare(
+    params: SysbenchComparisonInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadComparison, WorkloadError]]:
+    if (params.baseline is None) == (params.baseline_file is None):
+        return "error", WorkloadError(
+            1, "Exactly one of baseline or baseline-file must be set"
+        )
+    try:
+        baseline = params.baseline or load_baseline(params.baseline_file)
+        comparison = compare_results(params, baseline)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    print(
+        "==>> Comparison {}: {}".format(
+            "passed" if comparison["passed"] else "failed",
+            ", ".join(comparison["regressions"]) or "no regressions",
+        )
     )
 
+    return "success", sysbench_comparison_schema.unserialize(comparison)
+
+
+@plugin.step(
+    id="sysbenchquery",
+    name="Sysbench Result Query",
+    description=(
+        "Query the result store for the latest results of a configuration and"
+        " the trends and percentile bands of their metrics"
+    ),
+    outputs={"success": WorkloadResultsQuery, "error": WorkloadError},
+)
+def RunSysbenchQuery(
+    params: SysbenchQueryInputParams,
+) -> typing.Tuple[str, typing.Union[WorkloadResultsQuery, WorkloadError]]:
+    try:
+        query = query_results(params)
+    except Exception as error:
+        return "error", workload_error(error)
+
+    return "success", sysbench_query_results_schema.unserialize(query)
+
 
 if __name__ == "__main__":
     sys.exit(
         plugin.run(
-            plugin.build_schema(RunSysbenchCpu, RunSysbenchMemory, RunSysbenchIo)
+            plugin.build_schema(
+                RunSysbenchCpu,
+                RunSysbenchMemory,
+                RunSysbenchIo,
+                RunSysbenchThreads,
+                RunSysbenchMutex,
+                RunSysbenchLua,
+                RunSysbenchThreadScaling,
+                RunSysbenchRateSweep,
+                RunSysbenchMaxRate,
+                RunSysbenchInterference,
+                RunSysbenchMemoryCache,
+                RunSysbenchIoMatrix,
+                RunSysbenchIoQueueDepth,
+                RunSysbenchCompare,
+                RunSysbenchQuery,
+            )
         )
     )
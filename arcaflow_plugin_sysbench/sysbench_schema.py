@@ -58,6 +58,21 @@ class FileSyncMode(enum.Enum):
     FDATASYNC = "fdatasync"
 
 
+class StoredWorkload(enum.Enum):
+    CPU = "cpu"
+    MEMORY = "memory"
+    IO = "io"
+    THREADS = "threads"
+    MUTEX = "mutex"
+    LUA = "lua"
+
+
+class FileCleanup(enum.Enum):
+    ALWAYS = "always"
+    KEEP = "keep"
+    EVICT = "evict"
+
+
 @dataclass
 class CommonInputParameters:
     threads: typing.Annotated[
@@ -154,25 +169,214 @@ class CommonInputParameters:
             " Use the special value of 0 to disable percentile calculations"
         ),
     ] = None
+    report_interval: typing.Annotated[
+        typing.Optional[int],
+        validation.min(0),
+        schema.id("report-interval"),
+        schema.name("Report Interval"),
+        schema.description(
+            "periodically report intermediate statistics with a specified"
+            " interval in seconds. 0 disables intermediate reports"
+        ),
+    ] = None
+    histogram: typing.Annotated[
+        typing.Optional[OnOff],
+        schema.name("Histogram"),
+        schema.description("print latency histogram in report"),
+    ] = None
+    report_checkpoints: typing.Annotated[
+        typing.Optional[typing.List[int]],
+        validation.min(1),
+        schema.id("report-checkpoints"),
+        schema.name("Report Checkpoints"),
+        schema.description(
+            "dump full statistics and reset all counters at the specified"
+            " points in time, in seconds elapsed from the start of the test"
+        ),
+    ] = None
+    percentiles: typing.Annotated[
+        typing.Optional[
+            typing.List[
+                typing.Annotated[float, validation.min(0.0), validation.max(100.0)]
+            ]
+        ],
+        validation.min(1),
+        schema.name("Percentiles"),
+        schema.description(
+            "list of latency percentiles to derive from the latency histogram"
+            " of a single run. Enables the histogram"
+        ),
+    ] = None
+    repetitions: typing.Annotated[
+        typing.Optional[int],
+        validation.min(1),
+        schema.name("Repetitions"),
+        schema.description(
+            "maximum number of times to run the workload. The results of the"
+            " last run are returned along with statistics over all runs"
+        ),
+    ] = None
+    repetitions_tolerance: typing.Annotated[
+        typing.Optional[float],
+        validation.min(0.0),
+        schema.id("repetitions-tolerance"),
+        schema.name("Repetitions Tolerance"),
+        schema.description(
+            "stop repeating the workload early, after at least 3 runs, once"
+            " the 95% confidence interval half-width of the events per second"
+            " falls below this fraction of its mean"
+        ),
+    ] = None
+    cpu_list: typing.Annotated[
+        typing.Optional[str],
+        schema.id("cpu-list"),
+        schema.name("CPU List"),
+        schema.description(
+            "restrict sysbench to the given list of CPUs, for example 0-3,8"
+        ),
+    ] = None
+    numa_node: typing.Annotated[
+        typing.Optional[int],
+        validation.min(0),
+        schema.id("numa-node"),
+        schema.name("NUMA Node"),
+        schema.description(
+            "restrict sysbench to the CPUs of the given NUMA node, combined with"
+            " cpu-list when both are set"
+        ),
+    ] = None
+    instances: typing.Annotated[
+        typing.Optional[int],
+        validation.min(1),
+        schema.name("Instances"),
+        schema.description(
+            "number of sysbench processes to run concurrently. Their results"
+            " are merged into totals along with a per-instance breakdown"
+        ),
+    ] = None
+    instance_cpu_lists: typing.Annotated[
+        typing.Optional[typing.List[str]],
+        validation.min(1),
+        schema.id("instance-cpu-lists"),
+        schema.name("Instance CPU Lists"),
+        schema.description(
+            "list of CPUs to restrict every instance to, one entry per"
+            " instance. Replaces cpu-list for the instances"
+        ),
+    ] = None
+    watchdog_timeout: typing.Annotated[
+        typing.Optional[int],
+        validation.min(1),
+        schema.id("watchdog-timeout"),
+        schema.name("Watchdog Timeout"),
+        schema.description(
+            "wall-clock seconds after which the plugin stops a sysbench process"
+            " that is still running, even when forced-shutdown did not. The"
+            " output streamed until then is returned as a partial result"
+        ),
+    ] = None
+    watchdog_grace: typing.Annotated[
+        int,
+        validation.min(1),
+        schema.id("watchdog-grace"),
+        schema.name("Watchdog Grace Period"),
+        schema.description(
+            "seconds the watchdog waits after each of SIGINT and SIGTERM"
+            " before escalating to the next signal"
+        ),
+    ] = 10
+    telemetry_interval: typing.Annotated[
+        typing.Optional[float],
+        validation.min(0.1),
+        schema.id("telemetry-interval"),
+        schema.name("Telemetry Interval"),
+        schema.description(
+            "seconds between samples of host CPU, memory, disk and frequency"
+            " telemetry taken while sysbench runs. Unset disables the sampling"
+        ),
+    ] = None
+    warmup_time: typing.Annotated[
+        typing.Optional[int],
+        validation.min(0),
+        schema.id("warmup-time"),
+        schema.name("Warm-up Time"),
+        schema.description(
+            "execute events for this many seconds with statistics disabled"
+            " before the actual benchmark run with statistics enabled"
+        ),
+    ] = None
+    steady_state_window: typing.Annotated[
+        typing.Optional[int],
+        validation.min(2),
+        schema.id("steady-state-window"),
+        schema.name("Steady-State Window"),
+        schema.description(
+            "number of consecutive intermediate reports whose rate must be"
+            " stable for the workload to be in steady state: the MiB per second"
+            " transferred for memory, read and written for I/O, and the events"
+            " per second otherwise. Only the"
+            " statistics from the start of the first stable window on are"
+            " reported. Needs report-interval and time"
+        ),
+    ] = None
+    steady_state_cv: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("steady-state-cv"),
+        schema.name("Steady-State Coefficient of Variation"),
+        schema.description(
+            "largest coefficient of variation of the rate over a steady-state window"
+        ),
+    ] = 0.05
+    steady_state_slope: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("steady-state-slope"),
+        schema.name("Steady-State Slope"),
+        schema.description(
+            "largest change of the rate from one report to the next over a"
+            " steady-state window, fitted by least squares, as a"
+            " fraction of the window mean"
+        ),
+    ] = 0.01
+    store_database: typing.Annotated[
+        typing.Optional[str],
+        schema.id("store-database"),
+        schema.name("Result Store Database"),
+        schema.description(
+            "path of a SQLite database to store the results of every"
+            " successful run in, along with the input parameters and a"
+            " fingerprint of the host. Created when it does not exist"
+        ),
+    ] = None
 
 
-# Other common parameters to consider...
+# Input parameters evaluated by the plugin rather than passed to sysbench
+PLUGIN_PARAMETERS = (
+    "percentiles",
+    "repetitions",
+    "repetitions-tolerance",
+    "cpu-list",
+    "numa-node",
+    "instances",
+    "instance-cpu-lists",
+    "watchdog-timeout",
+    "watchdog-grace",
+    "telemetry-interval",
+    "steady-state-window",
+    "steady-state-cv",
+    "steady-state-slope",
+    "store-database",
+    "file-directory",
+    "file-cleanup",
+    "script",
+    "script-file",
+    "script-options",
+    "prepare",
+)
 
-# Implementing report-interval would add periodic output to stdout and a new
-# data format we would need to account for in the parse_output section
-# of the plugin
-#   --report-interval=N             periodically report intermediate
-# statistics with a specified interval in seconds. 0 disables intermediate
-# reports [0]
-
-# Implementing report-checkpoints would dump to stdout a full run output at
-# the checkpoint times, requiring additional processing in the parse_output
-# section of the plugin
-#   --report-checkpoints=[LIST,...] dump full statistics and reset all
-# counters at specified points in time. The argument is a list of
-# comma-separated values representing the amount of time in seconds elapsed
-# from start of test when report checkpoint(s) must be performed. Report
-# checkpoints are off by default. []
+
+# Other common parameters to consider...
 
 # Implementing debug would add more verbose output ot stdout that we would
 # need to adjust parse_output to process.
@@ -182,10 +386,6 @@ class CommonInputParameters:
 # the parse_output process.
 #   --verbosity=N verbosity level {5 - debug, 0 - only critical messages} [3]
 
-# Implementing histogram significantly adds to the output, but this might be
-# valuable information to capture, even by default.
-#   --histogram[=on|off] print latency histogram in report [off]
-
 
 @dataclass
 class SysbenchCpuInputParams(CommonInputParameters):
@@ -352,412 +552,3414 @@ class SysbenchIoInputParams(CommonInputParameters):
         schema.description("Reads/writes ratio for combined test"),
     ] = None
 
+    file_directory: typing.Annotated[
+        typing.Optional[str],
+        schema.id("file-directory"),
+        schema.name("File Directory"),
+        schema.description(
+            "Directory to create the test files in, defaults to the working"
+            " directory of the plugin"
+        ),
+    ] = None
 
-@dataclass
-class LatencyAggregates:
-    avg: typing.Annotated[
-        float,
-        schema.name("Average"),
-        schema.description("Average Latency"),
-    ]
-    min: typing.Annotated[
-        float,
-        schema.name("Minimum"),
-        schema.description("Minimum latency"),
-    ]
-    max: typing.Annotated[
-        float,
-        schema.name("Maximum"),
-        schema.description("Maximum Latency"),
-    ]
-    percentile: typing.Annotated[
-        int,
-        schema.name("Percentile"),
-        schema.description("Latency percentile selected for reporting"),
-    ]
-    percentile_value: typing.Annotated[
-        float,
-        schema.name("Latency Percentile Value"),
-        schema.description("Latency percentile value"),
-    ]
-    sum: typing.Annotated[
-        float,
-        schema.name("Sum"),
-        schema.description("Sum of latencies"),
-    ]
+    file_cleanup: typing.Annotated[
+        typing.Optional[FileCleanup],
+        schema.id("file-cleanup"),
+        schema.name("File Cleanup"),
+        schema.description(
+            "What to do with the test files: prepare and remove them on every"
+            " run (always), or reuse the files prepared by an earlier run with"
+            " the same file-num, file-total-size, file-block-size and"
+            " directory and then keep them for later runs (keep) or remove"
+            " them afterwards (evict)"
+        ),
+    ] = FileCleanup.ALWAYS
 
 
 @dataclass
-class ThreadFairnessAggregates:
-    avg: typing.Annotated[
-        float,
-        schema.name("Average"),
-        schema.description("Average value across all threads"),
-    ]
-    stddev: typing.Annotated[
-        float,
-        schema.name("Standard Deviation"),
-        schema.description("Standard deviation of all threads"),
-    ]
-
+class SysbenchThreadsInputParams(CommonInputParameters):
+    """
+    This is the data structure for the
+    input parameters of Sysbench threads benchmark.
+    """
 
-@dataclass
-class ThreadsFairness:
-    events: typing.Annotated[
-        ThreadFairnessAggregates,
-        schema.name("Thread Fairness events"),
-        schema.description("number of events executed by the threads "),
-    ]
-    executiontime: typing.Annotated[
-        ThreadFairnessAggregates,
-        schema.name("Thread Fairness execution time"),
-        schema.description("Execution time of threads"),
-    ]
+    thread_yields: typing.Annotated[
+        typing.Optional[int],
+        schema.id("thread-yields"),
+        schema.name("Thread yields"),
+        schema.description("number of yields to do per request"),
+    ] = None
+    thread_locks: typing.Annotated[
+        typing.Optional[int],
+        schema.id("thread-locks"),
+        schema.name("Thread locks"),
+        schema.description("number of locks per thread"),
+    ] = None
 
 
 @dataclass
-class CPUmetrics:
-    eventspersecond: typing.Annotated[
-        float,
-        schema.name("Events per second"),
-        schema.description("Number of events per second to measure CPU speed"),
-    ]
-
+class SysbenchMutexInputParams(CommonInputParameters):
+    """
+    This is the data structure for the
+    input parameters of Sysbench mutex benchmark.
+    """
 
-@dataclass
-class FileOperationMetrics:
-    reads_s: typing.Annotated[
-        float,
-        schema.name("Read Ops/sec"),
-        schema.description("Read operations per second"),
-    ]
-    writes_s: typing.Annotated[
-        float,
-        schema.name("Write Ops/s"),
-        schema.description("Write Operations per second"),
-    ]
-    fsyncs_s: typing.Annotated[
-        float,
-        schema.name("Fsync/sec"),
-        schema.description("Number of fsync() per second"),
-    ]
+    mutex_num: typing.Annotated[
+        typing.Optional[int],
+        schema.id("mutex-num"),
+        schema.name("Mutex number"),
+        schema.description("total size of mutex array"),
+    ] = None
+    mutex_locks: typing.Annotated[
+        typing.Optional[int],
+        schema.id("mutex-locks"),
+        schema.name("Mutex locks"),
+        schema.description("number of mutex locks to do per thread"),
+    ] = None
+    mutex_loops: typing.Annotated[
+        typing.Optional[int],
+        schema.id("mutex-loops"),
+        schema.name("Mutex loops"),
+        schema.description("number of empty loops to do outside mutex lock"),
+    ] = None
 
 
 @dataclass
-class ThroughputMetrics:
-    read_MiB_s: typing.Annotated[
-        float,
-        schema.name("Read Mebibytes/s"),
-        schema.description("Read Mebibyte (2^20 bytes) per second"),
-    ]
-    written_MiB_s: typing.Annotated[
-        float,
-        schema.name("Written Mebibytes/s"),
-        schema.description("Written Mebibyte (2^20 bytes) per second"),
-    ]
+class SysbenchLuaInputParams(CommonInputParameters):
+    """
+    This is the data structure for the
+    input parameters of a custom sysbench Lua workload.
+    """
+
+    script: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Script"),
+        schema.description(
+            "source of the sysbench Lua script to run. Exactly one of script"
+            " and script-file must be set"
+        ),
+    ] = None
+    script_file: typing.Annotated[
+        typing.Optional[str],
+        schema.id("script-file"),
+        schema.name("Script File"),
+        schema.description(
+            "path of the sysbench Lua script to run, or the name of a script"
+            " installed with sysbench such as oltp_read_only"
+        ),
+    ] = None
+    script_options: typing.Annotated[
+        typing.Optional[typing.Dict[str, typing.Any]],
+        schema.id("script-options"),
+        schema.name("Script Options"),
+        schema.description(
+            "options defined by the script, passed to it as --name=value."
+            " Values are numbers, strings, booleans passed as on or off, or"
+            " lists passed as comma separated values"
+        ),
+    ] = None
+    prepare: typing.Annotated[
+        bool,
+        schema.name("Prepare"),
+        schema.description(
+            "run the prepare command of the script before the run and its"
+            " cleanup command after it"
+        ),
+    ] = False
 
 
 @dataclass
-class SysbenchCommonOutputParams:
+class SysbenchThreadScalingInputParams:
     """
-    This is the data structure for common output
-    parameters returned by sysbench benchmarks.
+    This is the data structure for the input parameters of the
+    Sysbench thread scaling sweep.
     """
 
-    sysbenchversion: typing.Annotated[
-        str,
-        schema.name("Sysbench version"),
-        schema.description("Version as reported by sysbench"),
-    ]
-    totaltime: typing.Annotated[
-        float,
-        schema.name("Total time"),
-        schema.description("Total execution time of workload"),
-    ]
-    totalnumberofevents: typing.Annotated[
-        int,
-        schema.name("Total number of events"),
-        schema.description("Total number of events performed by the workload"),
-    ]
-    Numberofthreads: typing.Annotated[
-        int,
-        schema.name("Number of threads"),
-        schema.description("Number of threads used by the workload"),
-    ]
-    Validationchecks: typing.Annotated[
-        typing.Optional[str],
-        schema.name("Validation checks"),
-        schema.description("Validation on/off"),
+    cpu: typing.Annotated[
+        typing.Optional[SysbenchCpuInputParams],
+        schema.name("CPU workload"),
+        schema.description(
+            "Parameters of the CPU workload to sweep. The threads parameter is"
+            " replaced by each thread count of the sweep"
+        ),
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[SysbenchMemoryInputParams],
+        schema.name("Memory workload"),
+        schema.description(
+            "Parameters of the Memory workload to sweep. The threads parameter"
+            " is replaced by each thread count of the sweep"
+        ),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[SysbenchThreadsInputParams],
+        schema.name("Threads workload"),
+        schema.description(
+            "Parameters of the threads scheduler workload to sweep. The threads"
+            " parameter is replaced by each thread count of the sweep"
+        ),
+    ] = None
+    mutex: typing.Annotated[
+        typing.Optional[SysbenchMutexInputParams],
+        schema.name("Mutex workload"),
+        schema.description(
+            "Parameters of the mutex contention workload to sweep. The threads"
+            " parameter is replaced by each thread count of the sweep"
+        ),
+    ] = None
+    thread_counts: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.id("thread-counts"),
+        schema.name("Thread counts"),
+        schema.description(
+            "Thread counts to run the workload with. A single thread run is"
+            " always included as the speedup baseline. Defaults to the powers"
+            " of two up to the number of CPUs"
+        ),
     ] = None
 
 
 @dataclass
-class SysbenchMemoryOutput:
+class SysbenchMemoryCacheInputParams:
     """
-    This is the data structure for specific output
-    parameters returned by sysbench memory benchmark.
+    This is the data structure for the input parameters of the
+    Sysbench memory cache sweep.
     """
 
-    blocksize: typing.Annotated[
-        str,
-        schema.name("Block size"),
-        schema.description("Block size in KiB"),
+    memory: typing.Annotated[
+        SysbenchMemoryInputParams,
+        schema.name("Memory workload"),
+        schema.description(
+            "Parameters of the Memory workload to sweep. The memory-block-size"
+            " parameter is replaced by each working set size of the sweep, and"
+            " the memory-total-size is raised to min-passes times the working"
+            " set where it is smaller. The time still bounds every point"
+        ),
     ]
-    totalsize: typing.Annotated[
-        str,
-        schema.name("Total size"),
-        schema.description("Total size in MiB"),
-    ]
-    operation: typing.Annotated[
-        str,
-        schema.name("Operation"),
-        schema.description("memory operation performed"),
-    ]
-    scope: typing.Annotated[
-        str,
-        schema.name("Scope"),
-        schema.description("scope of operation"),
-    ]
-    Totaloperationspersecond: typing.Annotated[
-        float,
-        schema.name("Total operations per second"),
+    working_set_sizes: typing.Annotated[
+        typing.Optional[typing.List[str]],
+        validation.min(1),
+        schema.id("working-set-sizes"),
+        schema.name("Working Set Sizes"),
         schema.description(
-            "Total number of operations performed by the memory workload" " per second"
+            "Memory block sizes to run the workload with, for example 32K or"
+            " 1M. Defaults to the powers of two from 4K up to llc-multiple"
+            " times the size of the last level cache"
         ),
-    ]
-    Totaloperations: typing.Annotated[
+    ] = None
+    llc_multiple: typing.Annotated[
         int,
-        schema.name("Total operations"),
+        validation.min(1),
+        schema.id("llc-multiple"),
+        schema.name("LLC Multiple"),
         schema.description(
-            "Total number of operations performed by the memory workload"
+            "Multiple of the last level cache size the default working set"
+            " sizes go up to"
         ),
-    ]
-    memory_access_mode: typing.Annotated[
-        SeqRnd,
-        schema.name("Memory Access Mode"),
-        schema.description("memory access mode (seq,rnd)"),
-    ]
-
-
-@dataclass
-class SysbenchCpuOutput:
-    """
-    This is the data structure for specific output
-    parameters returned by sysbench cpu benchmark.
-    """
-
-    Primenumberslimit: typing.Annotated[
+    ] = 4
+    plateau_tolerance: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("plateau-tolerance"),
+        schema.name("Plateau Tolerance"),
+        schema.description(
+            "Relative bandwidth difference up to which consecutive working set"
+            " sizes belong to the same plateau"
+        ),
+    ] = 0.15
+    min_passes: typing.Annotated[
         int,
-        schema.name("Prime numbers limit"),
-        schema.description("Number of prime numbers to use for CPU workload"),
-    ]
+        validation.min(1),
+        schema.id("min-passes"),
+        schema.name("Minimum Passes"),
+        schema.description(
+            "Least number of passes over the working set of every point, which"
+            " sets the memory-total-size of the points it would otherwise end"
+            " the run of early"
+        ),
+    ] = 100
 
 
 @dataclass
-class SysbenchIoOutput:
+class SysbenchIoMatrixInputParams:
     """
-    This is the data structure for specific output
-    parameters returned by sysbench io benchmark.
+    This is the data structure for the input parameters of the
+    Sysbench I/O test matrix.
     """
 
-    Extrafileopenflags: typing.Annotated[
-        str,
-        schema.name("File Open Flags"),
-        schema.description("File Open Flags"),
+    io: typing.Annotated[
+        SysbenchIoInputParams,
+        schema.name("I/O workload"),
+        schema.description(
+            "Parameters of the I/O workload. The test files are prepared once"
+            " with these parameters and every combination of the matrix is run"
+            " against them"
+        ),
     ]
+    file_test_modes: typing.Annotated[
+        typing.Optional[typing.List[FileTestMode]],
+        validation.min(1),
+        schema.id("file-test-modes"),
+        schema.name("File Test Modes"),
+        schema.description(
+            "Test modes to run, defaults to the file-test-mode of the I/O workload"
+        ),
+    ] = None
+    file_block_sizes: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.id("file-block-sizes"),
+        schema.name("File Block Sizes"),
+        schema.description(
+            "Block sizes to run, defaults to the file-block-size of the I/O workload"
+        ),
+    ] = None
+    file_io_modes: typing.Annotated[
+        typing.Optional[typing.List[FileIoMode]],
+        validation.min(1),
+        schema.id("file-io-modes"),
+        schema.name("File I/O Modes"),
+        schema.description(
+            "File operations modes to run, defaults to the file-io-mode of the"
+            " I/O workload"
+        ),
+    ] = None
+    thread_counts: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.id("thread-counts"),
+        schema.name("Thread counts"),
+        schema.description(
+            "Thread counts to run, defaults to the threads of the I/O workload"
+        ),
+    ] = None
 
 
 @dataclass
-class SysbenchMemoryResultParams:
+class SysbenchIoQueueDepthInputParams:
     """
-    This is the output results data structure for sysbench memory results.
+    This is the data structure for the input parameters of the
+    Sysbench asynchronous I/O queue depth sweep.
     """
 
-    transferred_MiB: typing.Annotated[
-        float,
-        schema.name("Transferred memory"),
-        schema.description("Total Memory Transferred"),
+    io: typing.Annotated[
+        SysbenchIoInputParams,
+        schema.name("I/O workload"),
+        schema.description(
+            "Parameters of the I/O workload, run in the async file-io-mode. The"
+            " test files are prepared once with these parameters and every"
+            " point of the sweep is run against them"
+        ),
     ]
-    transferred_MiBpersec: typing.Annotated[
+    queue_depths: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.id("queue-depths"),
+        schema.name("Queue Depths"),
+        schema.description(
+            "Asynchronous operations queued per thread, passed as"
+            " file-async-backlog. Defaults to the powers of two from 1 to 128"
+        ),
+    ] = None
+    thread_counts: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.id("thread-counts"),
+        schema.name("Thread counts"),
+        schema.description(
+            "Thread counts to run, defaults to the threads of the I/O workload"
+        ),
+    ] = None
+    knee_tolerance: typing.Annotated[
         float,
-        schema.name("Transferred memory per second"),
-        schema.description("Total Memory Transferred per second"),
-    ]
-    Latency: typing.Annotated[
-        LatencyAggregates,
-        schema.name("Latency"),
-        schema.description("Memory Latency in milli seconds"),
-    ]
-    Threadsfairness: typing.Annotated[
-        ThreadsFairness,
-        schema.name("Threads fairness"),
+        validation.min(0.0),
+        schema.id("knee-tolerance"),
+        schema.name("Knee Tolerance"),
         schema.description(
-            "Event distribution by threads for number of executed events"
-            " by threads and total execution time by thread"
+            "Relative IOPS gain below which a deeper queue no longer counts as"
+            " an improvement over the saturation knee"
         ),
-    ]
+    ] = 0.05
 
 
 @dataclass
-class SysbenchCpuResultParams:
+class SysbenchRateSweepInputParams:
     """
-    This is the output results data structure for sysbench cpu results.
+    This is the data structure for the input parameters of the
+    Sysbench rate sweep.
     """
 
-    CPUspeed: typing.Annotated[
-        CPUmetrics,
-        schema.name("CPU speed"),
-        schema.description("No of events per second"),
-    ]
-    Latency: typing.Annotated[
-        LatencyAggregates,
-        schema.name("Latency"),
-        schema.description("CPU latency in milliseconds"),
-    ]
-    Threadsfairness: typing.Annotated[
-        ThreadsFairness,
-        schema.name("Threads fairness"),
+    cpu: typing.Annotated[
+        typing.Optional[SysbenchCpuInputParams],
+        schema.name("CPU workload"),
         schema.description(
-            "Event distribution by threads for number of executed events"
-            " by threads and total execution time by thread"
+            "Parameters of the CPU workload to sweep. The rate parameter is"
+            " replaced by each target rate of the sweep"
         ),
-    ]
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[SysbenchMemoryInputParams],
+        schema.name("Memory workload"),
+        schema.description(
+            "Parameters of the Memory workload to sweep. The rate parameter is"
+            " replaced by each target rate of the sweep"
+        ),
+    ] = None
+    io: typing.Annotated[
+        typing.Optional[SysbenchIoInputParams],
+        schema.name("I/O workload"),
+        schema.description(
+            "Parameters of the I/O workload to sweep. The rate parameter is"
+            " replaced by each target rate of the sweep. With file-cleanup keep,"
+            " the test files are only prepared once"
+        ),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[SysbenchThreadsInputParams],
+        schema.name("Threads workload"),
+        schema.description(
+            "Parameters of the threads scheduler workload to sweep. The rate"
+            " parameter is replaced by each target rate of the sweep"
+        ),
+    ] = None
+    mutex: typing.Annotated[
+        typing.Optional[SysbenchMutexInputParams],
+        schema.name("Mutex workload"),
+        schema.description(
+            "Parameters of the mutex contention workload to sweep. The rate"
+            " parameter is replaced by each target rate of the sweep"
+        ),
+    ] = None
+    lua: typing.Annotated[
+        typing.Optional[SysbenchLuaInputParams],
+        schema.name("Lua workload"),
+        schema.description(
+            "Parameters of the Lua workload to sweep. The rate parameter is"
+            " replaced by each target rate of the sweep"
+        ),
+    ] = None
+    rates: typing.Annotated[
+        typing.Optional[typing.List[typing.Annotated[int, validation.min(1)]]],
+        validation.min(1),
+        schema.name("Rates"),
+        schema.description(
+            "Target rates in events per second to run the workload at. Defaults"
+            " to a geometric ramp up to the throughput of an unthrottled"
+            " calibration run"
+        ),
+    ] = None
+    ramp_points: typing.Annotated[
+        int,
+        validation.min(2),
+        schema.id("ramp-points"),
+        schema.name("Ramp Points"),
+        schema.description("Number of target rates of the geometric ramp"),
+    ] = 8
+    ramp_min_fraction: typing.Annotated[
+        float,
+        validation.min(0.0),
+        validation.max(1.0),
+        schema.id("ramp-min-fraction"),
+        schema.name("Ramp Minimum Fraction"),
+        schema.description(
+            "First target rate of the geometric ramp, as a fraction of the"
+            " unthrottled throughput"
+        ),
+    ] = 0.1
 
 
 @dataclass
-class SysbenchIoResultParams:
+class SysbenchMaxRateInputParams:
     """
-    This is the output results data structure for sysbench io results.
+    This is the data structure for the input parameters of the
+    Sysbench maximum sustainable rate search.
     """
 
-    Fileoperations: typing.Annotated[
-        FileOperationMetrics,
-        schema.name("FileOperations"),
-        schema.description("File Operation Metrics"),
-    ]
-    Throughput: typing.Annotated[
-        ThroughputMetrics,
-        schema.name("Throughput"),
-        schema.description("Throughput metrics"),
-    ]
-    Latency: typing.Annotated[
-        LatencyAggregates,
-        schema.name("Latency"),
-        schema.description("latency in milliseconds"),
-    ]
-    Threadsfairness: typing.Annotated[
-        ThreadsFairness,
-        schema.name("Threads fairness"),
+    slo_latency: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("slo-latency"),
+        schema.name("SLO Latency"),
         schema.description(
-            "Event distribution by threads for number of executed events"
-            " by threads and total execution time by thread"
+            "Latency in milliseconds the slo-percentile of events must stay under"
         ),
     ]
+    cpu: typing.Annotated[
+        typing.Optional[SysbenchCpuInputParams],
+        schema.name("CPU workload"),
+        schema.description(
+            "Parameters of the CPU workload to search. The rate parameter is"
+            " replaced by each probed rate"
+        ),
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[SysbenchMemoryInputParams],
+        schema.name("Memory workload"),
+        schema.description(
+            "Parameters of the Memory workload to search. The rate parameter is"
+            " replaced by each probed rate"
+        ),
+    ] = None
+    io: typing.Annotated[
+        typing.Optional[SysbenchIoInputParams],
+        schema.name("I/O workload"),
+        schema.description(
+            "Parameters of the I/O workload to search. The rate parameter is"
+            " replaced by each probed rate. With file-cleanup keep, the test"
+            " files are only prepared once"
+        ),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[SysbenchThreadsInputParams],
+        schema.name("Threads workload"),
+        schema.description(
+            "Parameters of the threads scheduler workload to search. The rate"
+            " parameter is replaced by each probed rate"
+        ),
+    ] = None
+    mutex: typing.Annotated[
+        typing.Optional[SysbenchMutexInputParams],
+        schema.name("Mutex workload"),
+        schema.description(
+            "Parameters of the mutex contention workload to search. The rate"
+            " parameter is replaced by each probed rate"
+        ),
+    ] = None
+    lua: typing.Annotated[
+        typing.Optional[SysbenchLuaInputParams],
+        schema.name("Lua workload"),
+        schema.description(
+            "Parameters of the Lua workload to search. The rate parameter is"
+            " replaced by each probed rate"
+        ),
+    ] = None
+    slo_percentile: typing.Annotated[
+        float,
+        validation.min(0.0),
+        validation.max(100.0),
+        schema.id("slo-percentile"),
+        schema.name("SLO Percentile"),
+        schema.description(
+            "Latency percentile the SLO applies to, derived from the latency"
+            " histogram"
+        ),
+    ] = 99.0
+    min_achieved_fraction: typing.Annotated[
+        float,
+        validation.min(0.0),
+        validation.max(1.0),
+        schema.id("min-achieved-fraction"),
+        schema.name("Minimum Achieved Fraction"),
+        schema.description(
+            "Smallest fraction of a probed rate sysbench must achieve for the"
+            " rate to be sustained"
+        ),
+    ] = 0.95
+    probe_time: typing.Annotated[
+        int,
+        validation.min(1),
+        schema.id("probe-time"),
+        schema.name("Probe Time"),
+        schema.description(
+            "Duration of every probe run in seconds. The confirmation run uses"
+            " the time of the workload"
+        ),
+    ] = 5
+    min_rate: typing.Annotated[
+        int,
+        validation.min(1),
+        schema.id("min-rate"),
+        schema.name("Minimum Rate"),
+        schema.description("Lowest rate to search, in events per second"),
+    ] = 1
+    max_rate: typing.Annotated[
+        typing.Optional[int],
+        validation.min(1),
+        schema.id("max-rate"),
+        schema.name("Maximum Rate"),
+        schema.description(
+            "Highest rate to search, in events per second. Defaults to the"
+            " throughput of an unthrottled probe run"
+        ),
+    ] = None
+    rate_tolerance: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("rate-tolerance"),
+        schema.name("Rate Tolerance"),
+        schema.description(
+            "Width of the search interval, relative to its upper bound, at"
+            " which the search stops"
+        ),
+    ] = 0.02
+    max_probes: typing.Annotated[
+        int,
+        validation.min(2),
+        schema.id("max-probes"),
+        schema.name("Maximum Probes"),
+        schema.description("Largest number of probe runs of the search"),
+    ] = 20
 
 
 @dataclass
-class SysbenchMemoryOutputParams(SysbenchCommonOutputParams, SysbenchMemoryOutput):
-    """
-    This is the data structure for all output
-    parameters returned by sysbench memory benchmark.
-    """
-
-
-@dataclass
-class SysbenchCpuOutputParams(SysbenchCommonOutputParams, SysbenchCpuOutput):
-    """
-    This is the data structure for all output
-    parameters returned by sysbench cpu benchmark.
-    """
-
-
-@dataclass
-class SysbenchIoOutputParams(SysbenchCommonOutputParams, SysbenchIoOutput):
+class InterferenceWorkload:
     """
-    This is the data structure for all output
-    parameters returned by sysbench io benchmark.
+    A workload of the interference mode. Exactly one of cpu, memory and io
+    must be set.
     """
 
-    ReadWriteratioforcombinedrandomIOtest: typing.Annotated[
-        typing.Optional[float],
-        schema.name("R/W Ratio Random Test"),
-        schema.description("Read/Write Ratio for combined random I/O test"),
+    name: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Name"),
+        schema.description(
+            "Name of the workload in the results, defaults to cpu, memory or io"
+        ),
     ] = None
-
-    NumberofIOrequests: typing.Annotated[
-        typing.Optional[int],
-        schema.name("Number of I/O requests"),
-        schema.description("Number of I/O requests"),
+    cpu: typing.Annotated[
+        typing.Optional[SysbenchCpuInputParams],
+        schema.name("CPU workload"),
+        schema.description("Parameters of a CPU workload"),
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[SysbenchMemoryInputParams],
+        schema.name("Memory workload"),
+        schema.description("Parameters of a Memory workload"),
+    ] = None
+    io: typing.Annotated[
+        typing.Optional[SysbenchIoInputParams],
+        schema.name("I/O workload"),
+        schema.description("Parameters of an I/O workload"),
     ] = None
 
 
 @dataclass
-class WorkloadResultsCpu:
+class SysbenchInterferenceInputParams:
     """
-    This is the output results data structure
-    for the Sysbench CPU success case.
+    This is the data structure for the input parameters of the
+    Sysbench mixed workload interference mode.
     """
 
-    sysbench_output_params: typing.Annotated[
-        SysbenchCpuOutputParams,
-        schema.name("Sysbench Cpu Output Parameters"),
+    primary: typing.Annotated[
+        InterferenceWorkload,
+        schema.name("Primary workload"),
         schema.description(
-            "Ouptut parameters for a successful sysbench cpu workload execution"
+            "Workload whose loss to interference is measured, run alone and"
+            " then alongside every antagonist. Its repetitions apply to every"
+            " phase, and only the runs alone are stored in its store-database"
         ),
     ]
-    sysbench_results: typing.Annotated[
-        SysbenchCpuResultParams,
-        schema.name("Sysbench Cpu Result Parameters"),
+    antagonists: typing.Annotated[
+        typing.List[InterferenceWorkload],
+        validation.min(1),
+        schema.name("Antagonists"),
         schema.description(
-            "Result parameters for a successful sysbench cpu workload execution"
+            "Background workloads run alongside the primary one. Their time is"
+            " replaced so that they run from before the primary workload starts"
+            " until after it ends. They take no repetitions or store-database"
         ),
     ]
+    combined: typing.Annotated[
+        bool,
+        schema.name("Combined"),
+        schema.description(
+            "also run the primary workload alongside all the antagonists at once"
+        ),
+    ] = False
+    antagonist_lead: typing.Annotated[
+        int,
+        validation.min(0),
+        schema.id("antagonist-lead"),
+        schema.name("Antagonist Lead"),
+        schema.description(
+            "Seconds the antagonists run before the primary workload starts"
+            " and after it ends"
+        ),
+    ] = 2
 
 
 @dataclass
-class WorkloadResultsMemory:
-    """
-    This is the output results data structure
-    for the Sysbench memory success case.
-    """
-
+class LatencyPercentile:
+    percentile: typing.Annotated[
+        float,
+        schema.name("Percentile"),
+        schema.description("Requested latency percentile"),
+    ]
+    value: typing.Annotated[
+        float,
+        schema.name("Value"),
+        schema.description("Latency percentile value in milliseconds"),
+    ]
+
+
+@dataclass
+class LatencyAggregates:
+    avg: typing.Annotated[
+        float,
+        schema.name("Average"),
+        schema.description("Average Latency"),
+    ]
+    min: typing.Annotated[
+        float,
+        schema.name("Minimum"),
+        schema.description("Minimum latency"),
+    ]
+    max: typing.Annotated[
+        float,
+        schema.name("Maximum"),
+        schema.description("Maximum Latency"),
+    ]
+    percentile: typing.Annotated[
+        int,
+        schema.name("Percentile"),
+        schema.description("Latency percentile selected for reporting"),
+    ]
+    percentile_value: typing.Annotated[
+        float,
+        schema.name("Latency Percentile Value"),
+        schema.description("Latency percentile value"),
+    ]
+    sum: typing.Annotated[
+        float,
+        schema.name("Sum"),
+        schema.description("Sum of latencies"),
+    ]
+    percentiles: typing.Annotated[
+        typing.Optional[typing.List[LatencyPercentile]],
+        schema.name("Percentiles"),
+        schema.description(
+            "Latency percentiles derived from the latency histogram, in the"
+            " order they were requested"
+        ),
+    ] = None
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    This is the data structure for the latency histogram printed by sysbench,
+    stored as parallel arrays of bucket values and event counts.
+    """
+
+    values: typing.Annotated[
+        typing.List[float],
+        schema.name("Bucket values"),
+        schema.description(
+            "Latency value of each non-empty histogram bucket in milliseconds,"
+            " in ascending order"
+        ),
+    ]
+    counts: typing.Annotated[
+        typing.List[int],
+        schema.name("Bucket counts"),
+        schema.description("Number of events in each histogram bucket"),
+    ]
+
+
+@dataclass
+class ThreadFairnessAggregates:
+    avg: typing.Annotated[
+        float,
+        schema.name("Average"),
+        schema.description("Average value across all threads"),
+    ]
+    stddev: typing.Annotated[
+        float,
+        schema.name("Standard Deviation"),
+        schema.description("Standard deviation of all threads"),
+    ]
+
+
+@dataclass
+class ThreadsFairness:
+    events: typing.Annotated[
+        ThreadFairnessAggregates,
+        schema.name("Thread Fairness events"),
+        schema.description("number of events executed by the threads "),
+    ]
+    executiontime: typing.Annotated[
+        ThreadFairnessAggregates,
+        schema.name("Thread Fairness execution time"),
+        schema.description("Execution time of threads"),
+    ]
+
+
+@dataclass
+class CPUmetrics:
+    eventspersecond: typing.Annotated[
+        float,
+        schema.name("Events per second"),
+        schema.description("Number of events per second to measure CPU speed"),
+    ]
+
+
+@dataclass
+class FileOperationMetrics:
+    reads_s: typing.Annotated[
+        float,
+        schema.name("Read Ops/sec"),
+        schema.description("Read operations per second"),
+    ]
+    writes_s: typing.Annotated[
+        float,
+        schema.name("Write Ops/s"),
+        schema.description("Write Operations per second"),
+    ]
+    fsyncs_s: typing.Annotated[
+        float,
+        schema.name("Fsync/sec"),
+        schema.description("Number of fsync() per second"),
+    ]
+
+
+@dataclass
+class ThroughputMetrics:
+    read_MiB_s: typing.Annotated[
+        float,
+        schema.name("Read Mebibytes/s"),
+        schema.description("Read Mebibyte (2^20 bytes) per second"),
+    ]
+    written_MiB_s: typing.Annotated[
+        float,
+        schema.name("Written Mebibytes/s"),
+        schema.description("Written Mebibyte (2^20 bytes) per second"),
+    ]
+
+
+@dataclass
+class IntervalReport:
+    """
+    This is the data structure for a single intermediate report
+    printed by sysbench when report-interval is enabled.
+    """
+
+    time: typing.Annotated[
+        float,
+        schema.name("Time"),
+        schema.description("Seconds elapsed since the start of the test"),
+    ]
+    threads: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Threads"),
+        schema.description("Number of running threads"),
+    ] = None
+    eventspersecond: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Events per second"),
+        schema.description("Events (or transactions) per second in the interval"),
+    ] = None
+    queriespersecond: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Queries per second"),
+        schema.description("Queries per second in the interval"),
+    ] = None
+    percentile: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Percentile"),
+        schema.description("Latency percentile selected for reporting"),
+    ] = None
+    percentile_value: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Latency Percentile Value"),
+        schema.description("Latency percentile value in milliseconds"),
+    ] = None
+    transferred_MiBpersec: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Transferred memory per second"),
+        schema.description("Memory transferred per second in the interval"),
+    ] = None
+    read_MiB_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Read Mebibytes/s"),
+        schema.description("Read Mebibyte (2^20 bytes) per second"),
+    ] = None
+    written_MiB_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Written Mebibytes/s"),
+        schema.description("Written Mebibyte (2^20 bytes) per second"),
+    ] = None
+    fsyncs_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Fsync/sec"),
+        schema.description("Number of fsync() per second"),
+    ] = None
+    queuelength: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Queue length"),
+        schema.description("Number of queued events when a rate is set"),
+    ] = None
+    concurrency: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Concurrency"),
+        schema.description("Number of events in progress when a rate is set"),
+    ] = None
+
+
+@dataclass
+class MetricStatistics:
+    metric: typing.Annotated[
+        str,
+        schema.name("Metric"),
+        schema.description(
+            "Name of the metric, as the path of the field in the results,"
+            " Latency.p99 for the derived 99th latency percentile, or"
+            " eventspersecond for the total events per second"
+        ),
+    ]
+    mean: typing.Annotated[
+        float,
+        schema.name("Mean"),
+        schema.description("Mean of the metric over all repetitions"),
+    ]
+    samples: typing.Annotated[
+        typing.List[float],
+        schema.name("Samples"),
+        schema.description("Value of the metric in every repetition"),
+    ]
+    stddev: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Standard Deviation"),
+        schema.description("Sample standard deviation of the metric"),
+    ] = None
+    cv: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Coefficient of variation"),
+        schema.description("Standard deviation divided by the mean"),
+    ] = None
+    ci_low: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Confidence interval low"),
+        schema.description("Lower bound of the 95% confidence interval of the mean"),
+    ] = None
+    ci_high: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Confidence interval high"),
+        schema.description("Upper bound of the 95% confidence interval of the mean"),
+    ] = None
+
+
+@dataclass
+class RepetitionStatistics:
+    repetitions: typing.Annotated[
+        int,
+        schema.name("Repetitions"),
+        schema.description("Number of times the workload was run"),
+    ]
+    converged: typing.Annotated[
+        bool,
+        schema.name("Converged"),
+        schema.description(
+            "Whether the runs stopped because the confidence interval was"
+            " within the requested tolerance"
+        ),
+    ]
+    metrics: typing.Annotated[
+        typing.List[MetricStatistics],
+        schema.name("Metrics"),
+        schema.description("Statistics of every numeric result over all runs"),
+    ]
+
+
+@dataclass
+class TelemetrySample:
+    """
+    This is the data structure for a host telemetry sample, covering the
+    time since the previous sample. Metrics the host does not provide are
+    left out.
+    """
+
+    time: typing.Annotated[
+        float,
+        schema.name("Time"),
+        schema.description("Seconds elapsed since sysbench was started"),
+    ]
+    cpu_user: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU user"),
+        schema.description("Percentage of CPU time spent in user mode, niced included"),
+    ] = None
+    cpu_system: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU system"),
+        schema.description("Percentage of CPU time spent in the kernel and interrupts"),
+    ] = None
+    cpu_iowait: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU I/O wait"),
+        schema.description("Percentage of CPU time spent idle waiting for I/O"),
+    ] = None
+    cpu_steal: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU steal"),
+        schema.description("Percentage of CPU time stolen by the hypervisor"),
+    ] = None
+    cpu_frequency_MHz: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU frequency"),
+        schema.description("Mean current frequency over all CPUs in MHz"),
+    ] = None
+    memory_available_MiB: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Memory available"),
+        schema.description("Memory available for new allocations in MiB"),
+    ] = None
+    major_faults_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Major faults/s"),
+        schema.description("Major page faults per second"),
+    ] = None
+    swap_in_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Swap in/s"),
+        schema.description("Pages swapped in per second"),
+    ] = None
+    swap_out_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Swap out/s"),
+        schema.description("Pages swapped out per second"),
+    ] = None
+    disk_read_MiB_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Disk read MiB/s"),
+        schema.description("MiB read per second from all physical disks"),
+    ] = None
+    disk_written_MiB_s: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Disk written MiB/s"),
+        schema.description("MiB written per second to all physical disks"),
+    ] = None
+    disk_busy: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Disk busy"),
+        schema.description(
+            "Percentage of time the busiest physical disk was doing I/O"
+        ),
+    ] = None
+
+
+@dataclass
+class TelemetryAggregate:
+    metric: typing.Annotated[
+        str,
+        schema.name("Metric"),
+        schema.description("Name of the telemetry metric"),
+    ]
+    mean: typing.Annotated[
+        float,
+        schema.name("Mean"),
+        schema.description("Mean of the metric over all samples"),
+    ]
+    min: typing.Annotated[
+        float,
+        schema.name("Minimum"),
+        schema.description("Smallest sample of the metric"),
+    ]
+    max: typing.Annotated[
+        float,
+        schema.name("Maximum"),
+        schema.description("Largest sample of the metric"),
+    ]
+
+
+@dataclass
+class HostTelemetry:
+    interval: typing.Annotated[
+        float,
+        schema.name("Interval"),
+        schema.description("Seconds between samples"),
+    ]
+    samples: typing.Annotated[
+        typing.List[TelemetrySample],
+        schema.name("Samples"),
+        schema.description("Telemetry samples in the order they were taken"),
+    ]
+    aggregates: typing.Annotated[
+        typing.List[TelemetryAggregate],
+        schema.name("Aggregates"),
+        schema.description("Mean, minimum and maximum of every sampled metric"),
+    ]
+
+
+@dataclass
+class ProcessAccounting:
+    user_time: typing.Annotated[
+        typing.Optional[float],
+        schema.name("User CPU time"),
+        schema.description("Seconds of CPU time sysbench spent in user mode"),
+    ] = None
+    system_time: typing.Annotated[
+        typing.Optional[float],
+        schema.name("System CPU time"),
+        schema.description("Seconds of CPU time sysbench spent in the kernel"),
+    ] = None
+    voluntary_context_switches: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Voluntary context switches"),
+        schema.description("Context switches of sysbench waiting for a resource"),
+    ] = None
+    involuntary_context_switches: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Involuntary context switches"),
+        schema.description("Context switches of sysbench preempted by the scheduler"),
+    ] = None
+    major_faults: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Major page faults"),
+        schema.description("Page faults of sysbench which needed I/O"),
+    ] = None
+    minor_faults: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Minor page faults"),
+        schema.description("Page faults of sysbench served from memory"),
+    ] = None
+    peak_rss_KiB: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Peak RSS KiB"),
+        schema.description("Largest resident set size of sysbench in KiB"),
+    ] = None
+    read_bytes: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Read bytes"),
+        schema.description("Bytes sysbench caused to be read from storage"),
+    ] = None
+    write_bytes: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Write bytes"),
+        schema.description("Bytes sysbench caused to be written to storage"),
+    ] = None
+    read_chars: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Read characters"),
+        schema.description(
+            "Bytes sysbench read with read system calls, including the page cache"
+        ),
+    ] = None
+    written_chars: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Written characters"),
+        schema.description(
+            "Bytes sysbench wrote with write system calls, including the page cache"
+        ),
+    ] = None
+    read_syscalls: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Read system calls"),
+        schema.description("Number of read system calls of sysbench"),
+    ] = None
+    write_syscalls: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Write system calls"),
+        schema.description("Number of write system calls of sysbench"),
+    ] = None
+    events_per_cpu_second: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Events per CPU second"),
+        schema.description("Events performed per second of CPU time of sysbench"),
+    ] = None
+    cpu_utilization: typing.Annotated[
+        typing.Optional[float],
+        schema.name("CPU utilization"),
+        schema.description("CPU time of sysbench divided by the total time, in CPUs"),
+    ] = None
+    context_switches_per_event: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Context switches per event"),
+        schema.description("Voluntary and involuntary context switches per event"),
+    ] = None
+    bytes_per_syscall: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Bytes per system call"),
+        schema.description("Bytes read and written per read or write system call"),
+    ] = None
+
+
+@dataclass
+class SteadyState:
+    detected: typing.Annotated[
+        bool,
+        schema.name("Detected"),
+        schema.description(
+            "Whether the workload reached steady state. Otherwise the statistics"
+            " cover the whole run"
+        ),
+    ]
+    measuredtime: typing.Annotated[
+        float,
+        schema.name("Measured time"),
+        schema.description("Seconds of the run the reported statistics cover"),
+    ]
+    discardedtime: typing.Annotated[
+        float,
+        schema.name("Discarded time"),
+        schema.description("Seconds before steady state left out of the statistics"),
+    ]
+    discardedevents: typing.Annotated[
+        int,
+        schema.name("Discarded events"),
+        schema.description("Events before steady state left out of the statistics"),
+    ]
+    start: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Start"),
+        schema.description(
+            "Seconds from the start of the test at which the first stable"
+            " window began"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchCommonOutputParams:
+    """
+    This is the data structure for common output
+    parameters returned by sysbench benchmarks.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    totaltime: typing.Annotated[
+        float,
+        schema.name("Total time"),
+        schema.description("Total execution time of workload"),
+    ]
+    totalnumberofevents: typing.Annotated[
+        int,
+        schema.name("Total number of events"),
+        schema.description("Total number of events performed by the workload"),
+    ]
+    Numberofthreads: typing.Annotated[
+        int,
+        schema.name("Number of threads"),
+        schema.description("Number of threads used by the workload"),
+    ]
+    Validationchecks: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Validation checks"),
+        schema.description("Validation on/off"),
+    ] = None
+    cpuaffinity: typing.Annotated[
+        typing.Optional[str],
+        schema.name("CPU affinity"),
+        schema.description("List of CPUs sysbench was allowed to run on"),
+    ] = None
+    processaccounting: typing.Annotated[
+        typing.Optional[ProcessAccounting],
+        schema.name("Process accounting"),
+        schema.description(
+            "Resource usage of the sysbench process and the efficiency derived"
+            " from it"
+        ),
+    ] = None
+    steadystate: typing.Annotated[
+        typing.Optional[SteadyState],
+        schema.name("Steady state"),
+        schema.description(
+            "Part of the run the statistics cover, when steady-state detection"
+            " is enabled"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchMemoryOutput:
+    """
+    This is the data structure for specific output
+    parameters returned by sysbench memory benchmark.
+    """
+
+    blocksize: typing.Annotated[
+        str,
+        schema.name("Block size"),
+        schema.description("Block size in KiB"),
+    ]
+    totalsize: typing.Annotated[
+        str,
+        schema.name("Total size"),
+        schema.description("Total size in MiB"),
+    ]
+    operation: typing.Annotated[
+        str,
+        schema.name("Operation"),
+        schema.description("memory operation performed"),
+    ]
+    scope: typing.Annotated[
+        str,
+        schema.name("Scope"),
+        schema.description("scope of operation"),
+    ]
+    Totaloperationspersecond: typing.Annotated[
+        float,
+        schema.name("Total operations per second"),
+        schema.description(
+            "Total number of operations performed by the memory workload" " per second"
+        ),
+    ]
+    Totaloperations: typing.Annotated[
+        int,
+        schema.name("Total operations"),
+        schema.description(
+            "Total number of operations performed by the memory workload"
+        ),
+    ]
+    memory_access_mode: typing.Annotated[
+        SeqRnd,
+        schema.name("Memory Access Mode"),
+        schema.description("memory access mode (seq,rnd)"),
+    ]
+
+
+@dataclass
+class SysbenchCpuOutput:
+    """
+    This is the data structure for specific output
+    parameters returned by sysbench cpu benchmark.
+    """
+
+    Primenumberslimit: typing.Annotated[
+        int,
+        schema.name("Prime numbers limit"),
+        schema.description("Number of prime numbers to use for CPU workload"),
+    ]
+
+
+@dataclass
+class SysbenchIoOutput:
+    """
+    This is the data structure for specific output
+    parameters returned by sysbench io benchmark.
+    """
+
+    Extrafileopenflags: typing.Annotated[
+        str,
+        schema.name("File Open Flags"),
+        schema.description("File Open Flags"),
+    ]
+
+
+@dataclass
+class CheckpointStatistics:
+    """
+    This is the data structure for the statistics common to every
+    report checkpoint segment.
+    """
+
+    checkpoint: typing.Annotated[
+        float,
+        schema.name("Checkpoint"),
+        schema.description(
+            "Seconds elapsed from the start of the test when the checkpoint"
+            " was reported"
+        ),
+    ]
+    totaltime: typing.Annotated[
+        float,
+        schema.name("Total time"),
+        schema.description("Execution time of the segment ending at the checkpoint"),
+    ]
+    totalnumberofevents: typing.Annotated[
+        int,
+        schema.name("Total number of events"),
+        schema.description("Number of events performed during the segment"),
+    ]
+
+
+@dataclass
+class SysbenchMemoryCheckpoint(CheckpointStatistics):
+    """
+    This is the data structure for the statistics of one report checkpoint
+    segment of the sysbench memory benchmark.
+    """
+
+    transferred_MiB: typing.Annotated[
+        float,
+        schema.name("Transferred memory"),
+        schema.description("Memory transferred during the segment"),
+    ]
+    transferred_MiBpersec: typing.Annotated[
+        float,
+        schema.name("Transferred memory per second"),
+        schema.description("Memory transferred per second during the segment"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Latency in milliseconds during the segment"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+
+
+@dataclass
+class SysbenchCpuCheckpoint(CheckpointStatistics):
+    """
+    This is the data structure for the statistics of one report checkpoint
+    segment of the sysbench cpu benchmark.
+    """
+
+    CPUspeed: typing.Annotated[
+        CPUmetrics,
+        schema.name("CPU speed"),
+        schema.description("No of events per second during the segment"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Latency in milliseconds during the segment"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+
+
+@dataclass
+class SysbenchIoCheckpoint(CheckpointStatistics):
+    """
+    This is the data structure for the statistics of one report checkpoint
+    segment of the sysbench io benchmark.
+    """
+
+    Fileoperations: typing.Annotated[
+        FileOperationMetrics,
+        schema.name("FileOperations"),
+        schema.description("File Operation Metrics during the segment"),
+    ]
+    Throughput: typing.Annotated[
+        ThroughputMetrics,
+        schema.name("Throughput"),
+        schema.description("Throughput metrics during the segment"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Latency in milliseconds during the segment"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+
+
+@dataclass
+class SysbenchThreadsCheckpoint(CheckpointStatistics):
+    """
+    This is the data structure for the statistics of one report checkpoint
+    segment of the sysbench threads and mutex benchmarks and Lua workloads.
+    """
+
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Latency in milliseconds during the segment"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+
+
+@dataclass
+class SysbenchMemoryResultParams:
+    """
+    This is the output results data structure for sysbench memory results.
+    """
+
+    transferred_MiB: typing.Annotated[
+        float,
+        schema.name("Transferred memory"),
+        schema.description("Total Memory Transferred"),
+    ]
+    transferred_MiBpersec: typing.Annotated[
+        float,
+        schema.name("Transferred memory per second"),
+        schema.description("Total Memory Transferred per second"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Memory Latency in milli seconds"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+    Checkpoints: typing.Annotated[
+        typing.Optional[typing.List[SysbenchMemoryCheckpoint]],
+        schema.name("Checkpoints"),
+        schema.description(
+            "Full statistics of every report checkpoint segment. The other"
+            " results then cover the time after the last checkpoint"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchCpuResultParams:
+    """
+    This is the output results data structure for sysbench cpu results.
+    """
+
+    CPUspeed: typing.Annotated[
+        CPUmetrics,
+        schema.name("CPU speed"),
+        schema.description("No of events per second"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("CPU latency in milliseconds"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+    Checkpoints: typing.Annotated[
+        typing.Optional[typing.List[SysbenchCpuCheckpoint]],
+        schema.name("Checkpoints"),
+        schema.description(
+            "Full statistics of every report checkpoint segment. The other"
+            " results then cover the time after the last checkpoint"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchIoResultParams:
+    """
+    This is the output results data structure for sysbench io results.
+    """
+
+    Fileoperations: typing.Annotated[
+        FileOperationMetrics,
+        schema.name("FileOperations"),
+        schema.description("File Operation Metrics"),
+    ]
+    Throughput: typing.Annotated[
+        ThroughputMetrics,
+        schema.name("Throughput"),
+        schema.description("Throughput metrics"),
+    ]
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("latency in milliseconds"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+    Checkpoints: typing.Annotated[
+        typing.Optional[typing.List[SysbenchIoCheckpoint]],
+        schema.name("Checkpoints"),
+        schema.description(
+            "Full statistics of every report checkpoint segment. The other"
+            " results then cover the time after the last checkpoint"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchThreadsResultParams:
+    """
+    This is the output results data structure for sysbench threads results.
+    """
+
+    Latency: typing.Annotated[
+        LatencyAggregates,
+        schema.name("Latency"),
+        schema.description("Latency of an event in milliseconds"),
+    ]
+    Threadsfairness: typing.Annotated[
+        ThreadsFairness,
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ]
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+    Checkpoints: typing.Annotated[
+        typing.Optional[typing.List[SysbenchThreadsCheckpoint]],
+        schema.name("Checkpoints"),
+        schema.description(
+            "Full statistics of every report checkpoint segment. The other"
+            " results then cover the time after the last checkpoint"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchMutexResultParams(SysbenchThreadsResultParams):
+    """
+    This is the output results data structure for sysbench mutex results.
+    Every thread runs a single event of mutex-locks lock acquisitions.
+    """
+
+
+@dataclass
+class SysbenchLuaResultParams:
+    """
+    This is the output results data structure for sysbench Lua results.
+    Scripts replacing the report hooks may leave the standard sections out.
+    """
+
+    Latency: typing.Annotated[
+        typing.Optional[LatencyAggregates],
+        schema.name("Latency"),
+        schema.description("Latency of an event in milliseconds"),
+    ] = None
+    Threadsfairness: typing.Annotated[
+        typing.Optional[ThreadsFairness],
+        schema.name("Threads fairness"),
+        schema.description(
+            "Event distribution by threads for number of executed events"
+            " by threads and total execution time by thread"
+        ),
+    ] = None
+    Latencyhistogram: typing.Annotated[
+        typing.Optional[LatencyHistogram],
+        schema.name("Latency histogram"),
+        schema.description("Latency histogram, when histogram is enabled"),
+    ] = None
+    Checkpoints: typing.Annotated[
+        typing.Optional[typing.List[SysbenchThreadsCheckpoint]],
+        schema.name("Checkpoints"),
+        schema.description(
+            "Full statistics of every report checkpoint segment. The other"
+            " results then cover the time after the last checkpoint"
+        ),
+    ] = None
+    custommetrics: typing.Annotated[
+        typing.Optional[typing.Dict[str, float]],
+        schema.name("Custom metrics"),
+        schema.description(
+            'Numeric "key: value" lines printed by the script, over the whole'
+            ' run. Counters printed as "count (rate per sec.)" also give a'
+            ' "<key> per second" metric, and repeated keys add up'
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchMemoryOutputParams(SysbenchCommonOutputParams, SysbenchMemoryOutput):
+    """
+    This is the data structure for all output
+    parameters returned by sysbench memory benchmark.
+    """
+
+
+@dataclass
+class SysbenchCpuOutputParams(SysbenchCommonOutputParams, SysbenchCpuOutput):
+    """
+    This is the data structure for all output
+    parameters returned by sysbench cpu benchmark.
+    """
+
+
+@dataclass
+class SysbenchIoOutputParams(SysbenchCommonOutputParams, SysbenchIoOutput):
+    """
+    This is the data structure for all output
+    parameters returned by sysbench io benchmark.
+    """
+
+    ReadWriteratioforcombinedrandomIOtest: typing.Annotated[
+        typing.Optional[float],
+        schema.name("R/W Ratio Random Test"),
+        schema.description("Read/Write Ratio for combined random I/O test"),
+    ] = None
+
+    NumberofIOrequests: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Number of I/O requests"),
+        schema.description("Number of I/O requests"),
+    ] = None
+
+    Preparedfilesreused: typing.Annotated[
+        typing.Optional[bool],
+        schema.name("Prepared files reused"),
+        schema.description(
+            "Whether the test files prepared by an earlier run were reused"
+        ),
+    ] = None
+
+
+@dataclass
+class SysbenchThreadsOutputParams(SysbenchCommonOutputParams):
+    """
+    This is the data structure for all output
+    parameters returned by sysbench threads benchmark.
+    """
+
+
+@dataclass
+class SysbenchMutexOutputParams(SysbenchCommonOutputParams):
+    """
+    This is the data structure for all output
+    parameters returned by sysbench mutex benchmark.
+    """
+
+
+@dataclass
+class SysbenchLuaOutputParams:
+    """
+    This is the data structure for all output
+    parameters returned by a sysbench Lua workload.
+    Scripts replacing the report hooks print no general statistics, so
+    unlike the other workloads the total time and events are optional.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    Numberofthreads: typing.Annotated[
+        int,
+        schema.name("Number of threads"),
+        schema.description("Number of threads used by the workload"),
+    ]
+    totaltime: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Total time"),
+        schema.description("Total execution time of workload"),
+    ] = None
+    totalnumberofevents: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Total number of events"),
+        schema.description("Total number of events performed by the workload"),
+    ] = None
+    Validationchecks: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Validation checks"),
+        schema.description("Validation on/off"),
+    ] = None
+    cpuaffinity: typing.Annotated[
+        typing.Optional[str],
+        schema.name("CPU affinity"),
+        schema.description("List of CPUs sysbench was allowed to run on"),
+    ] = None
+    processaccounting: typing.Annotated[
+        typing.Optional[ProcessAccounting],
+        schema.name("Process accounting"),
+        schema.description(
+            "Resource usage of the sysbench process and the efficiency derived"
+            " from it"
+        ),
+    ] = None
+    steadystate: typing.Annotated[
+        typing.Optional[SteadyState],
+        schema.name("Steady state"),
+        schema.description(
+            "Part of the run the statistics cover, when steady-state detection"
+            " is enabled"
+        ),
+    ] = None
+    script: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Script"),
+        schema.description("Path of the script file, unless the script was inline"),
+    ] = None
+
+
+@dataclass
+class SysbenchCpuInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench cpu instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchCpuOutputParams,
+        schema.name("Sysbench Cpu Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchCpuResultParams,
+        schema.name("Sysbench Cpu Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class SysbenchMemoryInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench memory instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchMemoryOutputParams,
+        schema.name("Sysbench Memory Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchMemoryResultParams,
+        schema.name("Sysbench Memory Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class SysbenchIoInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench io instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchIoOutputParams,
+        schema.name("Sysbench Io Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchIoResultParams,
+        schema.name("Sysbench Io Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class SysbenchThreadsInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench threads instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchThreadsOutputParams,
+        schema.name("Sysbench Threads Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchThreadsResultParams,
+        schema.name("Sysbench Threads Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class SysbenchMutexInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench mutex instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchMutexOutputParams,
+        schema.name("Sysbench Mutex Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchMutexResultParams,
+        schema.name("Sysbench Mutex Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class SysbenchLuaInstance:
+    """
+    This is the data structure for the results of a single
+    sysbench Lua instance of a multi-instance run.
+    """
+
+    instance: typing.Annotated[
+        int,
+        schema.name("Instance"),
+        schema.description("Index of the instance"),
+    ]
+    sysbench_output_params: typing.Annotated[
+        SysbenchLuaOutputParams,
+        schema.name("Sysbench Lua Output Parameters"),
+        schema.description("Output parameters of the instance"),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchLuaResultParams,
+        schema.name("Sysbench Lua Result Parameters"),
+        schema.description("Result parameters of the instance"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description("Intermediate statistics reported by the instance"),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsCpu:
+    """
+    This is the output results data structure
+    for the Sysbench CPU success case.
+    """
+
+    sysbench_output_params: typing.Annotated[
+        SysbenchCpuOutputParams,
+        schema.name("Sysbench Cpu Output Parameters"),
+        schema.description(
+            "Ouptut parameters for a successful sysbench cpu workload execution"
+        ),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchCpuResultParams,
+        schema.name("Sysbench Cpu Result Parameters"),
+        schema.description(
+            "Result parameters for a successful sysbench cpu workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchCpuInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsMemory:
+    """
+    This is the output results data structure
+    for the Sysbench memory success case.
+    """
+
     sysbench_output_params: typing.Annotated[
         SysbenchMemoryOutputParams,
         schema.name("Sysbench Memory Output Parameters"),
         schema.description(
-            "Ouptut parameters for a successful sysbench memory workload execution"
+            "Ouptut parameters for a successful sysbench memory workload execution"
+        ),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchMemoryResultParams,
+        schema.name("Sysbench Memory Result Parameters"),
+        schema.description(
+            "Result parameters for a successful sysbench Memory workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchMemoryInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsIo:
+    """
+    This is the output results data structure
+    for the Sysbench io success case.
+    """
+
+    sysbench_output_params: typing.Annotated[
+        SysbenchIoOutputParams,
+        schema.name("Sysbench Io Output Parameters"),
+        schema.description(
+            "Ouptut parameters for a successful sysbench io workload execution"
+        ),
+    ]
+
+    sysbench_results: typing.Annotated[
+        SysbenchIoResultParams,
+        schema.name("Sysbench io Result Parameters"),
+        schema.description(
+            "Result parameters for a successful io Memory workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchIoInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsThreads:
+    """
+    This is the output results data structure
+    for the Sysbench threads success case.
+    """
+
+    sysbench_output_params: typing.Annotated[
+        SysbenchThreadsOutputParams,
+        schema.name("Sysbench Threads Output Parameters"),
+        schema.description(
+            "Output parameters for a successful sysbench threads workload execution"
+        ),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchThreadsResultParams,
+        schema.name("Sysbench Threads Result Parameters"),
+        schema.description(
+            "Result parameters for a successful sysbench threads workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchThreadsInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsMutex:
+    """
+    This is the output results data structure
+    for the Sysbench mutex success case.
+    """
+
+    sysbench_output_params: typing.Annotated[
+        SysbenchMutexOutputParams,
+        schema.name("Sysbench Mutex Output Parameters"),
+        schema.description(
+            "Output parameters for a successful sysbench mutex workload execution"
+        ),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchMutexResultParams,
+        schema.name("Sysbench Mutex Result Parameters"),
+        schema.description(
+            "Result parameters for a successful sysbench mutex workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchMutexInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsLua:
+    """
+    This is the output results data structure
+    for the Sysbench Lua success case.
+    """
+
+    sysbench_output_params: typing.Annotated[
+        SysbenchLuaOutputParams,
+        schema.name("Sysbench Lua Output Parameters"),
+        schema.description(
+            "Output parameters for a successful sysbench Lua workload execution"
+        ),
+    ]
+    sysbench_results: typing.Annotated[
+        SysbenchLuaResultParams,
+        schema.name("Sysbench Lua Result Parameters"),
+        schema.description(
+            "Result parameters for a successful sysbench Lua workload execution"
+        ),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics reported by sysbench at every"
+            " report-interval, in order of arrival"
+        ),
+    ] = None
+    sysbench_repetitions: typing.Annotated[
+        typing.Optional[RepetitionStatistics],
+        schema.name("Sysbench Repetition Statistics"),
+        schema.description("Statistics over all runs, when the workload is repeated"),
+    ] = None
+    sysbench_instances: typing.Annotated[
+        typing.Optional[typing.List[SysbenchLuaInstance]],
+        schema.name("Sysbench Instances"),
+        schema.description(
+            "Results of every instance when several instances are run"
+            " concurrently. The other results are then merged over all instances"
+        ),
+    ] = None
+    sysbench_telemetry: typing.Annotated[
+        typing.Optional[HostTelemetry],
+        schema.name("Host Telemetry"),
+        schema.description(
+            "Host telemetry sampled while sysbench ran, when telemetry-interval"
+            " is set"
+        ),
+    ] = None
+
+
+@dataclass
+class ThreadScalingPoint:
+    threads: typing.Annotated[
+        int,
+        schema.name("Threads"),
+        schema.description("Number of worker threads"),
+    ]
+    eventspersecond: typing.Annotated[
+        float,
+        schema.name("Events per second"),
+        schema.description("Number of events per second with this many threads"),
+    ]
+    speedup: typing.Annotated[
+        float,
+        schema.name("Speedup"),
+        schema.description("Events per second relative to the single thread run"),
+    ]
+    efficiency: typing.Annotated[
+        float,
+        schema.name("Parallel efficiency"),
+        schema.description("Speedup divided by the number of threads"),
+    ]
+    latency_avg: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Average latency"),
+        schema.description("Average latency of an event in milliseconds"),
+    ] = None
+    latency_percentile_value: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Latency percentile value"),
+        schema.description(
+            "Latency of an event in milliseconds at the percentile of the workload"
+        ),
+    ] = None
+    context_switches_per_event: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Context switches per event"),
+        schema.description(
+            "Context switches of sysbench per event, which grow with the"
+            " contention for locks"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsThreadScaling:
+    """
+    This is the output results data structure
+    for the Sysbench thread scaling success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    points: typing.Annotated[
+        typing.List[ThreadScalingPoint],
+        schema.name("Scaling points"),
+        schema.description("Throughput and efficiency for every thread count"),
+    ]
+    serial_fraction: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Serial fraction"),
+        schema.description(
+            "Serial fraction of the workload fitted to Amdahl's law, or none"
+            " when only the single thread run was done"
+        ),
+    ] = None
+
+
+@dataclass
+class RateSweepPoint:
+    target_rate: typing.Annotated[
+        int,
+        schema.name("Target rate"),
+        schema.description("Events per second sysbench was asked to run"),
+    ]
+    eventspersecond: typing.Annotated[
+        float,
+        schema.name("Events per second"),
+        schema.description("Events per second sysbench achieved"),
+    ]
+    achieved_fraction: typing.Annotated[
+        float,
+        schema.name("Achieved fraction"),
+        schema.description(
+            "Achieved events per second as a fraction of the target rate,"
+            " below 1 once the system cannot keep up"
+        ),
+    ]
+    latency_avg: typing.Annotated[
+        float,
+        schema.name("Average latency"),
+        schema.description(
+            "Average latency of an event in milliseconds, including the time"
+            " it was queued"
+        ),
+    ]
+    latency_percentile_value: typing.Annotated[
+        float,
+        schema.name("Latency percentile value"),
+        schema.description(
+            "Latency of an event in milliseconds at the percentile of the workload"
+        ),
+    ]
+    load: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Load"),
+        schema.description(
+            "Target rate as a fraction of the unthrottled throughput, when it"
+            " was calibrated"
+        ),
+    ] = None
+    latency_percentiles: typing.Annotated[
+        typing.Optional[typing.List[LatencyPercentile]],
+        schema.name("Latency percentiles"),
+        schema.description(
+            "Latency percentiles, when percentiles are requested, averaged over"
+            " the repetitions like the other metrics of the point"
+        ),
+    ] = None
+    queuelength_avg: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Average queue length"),
+        schema.description(
+            "Mean number of queued events over the intermediate reports"
+        ),
+    ] = None
+    queuelength_max: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Maximum queue length"),
+        schema.description(
+            "Largest number of queued events over the intermediate reports"
+        ),
+    ] = None
+    concurrency_max: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Maximum concurrency"),
+        schema.description(
+            "Largest number of events in progress over the intermediate reports"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsRateSweep:
+    """
+    This is the output results data structure
+    for the Sysbench rate sweep success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    points: typing.Annotated[
+        typing.List[RateSweepPoint],
+        schema.name("Sweep points"),
+        schema.description(
+            "Achieved rate, queueing and latency for every target rate, from"
+            " the lowest to the highest"
+        ),
+    ]
+    unthrottled_eventspersecond: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Unthrottled events per second"),
+        schema.description(
+            "Events per second of the unthrottled calibration run, when the"
+            " target rates were not given"
+        ),
+    ] = None
+
+
+@dataclass
+class RateProbe:
+    rate: typing.Annotated[
+        int,
+        schema.name("Rate"),
+        schema.description("Events per second sysbench was asked to run"),
+    ]
+    eventspersecond: typing.Annotated[
+        float,
+        schema.name("Events per second"),
+        schema.description("Events per second sysbench achieved"),
+    ]
+    latency: typing.Annotated[
+        float,
+        schema.name("Latency"),
+        schema.description(
+            "Latency in milliseconds at the SLO percentile, the worst one over"
+            " all repetitions when the workload is repeated"
+        ),
+    ]
+    latency_met: typing.Annotated[
+        bool,
+        schema.name("Latency met"),
+        schema.description("Whether the latency stayed under the SLO"),
+    ]
+    rate_met: typing.Annotated[
+        bool,
+        schema.name("Rate met"),
+        schema.description(
+            "Whether sysbench achieved at least min-achieved-fraction of the rate"
+        ),
+    ]
+    sustained: typing.Annotated[
+        bool,
+        schema.name("Sustained"),
+        schema.description("Whether both the latency and the rate were met"),
+    ]
+
+
+@dataclass
+class WorkloadResultsMaxRate:
+    """
+    This is the output results data structure
+    for the Sysbench maximum sustainable rate search success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    probes: typing.Annotated[
+        typing.List[RateProbe],
+        schema.name("Probes"),
+        schema.description("Trace of the probe runs, in the order they were run"),
+    ]
+    confirmed: typing.Annotated[
+        bool,
+        schema.name("Confirmed"),
+        schema.description(
+            "Whether the confirmation run sustained the rate found by the search"
+        ),
+    ]
+    sustainable_rate: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Sustainable rate"),
+        schema.description(
+            "Highest rate in events per second found to meet the SLO, or none"
+            " when even the minimum rate did not"
+        ),
+    ] = None
+    confirmation: typing.Annotated[
+        typing.Optional[RateProbe],
+        schema.name("Confirmation"),
+        schema.description(
+            "Full length run at the sustainable rate, when one was found"
+        ),
+    ] = None
+    unthrottled_eventspersecond: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Unthrottled events per second"),
+        schema.description(
+            "Events per second of the unthrottled probe run, when max-rate was"
+            " not given"
+        ),
+    ] = None
+
+
+@dataclass
+class InterferenceRun:
+    eventspersecond: typing.Annotated[
+        float,
+        schema.name("Events per second"),
+        schema.description("Events per second of the primary workload"),
+    ]
+    latency_avg: typing.Annotated[
+        float,
+        schema.name("Average latency"),
+        schema.description("Average latency of an event in milliseconds"),
+    ]
+    latency_percentile: typing.Annotated[
+        int,
+        schema.name("Latency percentile"),
+        schema.description("Percentile of the tail latency"),
+    ]
+    latency_percentile_value: typing.Annotated[
+        float,
+        schema.name("Latency percentile value"),
+        schema.description("Tail latency of an event in milliseconds"),
+    ]
+
+
+@dataclass
+class InterferenceResult(InterferenceRun):
+    antagonist: typing.Annotated[
+        str,
+        schema.name("Antagonist"),
+        schema.description(
+            "Name of the antagonist, or combined for all the antagonists at once"
+        ),
+    ]
+    throughput_loss: typing.Annotated[
+        float,
+        schema.name("Throughput loss"),
+        schema.description(
+            "Fraction of the events per second of the primary workload lost to"
+            " the antagonist"
+        ),
+    ]
+    latency_avg_increase: typing.Annotated[
+        float,
+        schema.name("Average latency increase"),
+        schema.description(
+            "Relative increase of the average latency of the primary workload"
+        ),
+    ]
+    tail_latency_increase: typing.Annotated[
+        float,
+        schema.name("Tail latency increase"),
+        schema.description(
+            "Relative increase of the tail latency of the primary workload"
+        ),
+    ]
+    antagonist_eventspersecond: typing.Annotated[
+        typing.Optional[typing.List[float]],
+        schema.name("Antagonist events per second"),
+        schema.description("Events per second of every antagonist of the run"),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsInterference:
+    """
+    This is the output results data structure
+    for the Sysbench interference mode success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    primary: typing.Annotated[
+        str,
+        schema.name("Primary"),
+        schema.description("Name of the primary workload"),
+    ]
+    baseline: typing.Annotated[
+        InterferenceRun,
+        schema.name("Baseline"),
+        schema.description("Primary workload running alone"),
+    ]
+    interference: typing.Annotated[
+        typing.List[InterferenceResult],
+        schema.name("Interference"),
+        schema.description(
+            "Primary workload running alongside every antagonist, and all of"
+            " them when combined is set"
+        ),
+    ]
+
+
+@dataclass
+class IoMatrixPoint:
+    file_test_mode: typing.Annotated[
+        FileTestMode,
+        schema.name("File Test Mode"),
+        schema.description("Test mode of this combination"),
+    ]
+    reads_s: typing.Annotated[
+        float,
+        schema.name("Read Ops/sec"),
+        schema.description("Read operations per second"),
+    ]
+    writes_s: typing.Annotated[
+        float,
+        schema.name("Write Ops/s"),
+        schema.description("Write Operations per second"),
+    ]
+    fsyncs_s: typing.Annotated[
+        float,
+        schema.name("Fsync/sec"),
+        schema.description("Number of fsync() per second"),
+    ]
+    read_MiB_s: typing.Annotated[
+        float,
+        schema.name("Read Mebibytes/s"),
+        schema.description("Read Mebibyte (2^20 bytes) per second"),
+    ]
+    written_MiB_s: typing.Annotated[
+        float,
+        schema.name("Written Mebibytes/s"),
+        schema.description("Written Mebibyte (2^20 bytes) per second"),
+    ]
+    latency_avg: typing.Annotated[
+        float,
+        schema.name("Average Latency"),
+        schema.description("Average latency in milliseconds"),
+    ]
+    latency_percentile_value: typing.Annotated[
+        float,
+        schema.name("Latency Percentile Value"),
+        schema.description(
+            "Latency percentile value in milliseconds, for the percentile"
+            " selected for reporting"
+        ),
+    ]
+    file_block_size: typing.Annotated[
+        typing.Optional[int],
+        schema.name("File Block Size"),
+        schema.description(
+            "Block size of this combination, none for the sysbench default"
+        ),
+    ] = None
+    file_io_mode: typing.Annotated[
+        typing.Optional[FileIoMode],
+        schema.name("File I/O Mode"),
+        schema.description(
+            "File operations mode of this combination, none for the sysbench default"
+        ),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[int],
+        schema.name("Threads"),
+        schema.description(
+            "Number of worker threads of this combination, none for the"
+            " sysbench default"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsIoMatrix:
+    """
+    This is the output results data structure
+    for the Sysbench I/O test matrix success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    Preparedfilesreused: typing.Annotated[
+        bool,
+        schema.name("Prepared files reused"),
+        schema.description(
+            "Whether the test files prepared by an earlier run were reused"
+        ),
+    ]
+    points: typing.Annotated[
+        typing.List[IoMatrixPoint],
+        schema.name("Matrix points"),
+        schema.description("Results of every combination, in the order they were run"),
+    ]
+
+
+@dataclass
+class QueueDepthPoint:
+    threads: typing.Annotated[
+        int,
+        schema.name("Threads"),
+        schema.description("Number of worker threads of this point"),
+    ]
+    file_async_backlog: typing.Annotated[
+        int,
+        schema.name("File Async Backlog"),
+        schema.description("Asynchronous operations queued per thread"),
+    ]
+    queue_depth: typing.Annotated[
+        int,
+        schema.name("Queue Depth"),
+        schema.description(
+            "Asynchronous operations queued over all threads, the threads"
+            " times the backlog"
+        ),
+    ]
+    iops: typing.Annotated[
+        float,
+        schema.name("IOPS"),
+        schema.description("Read and write operations per second"),
+    ]
+    read_MiB_s: typing.Annotated[
+        float,
+        schema.name("Read Mebibytes/s"),
+        schema.description("Read Mebibyte (2^20 bytes) per second"),
+    ]
+    written_MiB_s: typing.Annotated[
+        float,
+        schema.name("Written Mebibytes/s"),
+        schema.description("Written Mebibyte (2^20 bytes) per second"),
+    ]
+    latency_avg: typing.Annotated[
+        float,
+        schema.name("Average Latency"),
+        schema.description("Average latency in milliseconds"),
+    ]
+    latency_percentile_value: typing.Annotated[
+        float,
+        schema.name("Latency Percentile Value"),
+        schema.description(
+            "Latency percentile value in milliseconds, for the percentile"
+            " selected for reporting"
+        ),
+    ]
+
+
+@dataclass
+class QueueDepthKnee:
+    threads: typing.Annotated[
+        int,
+        schema.name("Threads"),
+        schema.description("Number of worker threads of the knee"),
+    ]
+    file_async_backlog: typing.Annotated[
+        int,
+        schema.name("File Async Backlog"),
+        schema.description("Asynchronous operations queued per thread at the knee"),
+    ]
+    queue_depth: typing.Annotated[
+        int,
+        schema.name("Queue Depth"),
+        schema.description("Asynchronous operations queued over all threads"),
+    ]
+    iops: typing.Annotated[
+        float,
+        schema.name("IOPS"),
+        schema.description("Read and write operations per second at the knee"),
+    ]
+    latency_avg: typing.Annotated[
+        float,
+        schema.name("Average Latency"),
+        schema.description("Average latency in milliseconds at the knee"),
+    ]
+    saturated: typing.Annotated[
+        bool,
+        schema.name("Saturated"),
+        schema.description(
+            "Whether deeper queues were run past the knee without improving"
+            " the IOPS. Otherwise the knee is the deepest point and the device"
+            " may not be saturated yet"
         ),
     ]
-    sysbench_results: typing.Annotated[
-        SysbenchMemoryResultParams,
-        schema.name("Sysbench Memory Result Parameters"),
+    latency_added: typing.Annotated[
+        float,
+        schema.name("Latency Added"),
         schema.description(
-            "Result parameters for a successful sysbench Memory workload execution"
+            "Average latency of the deepest queue minus the one at the knee,"
+            " in milliseconds"
         ),
     ]
 
 
 @dataclass
-class WorkloadResultsIo:
+class WorkloadResultsIoQueueDepth:
     """
     This is the output results data structure
-    for the Sysbench io success case.
+    for the Sysbench I/O queue depth sweep success case.
     """
 
-    sysbench_output_params: typing.Annotated[
-        SysbenchIoOutputParams,
-        schema.name("Sysbench Io Output Parameters"),
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    Preparedfilesreused: typing.Annotated[
+        bool,
+        schema.name("Prepared files reused"),
         schema.description(
-            "Ouptut parameters for a successful sysbench io workload execution"
+            "Whether the test files prepared by an earlier run were reused"
+        ),
+    ]
+    points: typing.Annotated[
+        typing.List[QueueDepthPoint],
+        schema.name("Sweep points"),
+        schema.description(
+            "IOPS and latency of every thread count and queue depth, in the"
+            " order they were run"
+        ),
+    ]
+    knees: typing.Annotated[
+        typing.List[QueueDepthKnee],
+        schema.name("Knees"),
+        schema.description("Saturation knee of the queue depths of every thread count"),
+    ]
+    knee: typing.Annotated[
+        QueueDepthKnee,
+        schema.name("Knee"),
+        schema.description(
+            "Saturation knee over all points ordered by their total queue depth"
         ),
     ]
 
-    sysbench_results: typing.Annotated[
-        SysbenchIoResultParams,
-        schema.name("Sysbench io Result Parameters"),
+
+@dataclass
+class CacheLevel:
+    level: typing.Annotated[
+        int,
+        schema.name("Level"),
+        schema.description("Level of the cache"),
+    ]
+    type: typing.Annotated[
+        str,
+        schema.name("Type"),
+        schema.description("Type of the cache as reported by sysfs"),
+    ]
+    size: typing.Annotated[
+        int,
+        schema.name("Size"),
+        schema.description("Size of the cache in bytes"),
+    ]
+
+
+@dataclass
+class CacheSweepPoint:
+    working_set: typing.Annotated[
+        int,
+        schema.name("Working set"),
+        schema.description("Memory block size of the run in bytes"),
+    ]
+    transferred_MiBpersec: typing.Annotated[
+        float,
+        schema.name("Transferred memory per second"),
+        schema.description("Memory bandwidth with this working set size"),
+    ]
+    cache_level: typing.Annotated[
+        str,
+        schema.name("Cache level"),
         schema.description(
-            "Result parameters for a successful io Memory workload execution"
+            "Smallest cache level the working set fits in, or DRAM when it"
+            " exceeds the last level cache"
+        ),
+    ]
+
+
+@dataclass
+class CachePlateau:
+    cache_level: typing.Annotated[
+        str,
+        schema.name("Cache level"),
+        schema.description(
+            "Cache level holding the largest working set of the plateau, or DRAM"
+        ),
+    ]
+    min_working_set: typing.Annotated[
+        int,
+        schema.name("Minimum working set"),
+        schema.description("Smallest working set size of the plateau in bytes"),
+    ]
+    max_working_set: typing.Annotated[
+        int,
+        schema.name("Maximum working set"),
+        schema.description("Largest working set size of the plateau in bytes"),
+    ]
+    transferred_MiBpersec: typing.Annotated[
+        float,
+        schema.name("Transferred memory per second"),
+        schema.description("Mean memory bandwidth over the plateau"),
+    ]
+    points: typing.Annotated[
+        int,
+        schema.name("Points"),
+        schema.description("Number of working set sizes in the plateau"),
+    ]
+
+
+@dataclass
+class WorkloadResultsMemoryCache:
+    """
+    This is the output results data structure
+    for the Sysbench memory cache sweep success case.
+    """
+
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    caches: typing.Annotated[
+        typing.List[CacheLevel],
+        schema.name("Caches"),
+        schema.description(
+            "Data and unified caches of the first CPU the workload ran on"
+        ),
+    ]
+    points: typing.Annotated[
+        typing.List[CacheSweepPoint],
+        schema.name("Sweep points"),
+        schema.description("Memory bandwidth for every working set size"),
+    ]
+    plateaus: typing.Annotated[
+        typing.List[CachePlateau],
+        schema.name("Plateaus"),
+        schema.description("Bandwidth plateaus detected along the sweep"),
+    ]
+
+
+@dataclass
+class WorkloadPartialResults:
+    """
+    This is the output data structure when the watchdog had to stop sysbench,
+    holding what sysbench reported until then.
+    """
+
+    status: typing.Annotated[
+        str,
+        schema.name("Status"),
+        schema.description("Why the results are partial, always timeout"),
+    ]
+    error: typing.Annotated[
+        str,
+        schema.name("Error"),
+        schema.description("Description of the interrupted sysbench run"),
+    ]
+    signal: typing.Annotated[
+        str,
+        schema.name("Signal"),
+        schema.description(
+            "Last signal the watchdog sent to stop sysbench, SIGINT, SIGTERM"
+            " or SIGKILL"
+        ),
+    ]
+    elapsed: typing.Annotated[
+        float,
+        schema.name("Elapsed time"),
+        schema.description("Seconds sysbench ran until it stopped"),
+    ]
+    sysbench_intervals: typing.Annotated[
+        typing.Optional[typing.List[IntervalReport]],
+        schema.name("Sysbench Interval Reports"),
+        schema.description(
+            "Intermediate statistics streamed by sysbench before it was stopped"
+        ),
+    ] = None
+    sysbench_interval_statistics: typing.Annotated[
+        typing.Optional[typing.List[MetricStatistics]],
+        schema.name("Sysbench Interval Statistics"),
+        schema.description(
+            "Statistics of every numeric metric over the intermediate reports"
+        ),
+    ] = None
+    sysbench_checkpoints: typing.Annotated[
+        typing.Optional[typing.List[CheckpointStatistics]],
+        schema.name("Sysbench Checkpoints"),
+        schema.description("Report checkpoints completed before sysbench was stopped"),
+    ] = None
+
+
+@dataclass
+class SysbenchResults:
+    """
+    Results of a sysbench cpu, memory, io, threads, mutex or Lua workload.
+    Exactly one of them must be set.
+    """
+
+    cpu: typing.Annotated[
+        typing.Optional[WorkloadResultsCpu],
+        schema.name("CPU Results"),
+        schema.description("Results of the sysbenchcpu step"),
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[WorkloadResultsMemory],
+        schema.name("Memory Results"),
+        schema.description("Results of the sysbenchmemory step"),
+    ] = None
+    io: typing.Annotated[
+        typing.Optional[WorkloadResultsIo],
+        schema.name("I/O Results"),
+        schema.description("Results of the sysbenchio step"),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[WorkloadResultsThreads],
+        schema.name("Threads Results"),
+        schema.description("Results of the sysbenchthreads step"),
+    ] = None
+    mutex: typing.Annotated[
+        typing.Optional[WorkloadResultsMutex],
+        schema.name("Mutex Results"),
+        schema.description("Results of the sysbenchmutex step"),
+    ] = None
+    lua: typing.Annotated[
+        typing.Optional[WorkloadResultsLua],
+        schema.name("Lua Results"),
+        schema.description("Results of the sysbenchlua step"),
+    ] = None
+
+
+@dataclass
+class SysbenchComparisonInputParams:
+    current: typing.Annotated[
+        SysbenchResults,
+        schema.name("Current Results"),
+        schema.description("Results to check for regressions"),
+    ]
+    baseline: typing.Annotated[
+        typing.Optional[SysbenchResults],
+        schema.name("Baseline Results"),
+        schema.description(
+            "Results to compare against. Exactly one of baseline and"
+            " baseline-file must be set"
+        ),
+    ] = None
+    baseline_file: typing.Annotated[
+        typing.Optional[str],
+        schema.id("baseline-file"),
+        schema.name("Baseline File"),
+        schema.description(
+            "path of a JSON or YAML file holding the baseline results, either"
+            " in the form of baseline or as saved from the output of a workload"
+            " step"
         ),
+    ] = None
+    metrics: typing.Annotated[
+        typing.Optional[typing.List[str]],
+        validation.min(1),
+        schema.name("Metrics"),
+        schema.description(
+            "metrics to compare, named as in the repetition statistics."
+            " Defaults to the events per second and the average and percentile"
+            " latency"
+        ),
+    ] = None
+    max_regression: typing.Annotated[
+        float,
+        validation.min(0.0),
+        schema.id("max-regression"),
+        schema.name("Maximum Regression"),
+        schema.description(
+            "largest change of a metric for the worse, as a fraction of its"
+            " baseline, that still passes"
+        ),
+    ] = 0.05
+    metric_thresholds: typing.Annotated[
+        typing.Optional[typing.Dict[str, float]],
+        schema.id("metric-thresholds"),
+        schema.name("Metric Thresholds"),
+        schema.description("maximum regression of individual metrics"),
+    ] = None
+    alpha: typing.Annotated[
+        float,
+        validation.min(0.0),
+        validation.max(1.0),
+        schema.name("Significance Level"),
+        schema.description(
+            "largest p-value of Welch's t-test for a change to be significant,"
+            " when both results were repeated"
+        ),
+    ] = 0.05
+
+
+@dataclass
+class MetricComparison:
+    metric: typing.Annotated[
+        str,
+        schema.name("Metric"),
+        schema.description("Name of the metric, as in the repetition statistics"),
+    ]
+    baseline: typing.Annotated[
+        float,
+        schema.name("Baseline"),
+        schema.description("Mean of the metric in the baseline"),
+    ]
+    current: typing.Annotated[
+        float,
+        schema.name("Current"),
+        schema.description("Mean of the metric in the current results"),
+    ]
+    delta: typing.Annotated[
+        float,
+        schema.name("Delta"),
+        schema.description("Current minus baseline mean"),
+    ]
+    higher_is_better: typing.Annotated[
+        bool,
+        schema.name("Higher is better"),
+        schema.description("Whether an increase of the metric is an improvement"),
+    ]
+    threshold: typing.Annotated[
+        float,
+        schema.name("Threshold"),
+        schema.description("Maximum regression of the metric"),
+    ]
+    regression: typing.Annotated[
+        bool,
+        schema.name("Regression"),
+        schema.description(
+            "Whether the metric got worse by more than the threshold, and"
+            " significantly so when a p-value is available"
+        ),
+    ]
+    relative_delta: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Relative delta"),
+        schema.description("Delta as a fraction of the baseline mean"),
+    ] = None
+    effect_size: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Effect size"),
+        schema.description("Hedges' g of the change, when both results were repeated"),
+    ] = None
+    p_value: typing.Annotated[
+        typing.Optional[float],
+        schema.name("p-value"),
+        schema.description(
+            "Two-sided p-value of Welch's t-test, when both results were repeated"
+        ),
+    ] = None
+
+
+@dataclass
+class WorkloadComparison:
+    workload: typing.Annotated[
+        str,
+        schema.name("Workload"),
+        schema.description("Workload of the compared results"),
+    ]
+    passed: typing.Annotated[
+        bool,
+        schema.name("Passed"),
+        schema.description("Whether none of the compared metrics regressed"),
+    ]
+    regressions: typing.Annotated[
+        typing.List[str],
+        schema.name("Regressions"),
+        schema.description("Metrics which regressed"),
+    ]
+    metrics: typing.Annotated[
+        typing.List[MetricComparison],
+        schema.name("Metrics"),
+        schema.description("Comparison of every compared metric"),
+    ]
+    baselineversion: typing.Annotated[
+        str,
+        schema.name("Baseline sysbench version"),
+        schema.description("Version of sysbench which produced the baseline"),
+    ]
+    currentversion: typing.Annotated[
+        str,
+        schema.name("Current sysbench version"),
+        schema.description("Version of sysbench which produced the current results"),
+    ]
+
+
+@dataclass
+class SysbenchQueryInputParams:
+    store_database: typing.Annotated[
+        str,
+        schema.id("store-database"),
+        schema.name("Result Store Database"),
+        schema.description("path of the SQLite database the results are stored in"),
+    ]
+    cpu: typing.Annotated[
+        typing.Optional[SysbenchCpuInputParams],
+        schema.name("CPU Configuration"),
+        schema.description("CPU workload parameters whose results to query"),
+    ] = None
+    memory: typing.Annotated[
+        typing.Optional[SysbenchMemoryInputParams],
+        schema.name("Memory Configuration"),
+        schema.description("Memory workload parameters whose results to query"),
+    ] = None
+    io: typing.Annotated[
+        typing.Optional[SysbenchIoInputParams],
+        schema.name("I/O Configuration"),
+        schema.description("I/O workload parameters whose results to query"),
+    ] = None
+    threads: typing.Annotated[
+        typing.Optional[SysbenchThreadsInputParams],
+        schema.name("Threads Configuration"),
+        schema.description("Threads workload parameters whose results to query"),
+    ] = None
+    mutex: typing.Annotated[
+        typing.Optional[SysbenchMutexInputParams],
+        schema.name("Mutex Configuration"),
+        schema.description("Mutex workload parameters whose results to query"),
+    ] = None
+    lua: typing.Annotated[
+        typing.Optional[SysbenchLuaInputParams],
+        schema.name("Lua Configuration"),
+        schema.description("Lua workload parameters whose results to query"),
+    ] = None
+    params_hash: typing.Annotated[
+        typing.Optional[str],
+        schema.id("params-hash"),
+        schema.name("Parameter Hash"),
+        schema.description(
+            "hash of the configuration whose results to query, as stored with"
+            " the results, instead of the workload parameters"
+        ),
+    ] = None
+    workload: typing.Annotated[
+        typing.Optional[StoredWorkload],
+        schema.name("Workload"),
+        schema.description("only query the results of this workload"),
+    ] = None
+    host: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Host"),
+        schema.description("only query the results measured on this host name"),
+    ] = None
+    since: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Since"),
+        schema.description(
+            "only query the results stored after this time, in seconds since"
+            " the epoch"
+        ),
+    ] = None
+    metrics: typing.Annotated[
+        typing.Optional[typing.List[str]],
+        validation.min(1),
+        schema.name("Metrics"),
+        schema.description(
+            "metrics to return and analyze, named as in the repetition"
+            " statistics. Defaults to the events per second"
+        ),
+    ] = None
+    latest: typing.Annotated[
+        int,
+        validation.min(1),
+        schema.name("Latest Results"),
+        schema.description("number of most recent results to return"),
+    ] = 10
+    band_percentiles: typing.Annotated[
+        typing.Optional[
+            typing.List[
+                typing.Annotated[float, validation.min(0.0), validation.max(100.0)]
+            ]
+        ],
+        validation.min(1),
+        schema.id("band-percentiles"),
+        schema.name("Band Percentiles"),
+        schema.description(
+            "percentiles of every metric over the queried results. Defaults to"
+            " 5, 25, 50, 75 and 95"
+        ),
+    ] = None
+
+
+@dataclass
+class StoredResult:
+    id: typing.Annotated[
+        int,
+        schema.name("ID"),
+        schema.description("Identifier of the result in the store"),
+    ]
+    timestamp: typing.Annotated[
+        float,
+        schema.name("Timestamp"),
+        schema.description("Time the result was stored, in seconds since the epoch"),
+    ]
+    host: typing.Annotated[
+        str,
+        schema.name("Host"),
+        schema.description("Name of the host the result was measured on"),
+    ]
+    workload: typing.Annotated[
+        str,
+        schema.name("Workload"),
+        schema.description("Workload of the result"),
+    ]
+    params_hash: typing.Annotated[
+        str,
+        schema.name("Parameter hash"),
+        schema.description("Hash of the configuration of the result"),
+    ]
+    sysbenchversion: typing.Annotated[
+        str,
+        schema.name("Sysbench version"),
+        schema.description("Version as reported by sysbench"),
+    ]
+    metrics: typing.Annotated[
+        typing.Dict[str, float],
+        schema.name("Metrics"),
+        schema.description("Value of every queried metric of the result"),
+    ]
+
+
+@dataclass
+class MetricPercentile:
+    percentile: typing.Annotated[
+        float,
+        schema.name("Percentile"),
+        schema.description("Percentile of the band"),
+    ]
+    value: typing.Annotated[
+        float,
+        schema.name("Value"),
+        schema.description("Value of the metric at the percentile"),
+    ]
+
+
+@dataclass
+class MetricTrend:
+    metric: typing.Annotated[
+        str,
+        schema.name("Metric"),
+        schema.description("Name of the metric"),
+    ]
+    count: typing.Annotated[
+        int,
+        schema.name("Count"),
+        schema.description("Number of queried results with the metric"),
+    ]
+    mean: typing.Annotated[
+        float,
+        schema.name("Mean"),
+        schema.description("Mean of the metric over the queried results"),
+    ]
+    bands: typing.Annotated[
+        typing.List[MetricPercentile],
+        schema.name("Percentile bands"),
+        schema.description("Percentiles of the metric over the queried results"),
+    ]
+    slope_per_day: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Slope per day"),
+        schema.description(
+            "Least squares change of the metric per day over the queried results"
+        ),
+    ] = None
+    relative_slope_per_day: typing.Annotated[
+        typing.Optional[float],
+        schema.name("Relative slope per day"),
+        schema.description("Slope per day as a fraction of the mean"),
+    ] = None
+
+
+@dataclass
+class WorkloadResultsQuery:
+    count: typing.Annotated[
+        int,
+        schema.name("Count"),
+        schema.description("Number of stored results matching the query"),
+    ]
+    latest: typing.Annotated[
+        typing.List[StoredResult],
+        schema.name("Latest results"),
+        schema.description("Most recent matching results, newest first"),
+    ]
+    trends: typing.Annotated[
+        typing.List[MetricTrend],
+        schema.name("Trends"),
+        schema.description("Trend of every queried metric over all matching results"),
     ]
 
 
@@ -788,3 +3990,38 @@ sysbench_memory_output_schema = plugin.build_object_schema(SysbenchMemoryOutputP
 sysbench_memory_results_schema = plugin.build_object_schema(SysbenchMemoryResultParams)
 sysbench_io_output_schema = plugin.build_object_schema(SysbenchIoOutputParams)
 sysbench_io_results_schema = plugin.build_object_schema(SysbenchIoResultParams)
+sysbench_threads_input_schema = plugin.build_object_schema(SysbenchThreadsInputParams)
+sysbench_threads_output_schema = plugin.build_object_schema(SysbenchThreadsOutputParams)
+sysbench_threads_results_schema = plugin.build_object_schema(
+    SysbenchThreadsResultParams
+)
+sysbench_mutex_input_schema = plugin.build_object_schema(SysbenchMutexInputParams)
+sysbench_mutex_output_schema = plugin.build_object_schema(SysbenchMutexOutputParams)
+sysbench_mutex_results_schema = plugin.build_object_schema(SysbenchMutexResultParams)
+sysbench_lua_input_schema = plugin.build_object_schema(SysbenchLuaInputParams)
+sysbench_lua_output_schema = plugin.build_object_schema(SysbenchLuaOutputParams)
+sysbench_lua_results_schema = plugin.build_object_schema(SysbenchLuaResultParams)
+sysbench_interval_schema = plugin.build_object_schema(IntervalReport)
+sysbench_metric_statistics_schema = plugin.build_object_schema(MetricStatistics)
+sysbench_thread_scaling_results_schema = plugin.build_object_schema(
+    WorkloadResultsThreadScaling
+)
+sysbench_memory_cache_results_schema = plugin.build_object_schema(
+    WorkloadResultsMemoryCache
+)
+sysbench_io_matrix_results_schema = plugin.build_object_schema(WorkloadResultsIoMatrix)
+sysbench_io_queue_depth_results_schema = plugin.build_object_schema(
+    WorkloadResultsIoQueueDepth
+)
+sysbench_rate_sweep_results_schema = plugin.build_object_schema(
+    WorkloadResultsRateSweep
+)
+sysbench_max_rate_results_schema = plugin.build_object_schema(WorkloadResultsMaxRate)
+sysbench_interference_results_schema = plugin.build_object_schema(
+    WorkloadResultsInterference
+)
+sysbench_partial_results_schema = plugin.build_object_schema(WorkloadPartialResults)
+sysbench_telemetry_schema = plugin.build_object_schema(HostTelemetry)
+sysbench_results_schema = plugin.build_object_schema(SysbenchResults)
+sysbench_comparison_schema = plugin.build_object_schema(WorkloadComparison)
+sysbench_query_results_schema = plugin.build_object_schema(WorkloadResultsQuery)
@@ -0,0 +1,220 @@
+import math
+import statistics
+
+# Two-sided 95% critical values of Student's t distribution for 1 to 30
+# degrees of freedom
+T_CRITICAL_95 = (
+    12.706,
+    4.303,
+    3.182,
+    2.776,
+    2.571,
+    2.447,
+    2.365,
+    2.306,
+    2.262,
+    2.228,
+    2.201,
+    2.179,
+    2.160,
+    2.145,
+    2.131,
+    2.120,
+    2.110,
+    2.101,
+    2.093,
+    2.086,
+    2.080,
+    2.074,
+    2.069,
+    2.064,
+    2.060,
+    2.056,
+    2.052,
+    2.048,
+    2.045,
+    2.042,
+)
+Z_CRITICAL_95 = 1.959964
+
+
+def t_critical_95(degrees_of_freedom):
+    if degrees_of_freedom <= len(T_CRITICAL_95):
+        return T_CRITICAL_95[degrees_of_freedom - 1]
+    # first order Cornish-Fisher expansion around the normal distribution
+    z = Z_CRITICAL_95
+    return z + (z**3 + z) / (4 * degrees_of_freedom)
+
+
+def summarize(samples):
+    """
+    Return the mean, sample standard deviation, coefficient of variation and
+    95% confidence interval of the mean of the samples.
+    """
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return {"mean": mean, "samples": list(samples)}
+    stddev = statistics.stdev(samples)
+    half_width = t_critical_95(len(samples) - 1) * stddev / math.sqrt(len(samples))
+    summary = {
+        "mean": mean,
+        "stddev": stddev,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+        "samples": list(samples),
+    }
+    if mean != 0:
+        summary["cv"] = stddev / abs(mean)
+    return summary
+
+
+def relative_half_width(summary):
+    """
+    Half-width of the confidence interval relative to the mean, or None when
+    it is undefined.
+    """
+    if "ci_high" not in summary or summary["mean"] == 0:
+        return None
+    return (summary["ci_high"] - summary["mean"]) / abs(summary["mean"])
+
+
+def slope(xs, ys):
+    """
+    Least squares slope of ys over xs, or None when the xs are all equal.
+    """
+    x_mean = statistics.fmean(xs)
+    y_mean = statistics.fmean(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread
+
+
+def quantile(values, fraction):
+    """
+    Quantile of the values, interpolated linearly between the closest ranks.
+    """
+    values = sorted(values)
+    position = fraction * (len(values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def steady_state_start(samples, window, max_cv, max_slope):
+    """
+    Return the index of the first sample of the first window of consecutive
+    samples whose coefficient of variation and least squares slope per
+    sample, relative to the window mean, are within the limits, or None when
+    no window is.
+    """
+    for start, end in enumerate(range(window, len(samples) + 1)):
+        values = samples[start:end]
+        mean = statistics.fmean(values)
+        if mean <= 0:
+            continue
+        if (
+            statistics.stdev(values) / mean <= max_cv
+            and abs(slope(range(window), values)) / mean <= max_slope
+        ):
+            return start
+    return None
+
+
+def beta_fraction(a, b, x):
+    """
+    Continued fraction of the incomplete beta function, evaluated with the
+    modified Lentz method.
+    """
+    tiny = 1e-300
+
+    def clamp(value):
+        return tiny if abs(value) < tiny else value
+
+    c = 1.0
+    d = 1.0 / clamp(1.0 - (a + b) * x / (a + 1.0))
+    fraction = d
+    for m in range(1, 301):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1.0) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1.0)),
+        ):
+            d = 1.0 / clamp(1.0 + numerator * d)
+            c = clamp(1.0 + numerator / c)
+            fraction *= d * c
+        if abs(d * c - 1.0) < 1e-14:
+            break
+    return fraction
+
+
+def incomplete_beta(a, b, x):
+    """
+    Regularized incomplete beta function I_x(a, b).
+    """
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + a * math.log(x)
+        + b * math.log1p(-x)
+    )
+    # the continued fraction converges quickly on this side of the mean
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * beta_fraction(a, b, x) / a
+    return 1.0 - front * beta_fraction(b, a, 1.0 - x) / b
+
+
+def t_p_value(t, degrees_of_freedom):
+    """
+    Two-sided p-value of Student's t distribution.
+    """
+    return incomplete_beta(
+        degrees_of_freedom / 2.0,
+        0.5,
+        degrees_of_freedom / (degrees_of_freedom + t * t),
+    )
+
+
+def welch_p_value(first, second):
+    """
+    Two-sided p-value of Welch's t-test for a difference between the means of
+    two samples with possibly unequal variances, or None when either sample
+    has fewer than two values.
+    """
+    if len(first) < 2 or len(second) < 2:
+        return None
+    first_variance = statistics.variance(first) / len(first)
+    second_variance = statistics.variance(second) / len(second)
+    difference = statistics.fmean(second) - statistics.fmean(first)
+    variance = first_variance + second_variance
+    if variance == 0:
+        return 1.0 if difference == 0 else 0.0
+    degrees_of_freedom = variance**2 / (
+        first_variance**2 / (len(first) - 1) + second_variance**2 / (len(second) - 1)
+    )
+    return t_p_value(difference / math.sqrt(variance), degrees_of_freedom)
+
+
+def hedges_g(first, second):
+    """
+    Standardized difference between the means of two samples, corrected for
+    the bias of small samples, or None when it is undefined.
+    """
+    count = len(first) + len(second)
+    if len(first) < 2 or len(second) < 2:
+        return None
+    pooled = math.sqrt(
+        (
+            (len(first) - 1) * statistics.variance(first)
+            + (len(second) - 1) * statistics.variance(second)
+        )
+        / (count - 2)
+    )
+    if pooled == 0:
+        return None
+    difference = statistics.fmean(second) - statistics.fmean(first)
+    return difference / pooled * (1 - 3 / (4 * count - 9))
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import time
+
+# Statements creating the tables and indexes of a result store. The numeric
+# metrics of every result are kept in their own table, so that trends are
+# queried without decoding the stored results.
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY,
+        timestamp REAL NOT NULL,
+        host TEXT NOT NULL,
+        workload TEXT NOT NULL,
+        params_hash TEXT NOT NULL,
+        sysbenchversion TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        params TEXT NOT NULL,
+        results TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS metrics (
+        result_id INTEGER NOT NULL REFERENCES results(id),
+        metric TEXT NOT NULL,
+        value REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS results_host ON results(host, timestamp)",
+    "CREATE INDEX IF NOT EXISTS results_workload ON results(workload, timestamp)",
+    "CREATE INDEX IF NOT EXISTS results_params ON results(params_hash, timestamp)",
+    "CREATE INDEX IF NOT EXISTS metrics_result ON metrics(result_id, metric)",
+)
+RESULT_COLUMNS = (
+    "id",
+    "timestamp",
+    "host",
+    "workload",
+    "params_hash",
+    "sysbenchversion",
+)
+# Input parameters which do not change the measured configuration
+UNHASHED_PARAMETERS = (
+    "watchdog-timeout",
+    "watchdog-grace",
+    "telemetry-interval",
+    "store-database",
+)
+
+
+def read_cpu_model():
+    try:
+        with open("/proc/cpuinfo", "r") as cpuinfo:
+            for line in cpuinfo:
+                name, _, value = line.partition(":")
+                if name.strip() == "model name":
+                    return value.strip()
+    except OSError:
+        pass
+    return None
+
+
+def host_fingerprint():
+    """
+    Identify the host a result was measured on: its name, kernel, CPU model
+    and size, and machine id when there is one.
+    """
+    uname = os.uname()
+    fingerprint = {
+        "hostname": socket.gethostname(),
+        "kernel": uname.release,
+        "machine": uname.machine,
+        "cpus": os.cpu_count(),
+        "cpu_model": read_cpu_model(),
+        "memory_bytes": os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES"),
+    }
+    try:
+        with open("/etc/machine-id", "r") as machine_id:
+            fingerprint["machine_id"] = machine_id.read().strip()
+    except OSError:
+        pass
+    return fingerprint
+
+
+def parameter_hash(workload, params):
+    """
+    Hash the serialized input parameters of a workload into the identifier
+    of its configuration.
+    """
+    configuration = {
+        key: value for key, value in params.items() if key not in UNHASHED_PARAMETERS
+    }
+    configuration["workload"] = workload
+    return hashlib.sha256(
+        json.dumps(configuration, sort_keys=True).encode()
+    ).hexdigest()
+
+
+def connect(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # concurrent writers wait for each other rather than failing
+    connection = sqlite3.connect(path, timeout=30)
+    with connection:
+        for statement in SCHEMA:
+            connection.execute(statement)
+    return connection
+
+
+def store(path, workload, params, version, results, metrics):
+    """
+    Store a workload result along with its serialized input parameters, the
+    host fingerprint and its numeric metrics. Returns the id of the result.
+    """
+    fingerprint = host_fingerprint()
+    connection = connect(path)
+    try:
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO results (timestamp, host, workload, params_hash,"
+                " sysbenchversion, fingerprint, params, results)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    time.time(),
+                    fingerprint["hostname"],
+                    workload,
+                    parameter_hash(workload, params),
+                    version,
+                    json.dumps(fingerprint, sort_keys=True),
+                    json.dumps(params, sort_keys=True),
+                    json.dumps(results),
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO metrics (result_id, metric, value) VALUES (?, ?, ?)",
+                [
+                    (cursor.lastrowid, metric, value)
+                    for metric, value in metrics.items()
+                ],
+            )
+        return cursor.lastrowid
+    finally:
+        connection.close()
+
+
+def query(path, metrics, workload=None, params_hash=None, host=None, since=None):
+    """
+    Return the stored results matching all the given filters, oldest first,
+    with the values of the requested metrics.
+    """
+    conditions = []
+    arguments = list(metrics)
+    for column, value in (
+        ("workload", workload),
+        ("params_hash", params_hash),
+        ("host", host),
+    ):
+        if value is not None:
+            conditions.append(f"results.{column} = ?")
+            arguments.append(value)
+    if since is not None:
+        conditions.append("results.timestamp >= ?")
+        arguments.append(since)
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    connection = connect(path)
+    try:
+        rows = connection.execute(
+            "SELECT results.id, results.timestamp, results.host, results.workload,"
+            " results.params_hash, results.sysbenchversion, metrics.metric,"
+            " metrics.value FROM results LEFT JOIN metrics"
+            " ON metrics.result_id = results.id AND metrics.metric IN ({}){}"
+            " ORDER BY results.timestamp, results.id".format(
+                ", ".join("?" * len(metrics)), where
+            ),
+            arguments,
+        ).fetchall()
+    finally:
+        connection.close()
+    results = {}
+    for row in rows:
+        result = results.get(row[0])
+        if result is None:
+            result = results[row[0]] = dict(zip(RESULT_COLUMNS, row), metrics={})
+        if row[6] is not None:
+            result["metrics"][row[6]] = row[7]
+    # dictionaries keep the order of the rows
+    return list(results.values())
@@ -0,0 +1,232 @@
+import glob
+import os
+import threading
+import time
+
+SECTOR_SIZE = 512
+MEMINFO_FIELDS = ("MemAvailable",)
+VMSTAT_FIELDS = ("pgmajfault", "pswpin", "pswpout")
+# Metrics of every sample, in the order they are aggregated
+METRICS = (
+    "cpu_user",
+    "cpu_system",
+    "cpu_iowait",
+    "cpu_steal",
+    "cpu_frequency_MHz",
+    "memory_available_MiB",
+    "major_faults_s",
+    "swap_in_s",
+    "swap_out_s",
+    "disk_read_MiB_s",
+    "disk_written_MiB_s",
+    "disk_busy",
+)
+
+
+def read_cpu_times():
+    """
+    Aggregate CPU times from the first line of /proc/stat, in clock ticks.
+    """
+    with open("/proc/stat", "r") as stat:
+        fields = [int(field) for field in stat.readline().split()[1:9]]
+    user, nice, system, idle, iowait, irq, softirq, steal = fields + [0] * (
+        8 - len(fields)
+    )
+    return {
+        "user": user + nice,
+        "system": system + irq + softirq,
+        "idle": idle,
+        "iowait": iowait,
+        "steal": steal,
+    }
+
+
+def read_fields(path, fields):
+    """
+    Read the given fields of a "name value" file like /proc/meminfo or
+    /proc/vmstat.
+    """
+    values = {}
+    with open(path, "r") as counters:
+        for line in counters:
+            name, _, value = line.partition(" ")
+            name = name.rstrip(":")
+            if name in fields:
+                values[name] = int(value.split()[0])
+    return values
+
+
+def physical_disks():
+    # virtual block devices like loop, zram and device mapper have no device
+    return sorted(
+        name
+        for name in os.listdir("/sys/block")
+        if os.path.exists(os.path.join("/sys/block", name, "device"))
+    )
+
+
+def read_diskstats(disks):
+    """
+    Sectors read and written and milliseconds spent doing I/O of every disk.
+    """
+    stats = {}
+    with open("/proc/diskstats", "r") as diskstats:
+        for line in diskstats:
+            fields = line.split()
+            if len(fields) >= 13 and fields[2] in disks:
+                stats[fields[2]] = (int(fields[5]), int(fields[9]), int(fields[12]))
+    return stats
+
+
+def read_cpu_frequency():
+    """
+    Mean current frequency over all CPUs in MHz, or None without cpufreq.
+    """
+    frequencies = []
+    for path in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq"):
+        try:
+            with open(path, "r") as frequency:
+                frequencies.append(int(frequency.read()))
+        except (OSError, ValueError):
+            continue
+    if not frequencies:
+        return None
+    return sum(frequencies) / len(frequencies) / 1000
+
+
+def read_source(read, *args):
+    # sources missing from the host, like /proc/vmstat in some containers,
+    # only leave their metrics out
+    try:
+        return read(*args)
+    except (OSError, ValueError):
+        return None
+
+
+def read_counters(disks):
+    return {
+        "time": time.monotonic(),
+        "cpu": read_source(read_cpu_times),
+        "meminfo": read_source(read_fields, "/proc/meminfo", MEMINFO_FIELDS),
+        "vmstat": read_source(read_fields, "/proc/vmstat", VMSTAT_FIELDS),
+        "disks": read_source(read_diskstats, disks),
+        "frequency": read_source(read_cpu_frequency),
+    }
+
+
+def sample_rates(previous, current, started):
+    """
+    Turn two consecutive counter readings into a sample of utilizations and
+    rates over the time between them.
+    """
+    elapsed = current["time"] - previous["time"]
+    sample = {"time": round(current["time"] - started, 3)}
+    if elapsed <= 0:
+        return sample
+    if current["cpu"] is not None and previous["cpu"] is not None:
+        ticks = {
+            name: current["cpu"][name] - previous["cpu"][name]
+            for name in current["cpu"]
+        }
+        total = sum(ticks.values())
+        if total > 0:
+            for name in ("user", "system", "iowait", "steal"):
+                sample[f"cpu_{name}"] = 100 * ticks[name] / total
+    if current["frequency"] is not None:
+        sample["cpu_frequency_MHz"] = current["frequency"]
+    if current["meminfo"] and "MemAvailable" in current["meminfo"]:
+        sample["memory_available_MiB"] = current["meminfo"]["MemAvailable"] / 1024
+    if current["vmstat"] is not None and previous["vmstat"] is not None:
+        for name, metric in (
+            ("pgmajfault", "major_faults_s"),
+            ("pswpin", "swap_in_s"),
+            ("pswpout", "swap_out_s"),
+        ):
+            if name in current["vmstat"] and name in previous["vmstat"]:
+                sample[metric] = (
+                    current["vmstat"][name] - previous["vmstat"][name]
+                ) / elapsed
+    if current["disks"] and previous["disks"]:
+        deltas = [
+            [now - before for now, before in zip(stats, previous["disks"][disk])]
+            for disk, stats in current["disks"].items()
+            if disk in previous["disks"]
+        ]
+        if deltas:
+            sample["disk_read_MiB_s"] = (
+                sum(delta[0] for delta in deltas) * SECTOR_SIZE / 1024**2 / elapsed
+            )
+            sample["disk_written_MiB_s"] = (
+                sum(delta[1] for delta in deltas) * SECTOR_SIZE / 1024**2 / elapsed
+            )
+            # the busiest disk, as a percentage of the elapsed time
+            sample["disk_busy"] = min(
+                100.0, max(delta[2] for delta in deltas) / 10 / elapsed
+            )
+    return sample
+
+
+def aggregate(samples):
+    aggregates = []
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples if metric in sample]
+        if values:
+            aggregates.append(
+                {
+                    "metric": metric,
+                    "mean": sum(values) / len(values),
+                    "min": min(values),
+                    "max": max(values),
+                }
+            )
+    return aggregates
+
+
+class TelemetrySampler:
+    """
+    Context manager sampling host telemetry from a background thread every
+    interval seconds while it is active. Sample times are relative to
+    entering it. Without an interval it does nothing.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def __enter__(self):
+        if self.interval is None:
+            return self
+        self.disks = read_source(physical_disks) or []
+        self.previous = read_counters(self.disks)
+        self.started = self.previous["time"]
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.thread is None:
+            return
+        self.stopped.set()
+        self.thread.join()
+        # the final partial interval, up to the end of the run
+        self.take_sample()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.take_sample()
+
+    def take_sample(self):
+        current = read_counters(self.disks)
+        self.samples.append(sample_rates(self.previous, current, self.started))
+        self.previous = current
+
+    def results(self):
+        if self.interval is None:
+            return None
+        return {
+            "interval": self.interval,
+            "samples": self.samples,
+            "aggregates": aggregate(self.samples),
+        }
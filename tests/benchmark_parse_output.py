@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the sysbench output parser.
+
+Times read_output and parse_output on a synthetic output with interval
+reports, report checkpoints and latency histograms, the cases that produce
+the longest outputs, as well as on every output of the golden corpus.
+
+Run it from the repository root:
+    python tests/benchmark_parse_output.py [--max-ms N]
+"""
+
+import argparse
+import glob
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "arcaflow_plugin_sysbench")
+)
+import sysbench_plugin  # noqa: E402
+
+GOLDEN = os.path.join(os.path.dirname(__file__), "golden", "*.txt")
+
+STATISTICS = """General statistics:
+    total time:                          5.0001s
+    total number of events:              14640
+
+Latency (ms):
+         min:                                    0.67
+         avg:                                    0.68
+         max:                                    1.56
+         95th percentile:                        0.70
+         sum:                                 9995.74
+
+Threads fairness:
+    events (avg/stddev):           7320.0000/1.50
+    execution time (avg/stddev):   4.9979/0.00
+"""
+
+
+def histogram(buckets):
+    lines = ["Latency histogram (values are in milliseconds)"]
+    lines.append("       value  ------------- distribution ------------- count")
+    for bucket in range(buckets):
+        lines.append(
+            f"{0.5 + bucket * 0.001:12.3f} |{'*' * (bucket % 40):<40} {bucket}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def synthetic_output(seconds, checkpoints, buckets):
+    lines = [
+        "sysbench 1.0.20 (using system LuaJIT 2.1.0-beta3)",
+        "",
+        "Running the test with following options:",
+        "Number of threads: 2",
+        "Report intermediate results every 1 second(s)",
+        "",
+        "Prime numbers limit: 10000",
+        "",
+        "Threads started!",
+        "",
+    ]
+    for second in range(1, seconds + 1):
+        lines.append(f"[ {second}s ] thds: 2 eps: 2918.69 lat (ms,95%): 0.70")
+        if second % (seconds // checkpoints) == 0:
+            lines.append(f"[ {second}s ] Checkpoint report:")
+            lines.append("CPU speed:")
+            lines.append("    events per second:  2927.61")
+            lines.append(histogram(buckets))
+            lines.append(STATISTICS)
+    lines.append("CPU speed:")
+    lines.append("    events per second:  2927.61")
+    lines.append(histogram(buckets))
+    lines.append(STATISTICS)
+    return "\n".join(lines)
+
+
+def parse(output):
+    summary, intervals = sysbench_plugin.read_output(io.StringIO(output))
+    return sysbench_plugin.parse_output(summary), intervals
+
+
+def benchmark(name, output, repeat):
+    runs = min(timeit.repeat(lambda: parse(output), number=1, repeat=repeat))
+    print(
+        f"{name:<50} {len(output) / 1024:10.1f} KiB {runs * 1000:10.3f} ms"
+        f" {len(output) / runs / 1024**2:10.1f} MiB/s"
+    )
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=int, default=3600)
+    parser.add_argument("--checkpoints", type=int, default=60)
+    parser.add_argument("--buckets", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="fail when parsing the synthetic output takes longer than this",
+    )
+    args = parser.parse_args()
+
+    for path in sorted(glob.glob(GOLDEN)):
+        with open(path, "r") as golden:
+            benchmark(os.path.basename(path), golden.read(), args.repeat * 100)
+    runs = benchmark(
+        "synthetic",
+        synthetic_output(args.seconds, args.checkpoints, args.buckets),
+        args.repeat,
+    )
+    if args.max_ms is not None and runs * 1000 > args.max_ms:
+        print(f"Parsing took longer than {args.max_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
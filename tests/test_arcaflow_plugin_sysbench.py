@@ -1,10 +1,42 @@
 #!/usr/bin/env python3
 
+import copy
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
 import unittest
+from unittest import mock
 import sysbench_plugin
 from arcaflow_plugin_sdk import plugin
 
+import sysbench_accounting
+import sysbench_capabilities
+import sysbench_fileset
 import sysbench_schema
+import sysbench_telemetry
+
+
+def fake_capabilities(binary="sysbench", cache_directory=None, test=None):
+    with open("tests/sysbench_help_output.txt", "r") as fhelp:
+        options = sysbench_capabilities.parse_options(fhelp.read())
+    with open("tests/sysbench_fileio_help_output.txt", "r") as fhelp:
+        fileio_options = sysbench_capabilities.parse_options(fhelp.read())
+    return {
+        "version": "sysbench 1.0.20 (using system LuaJIT 2.1.0-beta3)",
+        "options": options,
+        "tests": {
+            "cpu": {"cpu-max-prime": None},
+            "fileio": fileio_options,
+            "threads": {"thread-yields": None, "thread-locks": None},
+            "mutex": {"mutex-num": None, "mutex-locks": None, "mutex-loops": None},
+        },
+    }
 
 
 class SysbenchPluginTest(unittest.TestCase):
@@ -217,6 +249,58 @@ class SysbenchPluginTest(unittest.TestCase):
             output_data.sysbench_results.Threadsfairness.executiontime.avg, 0
         )
 
+    def test_functional_thread_scaling(self):
+        input = sysbench_plugin.SysbenchThreadScalingInputParams(
+            cpu=sysbench_plugin.SysbenchCpuInputParams(time=2),
+            thread_counts=[2],
+        )
+
+        output_id, output_data = sysbench_plugin.RunSysbenchThreadScaling(
+            params=input, run_id="ci_test"
+        )
+
+        self.assertEqual("success", output_id)
+        self.assertEqual([1, 2], [point.threads for point in output_data.points])
+        self.assertEqual(1.0, output_data.points[0].speedup)
+        self.assertGreater(output_data.points[1].eventspersecond, 0)
+        self.assertIsNotNone(output_data.serial_fraction)
+
+    def test_functional_memory_cache(self):
+        input = sysbench_plugin.SysbenchMemoryCacheInputParams(
+            memory=sysbench_plugin.SysbenchMemoryInputParams(threads=1, time=1),
+            working_set_sizes=["4K", "64K", "8M"],
+        )
+
+        output_id, output_data = sysbench_plugin.RunSysbenchMemoryCache(
+            params=input, run_id="ci_test"
+        )
+
+        self.assertEqual("success", output_id)
+        self.assertEqual(3, len(output_data.points))
+        self.assertGreater(output_data.points[0].transferred_MiBpersec, 0)
+        self.assertGreaterEqual(len(output_data.plateaus), 1)
+
+    def test_functional_io_matrix(self):
+        input = sysbench_plugin.SysbenchIoMatrixInputParams(
+            io=sysbench_plugin.SysbenchIoInputParams(
+                file_num=2, file_total_size="12M", time=2
+            ),
+            file_test_modes=[
+                sysbench_schema.FileTestMode.RNDR,
+                sysbench_schema.FileTestMode.SEQRD,
+            ],
+            thread_counts=[1, 2],
+        )
+
+        output_id, output_data = sysbench_plugin.RunSysbenchIoMatrix(
+            params=input, run_id="ci_test"
+        )
+
+        self.assertEqual("success", output_id)
+        self.assertEqual(4, len(output_data.points))
+        self.assertGreater(output_data.points[0].reads_s, 0)
+        self.assertEqual([], glob.glob("test_file.*"))
+
     def test_parsing_function_memory(self):
         sysbench_output = {
             "Numberofthreads": 2,
@@ -317,6 +401,1551 @@ class SysbenchPluginTest(unittest.TestCase):
         self.assertEqual(sysbench_output, output)
         self.assertEqual(sysbench_results, results)
 
+    def test_parsing_golden_corpus(self):
+        results_schemas = {
+            "cpu": sysbench_plugin.sysbench_cpu_results_schema,
+            "memory": sysbench_plugin.sysbench_memory_results_schema,
+            "fileio": sysbench_plugin.sysbench_io_results_schema,
+            "threads": sysbench_plugin.sysbench_threads_results_schema,
+            "mutex": sysbench_plugin.sysbench_mutex_results_schema,
+        }
+        paths = sorted(glob.glob("tests/golden/*.txt"))
+        self.assertTrue(paths)
+        for path in paths:
+            with self.subTest(path=path):
+                with open(path, "r") as fout:
+                    summary, _ = sysbench_plugin.read_output(fout)
+                output, results = sysbench_plugin.parse_output(summary)
+                with open(path[: -len(".txt")] + ".json", "r") as fexpected:
+                    expected = json.load(fexpected)
+                self.assertEqual(expected["output"], output)
+                self.assertEqual(expected["results"], results)
+                # files are named sysbench_<version>_<workload>_<variant>.txt
+                workload = os.path.basename(path).split("_")[2]
+                results_schemas[workload].unserialize(results)
+
+        output, results = sysbench_plugin.parse_output(
+            "Running the test with following options:\n"
+            "Number of threads: 2\n"
+            "WARNING: option: deprecated\n"
+        )
+        self.assertEqual({"Numberofthreads": 2}, output)
+
+    def test_interval_reports(self):
+        with open("tests/cpu_interval_output.txt", "r") as fout:
+            summary, intervals = sysbench_plugin.read_output(fout)
+
+        self.assertEqual(5, len(intervals))
+        self.assertEqual(
+            {
+                "time": 3.0,
+                "threads": 2,
+                "eventspersecond": 1468.50,
+                "percentile": 95,
+                "percentile_value": 5.37,
+            },
+            intervals[2],
+        )
+        self.assertNotIn("thds:", summary)
+
+        output, results = sysbench_plugin.parse_output(summary)
+        self.assertEqual(13185, output["totalnumberofevents"])
+        self.assertEqual(2636.63, results["CPUspeed"]["eventspersecond"])
+
+        memory = sysbench_plugin.parse_interval("[ 7s ] 6822.78 MiB/sec")
+        self.assertEqual({"time": 7.0, "transferred_MiBpersec": 6822.78}, memory)
+
+        io = sysbench_plugin.parse_interval(
+            "[ 1s ] reads: 0.00 MiB/s writes: 9.42 MiB/s fsyncs: 77.87/s"
+            " latency (ms,95%): 5.092"
+        )
+        self.assertEqual(9.42, io["written_MiB_s"])
+        self.assertEqual(77.87, io["fsyncs_s"])
+        self.assertEqual(5.092, io["percentile_value"])
+
+        _, rate_intervals = sysbench_plugin.read_output(
+            [
+                "[ 1s ] thds: 2 eps: 100.00 lat (ms,95%): 0.70\n",
+                "[ 1s ] queue length: 3, concurrency: 2\n",
+            ]
+        )
+        self.assertEqual(1, len(rate_intervals))
+        self.assertEqual(3, rate_intervals[0]["queuelength"])
+        self.assertEqual(2, rate_intervals[0]["concurrency"])
+
+        self.assertIsNone(sysbench_plugin.parse_interval("Threads started!"))
+        self.assertIsNone(sysbench_plugin.parse_interval("[ 10s ] Checkpoint report:"))
+
+    def test_parsing_function_histogram(self):
+        with open("tests/cpu_histogram_output.txt", "r") as fout:
+            cpu_output = fout.read()
+
+        output, results = sysbench_plugin.parse_output(cpu_output)
+        self.assertEqual(29238, output["totalnumberofevents"])
+        self.assertEqual(
+            {
+                "values": [
+                    0.669,
+                    0.681,
+                    0.693,
+                    0.705,
+                    0.718,
+                    0.731,
+                    0.794,
+                    1.016,
+                    1.556,
+                ],
+                "counts": [1204, 25811, 1919, 182, 61, 34, 17, 9, 1],
+            },
+            results["Latencyhistogram"],
+        )
+        self.assertEqual(
+            output["totalnumberofevents"],
+            sum(results["Latencyhistogram"]["counts"]),
+        )
+
+        cpu_results = sysbench_plugin.sysbench_cpu_results_schema.unserialize(results)
+        self.assertEqual(9, len(cpu_results.Latencyhistogram.values))
+        plugin.test_object_serialization(cpu_results)
+
+    def test_histogram_percentiles(self):
+        histogram = {
+            "values": [0.669, 0.681, 0.693, 0.705, 1.556],
+            "counts": [10, 80, 5, 4, 1],
+        }
+        percentiles = sysbench_plugin.histogram_percentiles(
+            histogram, [99.0, 50.0, 0.0, 95.0, 99.9, 100.0]
+        )
+        self.assertEqual(
+            [
+                {"percentile": 99.0, "value": 0.705},
+                {"percentile": 50.0, "value": 0.681},
+                {"percentile": 0.0, "value": 0.669},
+                {"percentile": 95.0, "value": 0.693},
+                {"percentile": 99.9, "value": 1.556},
+                {"percentile": 100.0, "value": 1.556},
+            ],
+            percentiles,
+        )
+        self.assertEqual(
+            [],
+            sysbench_plugin.histogram_percentiles({"values": [], "counts": []}, [50]),
+        )
+
+        params = sysbench_plugin.SysbenchCpuInputParams(
+            threads=2, percentiles=[50.0, 99.0]
+        )
+        flags = sysbench_plugin.get_sysbench_flags(
+            sysbench_plugin.sysbench_cpu_input_schema, params
+        )
+        self.assertIn("--histogram=on", flags)
+        self.assertNotIn("percentiles", " ".join(flags))
+
+    def test_parsing_function_checkpoints(self):
+        with open("tests/memory_checkpoint_output.txt", "r") as fout:
+            mem_output = fout.read()
+
+        output, results = sysbench_plugin.parse_output(mem_output)
+        self.assertEqual(34993012, output["totalnumberofevents"])
+        self.assertEqual(34172.86, results["transferred_MiB"])
+        self.assertEqual(0.11, results["Latency"]["max"])
+
+        checkpoints = results["Checkpoints"]
+        self.assertEqual(2, len(checkpoints))
+        self.assertEqual(
+            {
+                "checkpoint": 10.0,
+                "totaltime": 5.0001,
+                "totalnumberofevents": 31806425,
+                "transferred_MiB": 31060.96,
+                "transferred_MiBpersec": 6212.06,
+                "Latency": {
+                    "min": 0.00,
+                    "avg": 0.00,
+                    "max": 1.02,
+                    "percentile": 95,
+                    "percentile_value": 0.00,
+                    "sum": 6976.27,
+                },
+                "Threadsfairness": {
+                    "events": {"avg": 15903212.5, "stddev": 102011.5},
+                    "executiontime": {"avg": 3.4881, "stddev": 0.01},
+                },
+            },
+            checkpoints[1],
+        )
+        self.assertEqual(5.0, checkpoints[0]["checkpoint"])
+
+        memory_results = sysbench_plugin.sysbench_memory_results_schema.unserialize(
+            results
+        )
+        plugin.test_object_serialization(memory_results)
+
+        params = sysbench_plugin.SysbenchMemoryInputParams(report_checkpoints=[5, 10])
+        flags = sysbench_plugin.get_sysbench_flags(
+            sysbench_plugin.sysbench_memory_input_schema, params
+        )
+        self.assertIn("--report-checkpoints=5,10", flags)
+
+    def test_thread_scaling(self):
+        def run_workload(params, version):
+            # Amdahl's law with a serial fraction of 0.1
+            speedup = 1 / (0.1 + 0.9 / params.threads)
+            return types.SimpleNamespace(
+                sysbench_output_params=types.SimpleNamespace(
+                    totalnumberofevents=int(1000 * speedup * 10),
+                    totaltime=10.0,
+                    processaccounting=None,
+                ),
+                sysbench_results=types.SimpleNamespace(
+                    Latency=types.SimpleNamespace(
+                        avg=params.threads / speedup, percentile_value=2.0
+                    )
+                ),
+                sysbench_repetitions=None,
+            )
+
+        scaling = sysbench_plugin.thread_scaling(
+            run_workload,
+            sysbench_plugin.SysbenchCpuInputParams(threads=8),
+            [8, 4, 2],
+            "sysbench 1.0.20",
+        )
+        self.assertEqual([1, 2, 4, 8], [p["threads"] for p in scaling["points"]])
+        self.assertEqual(1000.0, scaling["points"][0]["eventspersecond"])
+        self.assertAlmostEqual(1 / 0.2125, scaling["points"][3]["speedup"], 2)
+        self.assertAlmostEqual(
+            scaling["points"][3]["speedup"] / 8, scaling["points"][3]["efficiency"]
+        )
+        self.assertAlmostEqual(0.1, scaling["serial_fraction"], 3)
+        self.assertAlmostEqual(1.7, scaling["points"][3]["latency_avg"], 2)
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_thread_scaling_results_schema.unserialize(scaling)
+        )
+
+        self.assertIsNone(
+            sysbench_plugin.amdahl_serial_fraction(
+                [{"threads": 1, "speedup": 1.0, "eventspersecond": 1.0}]
+            )
+        )
+        thread_counts = sysbench_plugin.default_thread_counts()
+        self.assertEqual(1, thread_counts[0])
+        self.assertEqual(os.cpu_count(), thread_counts[-1])
+
+    def test_repetitions(self):
+        with open("tests/cpu_parse_output.txt", "r") as fout:
+            cpu_output = fout.read()
+        output, results = sysbench_plugin.parse_output(cpu_output)
+        output["sysbenchversion"] = "sysbench 1.0.20"
+        runs = []
+
+        def run_workload(params, version):
+            # every run is 1% faster than the previous one
+            run_output = dict(output)
+            run_output["totalnumberofevents"] = int(29281 * (1 + len(runs) / 100))
+            run_results = copy.deepcopy(results)
+            run_results["Latency"]["percentiles"] = [
+                {"percentile": 99.0, "value": 1.0 + len(runs) / 10},
+                {"percentile": 99.9, "value": 5.0},
+            ]
+            runs.append(run_output)
+            return sysbench_plugin.WorkloadResultsCpu(
+                sysbench_plugin.sysbench_cpu_output_schema.unserialize(run_output),
+                sysbench_plugin.sysbench_cpu_results_schema.unserialize(run_results),
+            )
+
+        params = sysbench_plugin.SysbenchCpuInputParams(repetitions=10)
+        workload_results = sysbench_plugin.run_repeated(run_workload, params, "")
+        statistics = workload_results.sysbench_repetitions
+        self.assertEqual(10, statistics.repetitions)
+        self.assertFalse(statistics.converged)
+        metrics = {metric.metric: metric for metric in statistics.metrics}
+        self.assertIn("CPUspeed.eventspersecond", metrics)
+        self.assertIn("Latency.max", metrics)
+        self.assertNotIn("Latency.percentile", metrics)
+        self.assertEqual(0.0, metrics["Latency.max"].stddev)
+        self.assertNotIn("Latency.percentiles", metrics)
+        self.assertEqual(
+            [1.0 + run / 10 for run in range(10)], metrics["Latency.p99"].samples
+        )
+        self.assertAlmostEqual(1.45, metrics["Latency.p99"].mean)
+        self.assertEqual(5.0, metrics["Latency.p99.9"].mean)
+        self.assertAlmostEqual(
+            1.45, sysbench_plugin.result_metric(workload_results, "Latency.p99")
+        )
+        eventspersecond = metrics["eventspersecond"]
+        self.assertEqual(10, len(eventspersecond.samples))
+        self.assertLess(eventspersecond.ci_low, eventspersecond.mean)
+        self.assertGreater(eventspersecond.ci_high, eventspersecond.mean)
+        self.assertAlmostEqual(
+            eventspersecond.mean,
+            sysbench_plugin.events_per_second(workload_results),
+        )
+        plugin.test_object_serialization(workload_results)
+
+        runs.clear()
+        params = sysbench_plugin.SysbenchCpuInputParams(
+            repetitions=10, repetitions_tolerance=0.05
+        )
+        workload_results = sysbench_plugin.run_repeated(run_workload, params, "")
+        self.assertEqual(3, workload_results.sysbench_repetitions.repetitions)
+        self.assertTrue(workload_results.sysbench_repetitions.converged)
+
+        runs.clear()
+        params = sysbench_plugin.SysbenchCpuInputParams(repetitions=1)
+        workload_results = sysbench_plugin.run_repeated(run_workload, params, "")
+        self.assertEqual(1, len(runs))
+        self.assertIsNone(workload_results.sysbench_repetitions)
+
+    def test_cpu_affinity(self):
+        self.assertEqual(
+            {0, 1, 2, 3, 8, 10, 11}, sysbench_plugin.parse_cpu_list("0-3,8,10-11\n")
+        )
+        self.assertEqual(
+            "0-3,8,10-11", sysbench_plugin.format_cpu_list({11, 10, 8, 3, 2, 1, 0})
+        )
+
+        available = os.sched_getaffinity(0)
+        self.assertIsNone(
+            sysbench_plugin.get_cpu_affinity(sysbench_plugin.SysbenchCpuInputParams())
+        )
+        params = sysbench_plugin.SysbenchCpuInputParams(
+            cpu_list=sysbench_plugin.format_cpu_list(available)
+        )
+        self.assertEqual(available, sysbench_plugin.get_cpu_affinity(params))
+        flags = sysbench_plugin.get_sysbench_flags(
+            sysbench_plugin.sysbench_cpu_input_schema, params
+        )
+        self.assertNotIn("cpu-list", " ".join(flags))
+        self.assertEqual(
+            ["taskset", "-c", "0-1,4", "sysbench", "--threads=2", "cpu", "run"],
+            sysbench_plugin.sysbench_command(["--threads=2"], "cpu", "run", {0, 1, 4}),
+        )
+        self.assertEqual(
+            ["sysbench", "cpu", "run"],
+            sysbench_plugin.sysbench_command([], "cpu", "run"),
+        )
+
+        params = sysbench_plugin.SysbenchCpuInputParams(cpu_list="100000")
+        with self.assertRaises(Exception) as context:
+            sysbench_plugin.get_cpu_affinity(params)
+        self.assertEqual(1, context.exception.args[0])
+
+        params = sysbench_plugin.SysbenchCpuInputParams(numa_node=100000)
+        with self.assertRaises(Exception) as context:
+            sysbench_plugin.get_cpu_affinity(params)
+        self.assertEqual(1, context.exception.args[0])
+
+    def test_instances(self):
+        def cpu_results(file_name, cpuaffinity):
+            with open(file_name, "r") as fout:
+                summary, _ = sysbench_plugin.read_output(fout)
+            output, results = sysbench_plugin.parse_output(summary)
+            output["sysbenchversion"] = "sysbench 1.0.20"
+            output["cpuaffinity"] = cpuaffinity
+            return sysbench_plugin.WorkloadResultsCpu(
+                sysbench_plugin.sysbench_cpu_output_schema.unserialize(output),
+                sysbench_plugin.sysbench_cpu_results_schema.unserialize(results),
+            )
+
+        merged = sysbench_plugin.merge_instances(
+            [
+                cpu_results("tests/cpu_parse_output.txt", "0-1"),
+                cpu_results("tests/cpu_interval_output.txt", "2-3"),
+            ]
+        )
+        self.assertEqual(2, len(merged.sysbench_instances))
+        self.assertEqual(1, merged.sysbench_instances[1].instance)
+        output_params = merged.sysbench_output_params
+        self.assertEqual(4, output_params.Numberofthreads)
+        self.assertEqual(29281 + 13185, output_params.totalnumberofevents)
+        self.assertEqual(10.0005, output_params.totaltime)
+        self.assertEqual("0-3", output_params.cpuaffinity)
+        results = merged.sysbench_results
+        self.assertAlmostEqual(2927.61 + 2636.63, results.CPUspeed.eventspersecond)
+        self.assertEqual(0.67, results.Latency.min)
+        self.assertEqual(9.81, results.Latency.max)
+        self.assertAlmostEqual(19995.74 + 9993.17, results.Latency.sum)
+        self.assertAlmostEqual(
+            (19995.74 + 9993.17) / (29281 + 13185), results.Latency.avg
+        )
+        self.assertEqual(0.70, results.Latency.percentile_value)
+        self.assertAlmostEqual(
+            (14640.5 + 6592.5) / 2, results.Threadsfairness.events.avg
+        )
+        # the spread between the instances dominates the pooled deviation
+        self.assertGreater(results.Threadsfairness.events.stddev, 4000)
+        plugin.test_object_serialization(merged)
+
+        histogram = sysbench_plugin.merge_histograms(
+            [
+                {"values": [0.5, 1.0], "counts": [2, 1]},
+                {"values": [1.0, 2.0], "counts": [3, 4]},
+            ]
+        )
+        self.assertEqual({"values": [0.5, 1.0, 2.0], "counts": [2, 4, 4]}, histogram)
+
+        calls = []
+
+        def run_workload(params, version, ready=None):
+            calls.append((params.cpu_list, params.instances))
+            ready()
+            return cpu_results("tests/cpu_parse_output.txt", params.cpu_list)
+
+        params = sysbench_plugin.SysbenchCpuInputParams(
+            instances=2, instance_cpu_lists=["0", "1"]
+        )
+        merged = sysbench_plugin.run_instances(run_workload, params, "")
+        self.assertEqual([("0", None), ("1", None)], sorted(calls))
+        self.assertEqual("0-1", merged.sysbench_output_params.cpuaffinity)
+
+        params = sysbench_plugin.SysbenchCpuInputParams(
+            instances=3, instance_cpu_lists=["0", "1"]
+        )
+        with self.assertRaises(Exception):
+            sysbench_plugin.run_instances(run_workload, params, "")
+
+    def test_memory_cache_sweep(self):
+        self.assertEqual(48 * 1024, sysbench_plugin.parse_size("48K\n"))
+        self.assertEqual(4 * 1024, sysbench_plugin.parse_size("4KiB"))
+        self.assertEqual(2 * 1024**2, sysbench_plugin.parse_size("2M"))
+        with self.assertRaises(Exception):
+            sysbench_plugin.parse_size("lots")
+        self.assertEqual("48K", sysbench_plugin.format_size(48 * 1024))
+        self.assertEqual("1G", sysbench_plugin.format_size(1024**3))
+
+        caches = [
+            {"level": 1, "type": "Data", "size": 32 * 1024},
+            {"level": 2, "type": "Unified", "size": 1024**2},
+            {"level": 3, "type": "Unified", "size": 32 * 1024**2},
+        ]
+        self.assertEqual("L1", sysbench_plugin.cache_level_name(32 * 1024, caches))
+        self.assertEqual("L2", sysbench_plugin.cache_level_name(64 * 1024, caches))
+        self.assertEqual("DRAM", sysbench_plugin.cache_level_name(64 * 1024**2, caches))
+        working_sets = sysbench_plugin.default_working_sets(caches, 4)
+        self.assertEqual(4 * 1024, working_sets[0])
+        self.assertEqual(128 * 1024**2, working_sets[-1])
+        self.assertEqual("100G", sysbench_plugin.point_total_size(None, 4 * 1024, 100))
+        self.assertEqual(
+            "12800M", sysbench_plugin.point_total_size("1G", 128 * 1024**2, 100)
+        )
+
+        bandwidths = {
+            4: 100000.0,
+            16: 98000.0,
+            64: 60000.0,
+            256: 61000.0,
+            4096: 30000.0,
+            16384: 29000.0,
+            65536: 9000.0,
+            262144: 8800.0,
+        }
+        points = [
+            {
+                "working_set": size * 1024,
+                "transferred_MiBpersec": bandwidth,
+                "cache_level": sysbench_plugin.cache_level_name(size * 1024, caches),
+            }
+            for size, bandwidth in bandwidths.items()
+        ]
+        plateaus = sysbench_plugin.detect_plateaus(points, 0.15, caches)
+        self.assertEqual(
+            ["L1", "L2", "L3", "DRAM"], [plateau["cache_level"] for plateau in plateaus]
+        )
+        self.assertEqual(99000.0, plateaus[0]["transferred_MiBpersec"])
+        self.assertEqual(64 * 1024, plateaus[1]["min_working_set"])
+        self.assertEqual(256 * 1024, plateaus[1]["max_working_set"])
+        self.assertEqual(2, plateaus[3]["points"])
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_memory_cache_results_schema.unserialize(
+                {
+                    "sysbenchversion": "sysbench 1.0.20",
+                    "caches": caches,
+                    "points": points,
+                    "plateaus": plateaus,
+                }
+            )
+        )
+
+    def test_prepared_fileset(self):
+        params = sysbench_schema.SysbenchIoInputParams(
+            file_num=2, file_total_size="2M", file_block_size=4096
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            key = sysbench_fileset.fileset_key(params, directory)
+            self.assertFalse(sysbench_fileset.is_prepared(directory, key))
+
+            for number in range(2):
+                with open(os.path.join(directory, f"test_file.{number}"), "wb") as f:
+                    f.write(b"\0" * 1024)
+            sysbench_fileset.write_manifest(directory, key)
+            self.assertTrue(sysbench_fileset.is_prepared(directory, key))
+
+            other = sysbench_schema.SysbenchIoInputParams(
+                file_num=4, file_total_size="2M", file_block_size=4096
+            )
+            self.assertFalse(
+                sysbench_fileset.is_prepared(
+                    directory, sysbench_fileset.fileset_key(other, directory)
+                )
+            )
+
+            with open(os.path.join(directory, "test_file.1"), "ab") as f:
+                f.write(b"\0")
+            self.assertFalse(sysbench_fileset.is_prepared(directory, key))
+
+            sysbench_fileset.evict(directory)
+            self.assertEqual([], os.listdir(directory))
+
+    def test_capabilities(self):
+        with tempfile.TemporaryDirectory() as directory:
+            binary = os.path.join(directory, "sysbench")
+            general_help = os.path.abspath("tests/sysbench_help_output.txt")
+            fileio_help = os.path.abspath("tests/sysbench_fileio_help_output.txt")
+            with open(binary, "w") as script:
+                script.write(
+                    "#!/bin/sh\n"
+                    f'echo "$@" >> {directory}/calls\n'
+                    'case "$1" in\n'
+                    '--version) echo "sysbench 1.0.20";;\n'
+                    f"--help) cat {general_help};;\n"
+                    f"fileio) cat {fileio_help};;\n"
+                    "*) echo \"FATAL: Cannot find benchmark '$1'\"; exit 1;;\n"
+                    "esac\n"
+                )
+            os.chmod(binary, 0o755)
+            cache_directory = os.path.join(directory, "cache")
+
+            capabilities = sysbench_capabilities.probe(binary, cache_directory)
+            self.assertEqual("sysbench 1.0.20", capabilities["version"])
+            self.assertEqual({}, capabilities["tests"])
+            self.assertIsNone(capabilities["options"]["verbosity"])
+            with open(os.path.join(directory, "calls"), "r") as calls:
+                self.assertEqual(2, len(calls.readlines()))
+
+            # only the tests asked for are probed, each one once
+            for test in ("fileio", "memory", "fileio"):
+                capabilities = sysbench_capabilities.probe(
+                    binary, cache_directory, test
+                )
+            self.assertEqual(
+                ["sync", "async", "mmap"],
+                capabilities["tests"]["fileio"]["file-io-mode"],
+            )
+            self.assertIsNone(capabilities["tests"]["memory"])
+            with open(os.path.join(directory, "calls"), "r") as calls:
+                probes = len(calls.readlines())
+            self.assertEqual(4, probes)
+
+            # a new process reads the capabilities from the cache
+            sysbench_capabilities._probed.clear()
+            self.assertEqual(
+                capabilities, sysbench_capabilities.probe(binary, cache_directory)
+            )
+            with open(os.path.join(directory, "calls"), "r") as calls:
+                self.assertEqual(probes, len(calls.readlines()))
+
+            with mock.patch.dict(
+                os.environ,
+                {sysbench_capabilities.CACHE_DIRECTORY_VARIABLE: cache_directory},
+            ):
+                self.assertEqual(
+                    cache_directory, sysbench_capabilities.default_cache_directory()
+                )
+
+        capabilities = fake_capabilities()
+        params = sysbench_schema.SysbenchIoInputParams(
+            threads=2,
+            file_test_mode=sysbench_schema.FileTestMode.RNDRW,
+            file_extra_flags=sysbench_schema.FileExtraFlag.DIRECT,
+            histogram=sysbench_schema.OnOff.ON,
+            report_checkpoints=[5, 10],
+        )
+        flags = sysbench_plugin.get_sysbench_flags(
+            sysbench_schema.sysbench_io_input_schema, params
+        )
+        sysbench_capabilities.check_flags(capabilities, "fileio", flags)
+        with self.assertRaisesRegex(Exception, "memory test"):
+            sysbench_capabilities.check_flags(capabilities, "memory", [])
+        with self.assertRaisesRegex(Exception, "--warmup"):
+            sysbench_capabilities.check_flags(capabilities, "fileio", ["--warmup=5"])
+        with self.assertRaisesRegex(Exception, "supported values"):
+            sysbench_capabilities.check_flags(
+                capabilities, "fileio", ["--file-io-mode=uring"]
+            )
+
+    def test_watchdog(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # ignores SIGINT like a hung sysbench, only SIGTERM stops it
+            with open(os.path.join(directory, "sysbench"), "w") as script:
+                script.write(
+                    "#!/bin/sh\n"
+                    "trap '' INT\n"
+                    "echo '[ 1s ] thds: 2 eps: 2918.69 lat (ms,95%): 0.70'\n"
+                    "echo '[ 2s ] thds: 2 eps: 2928.69 lat (ms,95%): 0.72'\n"
+                    "exec sleep 60\n"
+                )
+            os.chmod(os.path.join(directory, "sysbench"), 0o755)
+            path = directory + os.pathsep + os.environ.get("PATH", "")
+            with mock.patch.dict(os.environ, {"PATH": path}):
+                with self.assertRaises(sysbench_plugin.WatchdogTimeout) as raised:
+                    sysbench_plugin.run_sysbench([], "cpu", timeout=1, grace=1)
+
+        timeout = raised.exception
+        self.assertEqual("SIGTERM", timeout.signal_name)
+        self.assertGreaterEqual(timeout.elapsed, 2)
+        self.assertEqual(2, len(timeout.intervals))
+        partial = sysbench_plugin.partial_results(timeout)
+        self.assertEqual("timeout", partial.status)
+        self.assertEqual("SIGTERM", partial.signal)
+        statistics = {
+            metric.metric: metric for metric in partial.sysbench_interval_statistics
+        }
+        self.assertAlmostEqual(2923.69, statistics["eventspersecond"].mean)
+        self.assertIsNone(partial.sysbench_checkpoints)
+        plugin.test_object_serialization(partial)
+
+        with open("tests/memory_checkpoint_output.txt", "r") as fout:
+            summary, intervals = sysbench_plugin.read_output(fout)
+        partial = sysbench_plugin.partial_results(
+            sysbench_plugin.WatchdogTimeout(
+                -9, "stopped", summary, intervals, "SIGKILL", 12.5
+            )
+        )
+        self.assertEqual(
+            [5.0, 10.0], [c.checkpoint for c in partial.sysbench_checkpoints]
+        )
+        self.assertIsNone(partial.sysbench_intervals)
+
+    def test_steady_state(self):
+        self.assertEqual(
+            2,
+            sysbench_plugin.sysbench_statistics.steady_state_start(
+                [1000.0, 2500.0, 2900.0, 2910.0, 2905.0, 2908.0], 3, 0.05, 0.01
+            ),
+        )
+        self.assertIsNone(
+            sysbench_plugin.sysbench_statistics.steady_state_start(
+                [1000.0, 1500.0, 2000.0, 2500.0], 2, 0.05, 0.01
+            )
+        )
+
+        params = sysbench_plugin.SysbenchMemoryInputParams(
+            time=15, report_interval=5, steady_state_window=2
+        )
+        flags = sysbench_plugin.get_sysbench_flags(
+            sysbench_plugin.sysbench_memory_input_schema,
+            sysbench_plugin.steady_state_checkpoints(params),
+        )
+        self.assertIn("--report-checkpoints=5,10", flags)
+        self.assertNotIn("steady-state", " ".join(flags))
+        for invalid in (
+            sysbench_plugin.SysbenchMemoryInputParams(steady_state_window=2),
+            sysbench_plugin.SysbenchMemoryInputParams(
+                time=15, report_interval=5, steady_state_window=4
+            ),
+            sysbench_plugin.SysbenchMemoryInputParams(
+                time=15,
+                report_interval=5,
+                report_checkpoints=[5],
+                steady_state_window=2,
+            ),
+        ):
+            with self.assertRaises(Exception):
+                sysbench_plugin.steady_state_checkpoints(invalid)
+
+        with open("tests/memory_checkpoint_output.txt", "r") as fout:
+            mem_output = fout.read()
+        output, results = sysbench_plugin.parse_output(mem_output)
+        _, intervals = sysbench_plugin.read_output(
+            [
+                "[ 5s ] 3000.00 MiB/sec\n",
+                "[ 10s ] 6212.06 MiB/sec\n",
+                "[ 15s ] 6213.00 MiB/sec\n",
+            ]
+        )
+        sysbench_plugin.apply_steady_state(params, output, results, intervals)
+        self.assertEqual(
+            {
+                "detected": True,
+                "start": 5.0,
+                "measuredtime": 10.0002,
+                "discardedtime": 5.0001,
+                "discardedevents": 35204791,
+            },
+            output["steadystate"],
+        )
+        self.assertEqual(66799437, output["totalnumberofevents"])
+        self.assertEqual(66799437, output["Totaloperations"])
+        self.assertAlmostEqual(65233.82, results["transferred_MiB"])
+        self.assertEqual(1.02, results["Latency"]["max"])
+        self.assertAlmostEqual(13966.3, results["Latency"]["sum"])
+        self.assertEqual(33399718.5, results["Threadsfairness"]["events"]["avg"])
+        self.assertNotIn("Checkpoints", results)
+        output["sysbenchversion"] = "sysbench 1.0.20"
+        output["memory_access_mode"] = "seq"
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_memory_output_schema.unserialize(output)
+        )
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_memory_results_schema.unserialize(results)
+        )
+
+        output, results = sysbench_plugin.parse_output(mem_output)
+        for interval in intervals:
+            interval["transferred_MiBpersec"] *= interval["time"]
+        sysbench_plugin.apply_steady_state(params, output, results, intervals)
+        self.assertFalse(output["steadystate"]["detected"])
+        self.assertEqual(102004228, output["totalnumberofevents"])
+        self.assertEqual(0, output["steadystate"]["discardedevents"])
+
+        with open("tests/io_parse_output.txt", "r") as fout:
+            io_output = fout.read()
+        output, results = sysbench_plugin.parse_output(io_output)
+        _, intervals = sysbench_plugin.read_output(
+            [
+                "[ 5s ] reads: 20.01 MiB/s writes: 13.34 MiB/s fsyncs: 40.00/s"
+                " latency (ms,95%): 0.102\n",
+                "[ 10s ] reads: 19.98 MiB/s writes: 13.33 MiB/s fsyncs: 40.01/s"
+                " latency (ms,95%): 0.104\n",
+            ]
+        )
+        sysbench_plugin.apply_steady_state(
+            sysbench_plugin.SysbenchIoInputParams(
+                time=10, report_interval=5, steady_state_window=2
+            ),
+            output,
+            results,
+            intervals,
+        )
+        self.assertTrue(output["steadystate"]["detected"])
+        self.assertEqual(0.0, output["steadystate"]["start"])
+
+    def test_compare(self):
+        self.assertAlmostEqual(
+            0.05, sysbench_plugin.sysbench_statistics.t_p_value(2.228, 10), 4
+        )
+        self.assertAlmostEqual(
+            0.05, sysbench_plugin.sysbench_statistics.t_p_value(12.706, 1), 4
+        )
+        self.assertIsNone(sysbench_plugin.sysbench_statistics.welch_p_value([1], [2]))
+
+        with open("tests/cpu_parse_output.txt", "r") as fout:
+            cpu_output = fout.read()
+        output, results = sysbench_plugin.parse_output(cpu_output)
+        output["sysbenchversion"] = "sysbench 1.0.20"
+
+        def repeated(factors):
+            runs = iter(factors)
+
+            def run_workload(params, version):
+                run_output = dict(output)
+                run_output["totalnumberofevents"] = int(29281 * next(runs))
+                return sysbench_plugin.WorkloadResultsCpu(
+                    sysbench_plugin.sysbench_cpu_output_schema.unserialize(run_output),
+                    sysbench_plugin.sysbench_cpu_results_schema.unserialize(results),
+                )
+
+            return sysbench_plugin.run_repeated(
+                run_workload,
+                sysbench_plugin.SysbenchCpuInputParams(repetitions=len(factors)),
+                "",
+            )
+
+        baseline = repeated([1.0, 1.01, 0.99, 1.005, 0.995])
+        slower = repeated([0.9, 0.91, 0.89, 0.905, 0.895])
+        noisy = repeated([0.8, 1.2, 0.85, 1.1, 0.95])
+
+        params = sysbench_plugin.SysbenchComparisonInputParams(
+            current=sysbench_schema.SysbenchResults(cpu=slower),
+            baseline=sysbench_schema.SysbenchResults(cpu=baseline),
+        )
+        output_id, output_data = sysbench_plugin.RunSysbenchCompare(
+            params=params, run_id="ci_test"
+        )
+        self.assertEqual("success", output_id)
+        self.assertFalse(output_data.passed)
+        self.assertEqual(["eventspersecond"], output_data.regressions)
+        metrics = {item.metric: item for item in output_data.metrics}
+        self.assertAlmostEqual(-0.1, metrics["eventspersecond"].relative_delta, 2)
+        self.assertLess(metrics["eventspersecond"].p_value, 0.001)
+        self.assertLess(metrics["eventspersecond"].effect_size, -5)
+        self.assertFalse(metrics["Latency.avg"].higher_is_better)
+        self.assertFalse(metrics["Latency.avg"].regression)
+        plugin.test_object_serialization(output_data)
+
+        # a 10% drop within the threshold of the metric passes
+        params.metric_thresholds = {"eventspersecond": 0.15}
+        _, output_data = sysbench_plugin.RunSysbenchCompare(
+            params=params, run_id="ci_test"
+        )
+        self.assertTrue(output_data.passed)
+
+        # a drop within the noise of the runs is not significant
+        params.metric_thresholds = None
+        params.current = sysbench_schema.SysbenchResults(cpu=noisy)
+        _, output_data = sysbench_plugin.RunSysbenchCompare(
+            params=params, run_id="ci_test"
+        )
+        self.assertTrue(output_data.passed)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            saved = sysbench_plugin.sysbench_results_schema.serialize(
+                sysbench_schema.SysbenchResults(cpu=baseline)
+            )
+            with open(path, "w") as baseline_file:
+                json.dump(
+                    {"output_id": "success", "output_data": saved["cpu"]},
+                    baseline_file,
+                )
+            params = sysbench_plugin.SysbenchComparisonInputParams(
+                current=sysbench_schema.SysbenchResults(cpu=slower),
+                baseline_file=path,
+                metrics=["eventspersecond"],
+            )
+            _, output_data = sysbench_plugin.RunSysbenchCompare(
+                params=params, run_id="ci_test"
+            )
+            self.assertEqual(["eventspersecond"], output_data.regressions)
+
+            params.metrics = ["Fileoperations.reads_s"]
+            output_id, _ = sysbench_plugin.RunSysbenchCompare(
+                params=params, run_id="ci_test"
+            )
+            self.assertEqual("error", output_id)
+
+            with open(path, "w") as baseline_file:
+                json.dump({"cpu": {"foo": 1}}, baseline_file)
+            output_id, output_data = sysbench_plugin.RunSysbenchCompare(
+                params=params, run_id="ci_test"
+            )
+            self.assertEqual("error", output_id)
+            self.assertEqual(1, output_data.exit_code)
+            self.assertIn("holds invalid results", output_data.error)
+
+        error = sysbench_plugin.workload_error(ValueError("not a number"))
+        self.assertEqual((1, "not a number"), (error.exit_code, error.error))
+        error = sysbench_plugin.workload_error(Exception(3, "failed"))
+        self.assertEqual((3, "failed"), (error.exit_code, error.error))
+
+        params = sysbench_plugin.SysbenchComparisonInputParams(
+            current=sysbench_schema.SysbenchResults(cpu=slower),
+        )
+        output_id, _ = sysbench_plugin.RunSysbenchCompare(
+            params=params, run_id="ci_test"
+        )
+        self.assertEqual("error", output_id)
+
+    def test_result_store(self):
+        with open("tests/cpu_parse_output.txt", "r") as fout:
+            cpu_output = fout.read()
+        output, results = sysbench_plugin.parse_output(cpu_output)
+        output["sysbenchversion"] = "sysbench 1.0.20"
+        events = iter([29281, 30000, 31000, 20000])
+
+        def run_workload(params, version):
+            run_output = dict(output, totalnumberofevents=next(events))
+            return sysbench_plugin.WorkloadResultsCpu(
+                sysbench_plugin.sysbench_cpu_output_schema.unserialize(run_output),
+                sysbench_plugin.sysbench_cpu_results_schema.unserialize(results),
+            )
+
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, "results", "sysbench.sqlite")
+            params = sysbench_plugin.SysbenchCpuInputParams(
+                threads=2, store_database=database
+            )
+            for _ in range(3):
+                sysbench_plugin.run_repeated(run_workload, params, "")
+            other = sysbench_plugin.SysbenchCpuInputParams(
+                threads=4, store_database=database
+            )
+            sysbench_plugin.run_repeated(run_workload, other, "")
+
+            query = sysbench_plugin.SysbenchQueryInputParams(
+                store_database=database,
+                cpu=sysbench_plugin.SysbenchCpuInputParams(threads=2),
+                metrics=["eventspersecond", "Latency.avg"],
+                latest=2,
+            )
+            output_id, output_data = sysbench_plugin.RunSysbenchQuery(
+                params=query, run_id="ci_test"
+            )
+            self.assertEqual("success", output_id)
+            self.assertEqual(3, output_data.count)
+            self.assertEqual(2, len(output_data.latest))
+            self.assertEqual(
+                31000 / output["totaltime"],
+                output_data.latest[0].metrics["eventspersecond"],
+            )
+            self.assertEqual("cpu", output_data.latest[0].workload)
+            trends = {trend.metric: trend for trend in output_data.trends}
+            self.assertEqual(3, trends["eventspersecond"].count)
+            bands = {
+                band.percentile: band.value for band in trends["eventspersecond"].bands
+            }
+            self.assertEqual(30000 / output["totaltime"], bands[50.0])
+            self.assertGreater(trends["eventspersecond"].slope_per_day, 0)
+            self.assertEqual(0, trends["Latency.avg"].slope_per_day)
+            plugin.test_object_serialization(output_data)
+
+            query = sysbench_plugin.SysbenchQueryInputParams(
+                store_database=database,
+                params_hash=output_data.latest[0].params_hash,
+                host=output_data.latest[0].host,
+            )
+            _, output_data = sysbench_plugin.RunSysbenchQuery(
+                params=query, run_id="ci_test"
+            )
+            self.assertEqual(3, output_data.count)
+
+            query = sysbench_plugin.SysbenchQueryInputParams(
+                store_database=database,
+                workload=sysbench_schema.StoredWorkload.CPU,
+            )
+            _, output_data = sysbench_plugin.RunSysbenchQuery(
+                params=query, run_id="ci_test"
+            )
+            self.assertEqual(4, output_data.count)
+
+            query.store_database = os.path.join(directory, "missing.sqlite")
+            output_id, _ = sysbench_plugin.RunSysbenchQuery(
+                params=query, run_id="ci_test"
+            )
+            self.assertEqual("error", output_id)
+
+    def test_telemetry(self):
+        previous = {
+            "time": 100.0,
+            "cpu": {"user": 100, "system": 50, "idle": 800, "iowait": 40, "steal": 10},
+            "meminfo": {"MemAvailable": 2048000},
+            "vmstat": {"pgmajfault": 10, "pswpin": 0, "pswpout": 0},
+            "disks": {"vda": (0, 0, 0), "vdb": (0, 0, 0)},
+            "frequency": None,
+        }
+        current = {
+            "time": 102.0,
+            "cpu": {"user": 250, "system": 75, "idle": 850, "iowait": 90, "steal": 35},
+            "meminfo": {"MemAvailable": 1024000},
+            "vmstat": {"pgmajfault": 30, "pswpin": 4, "pswpout": 8},
+            "disks": {"vda": (2048, 4096, 500), "vdb": (0, 0, 1500)},
+            "frequency": 2400.0,
+        }
+        sample = sysbench_telemetry.sample_rates(previous, current, 99.5)
+        self.assertEqual(2.5, sample["time"])
+        self.assertAlmostEqual(50.0, sample["cpu_user"])
+        self.assertAlmostEqual(8.333, sample["cpu_steal"], 3)
+        self.assertAlmostEqual(1000.0, sample["memory_available_MiB"])
+        self.assertEqual(10.0, sample["major_faults_s"])
+        self.assertEqual(0.5, sample["disk_read_MiB_s"])
+        self.assertEqual(1.0, sample["disk_written_MiB_s"])
+        self.assertEqual(75.0, sample["disk_busy"])
+        self.assertEqual(2400.0, sample["cpu_frequency_MHz"])
+
+        with sysbench_telemetry.TelemetrySampler(0.1) as telemetry:
+            time.sleep(0.35)
+        results = telemetry.results()
+        self.assertGreaterEqual(len(results["samples"]), 3)
+        self.assertIn("cpu_user", results["samples"][0])
+        self.assertIn("cpu_user", [item["metric"] for item in results["aggregates"]])
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_telemetry_schema.unserialize(results)
+        )
+
+        with sysbench_telemetry.TelemetrySampler(None) as telemetry:
+            pass
+        self.assertIsNone(telemetry.results())
+
+    def test_process_accounting(self):
+        process = subprocess.Popen(
+            [sys.executable, "-c", "sum(range(3000000)); open('/dev/null', 'w')"],
+        )
+        sampler = sysbench_accounting.ProcessSampler(process.pid, 0.01)
+        sampler.start()
+        time.sleep(0.05)
+        sampler.stop()
+        returncode, rusage = sysbench_accounting.wait_with_rusage(process)
+        self.assertEqual(0, returncode)
+        self.assertEqual(0, process.wait())
+        values = sysbench_accounting.efficiency(
+            sysbench_accounting.counters(rusage, sampler.values), 1.0, 1000
+        )
+        self.assertGreater(values["user_time"] + values["system_time"], 0)
+        self.assertGreater(values["peak_rss_KiB"], 0)
+        self.assertIn("events_per_cpu_second", values)
+        self.assertIn("cpu_utilization", values)
+        plugin.test_object_serialization(sysbench_schema.ProcessAccounting(**values))
+
+        first = {
+            "user_time": 1.0,
+            "system_time": 1.0,
+            "voluntary_context_switches": 10,
+            "involuntary_context_switches": 10,
+            "peak_rss_KiB": 4096,
+            "read_chars": 4096,
+            "written_chars": 0,
+            "read_syscalls": 2,
+            "write_syscalls": 0,
+            "events_per_cpu_second": 50.0,
+        }
+        second = dict(first, user_time=3.0, peak_rss_KiB=8192, read_syscalls=6)
+        merged = sysbench_accounting.merge([first, second], 2.0, 300)
+        self.assertEqual(4.0, merged["user_time"])
+        self.assertEqual(8192, merged["peak_rss_KiB"])
+        self.assertEqual(50.0, merged["events_per_cpu_second"])
+        self.assertEqual(3.0, merged["cpu_utilization"])
+        self.assertAlmostEqual(0.133, merged["context_switches_per_event"], 3)
+        self.assertEqual(1024.0, merged["bytes_per_syscall"])
+
+    def test_threads_and_mutex(self):
+        commands = []
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            commands.append([operation] + flags)
+            path = f"tests/golden/sysbench_1.0.20_{operation}_default.txt"
+            with open(path, "r") as fout:
+                summary, intervals = sysbench_plugin.read_output(fout)
+            output, results = sysbench_plugin.parse_output(summary)
+            return output, results, intervals
+
+        with mock.patch.object(
+            sysbench_plugin, "run_sysbench", run_sysbench
+        ), mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+            output_id, output_data = sysbench_plugin.RunSysbenchThreads(
+                params=sysbench_plugin.SysbenchThreadsInputParams(
+                    threads=4, thread_yields=100
+                ),
+                run_id="ci_test",
+            )
+            self.assertEqual("success", output_id)
+            self.assertEqual(
+                ["threads", "--threads=4", "--thread-yields=100"], commands[0][:3]
+            )
+            self.assertEqual(1.84, output_data.sysbench_results.Latency.avg)
+            plugin.test_object_serialization(output_data)
+
+            output_id, output_data = sysbench_plugin.RunSysbenchMutex(
+                params=sysbench_plugin.SysbenchMutexInputParams(mutex_locks=10000),
+                run_id="ci_test",
+            )
+            self.assertEqual("success", output_id)
+            self.assertIn("--mutex-locks=10000", commands[-1])
+            self.assertEqual(4, output_data.sysbench_output_params.totalnumberofevents)
+            plugin.test_object_serialization(output_data)
+
+            output_id, output_data = sysbench_plugin.RunSysbenchThreadScaling(
+                params=sysbench_plugin.SysbenchThreadScalingInputParams(
+                    mutex=sysbench_plugin.SysbenchMutexInputParams(),
+                    thread_counts=[2],
+                ),
+                run_id="ci_test",
+            )
+            self.assertEqual("success", output_id)
+            self.assertEqual([1, 2], [point.threads for point in output_data.points])
+            self.assertEqual(268.93, output_data.points[1].latency_avg)
+
+    def test_lua(self):
+        commands = []
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            with open(operation, "r") as script:
+                commands.append((test_mode, script.read(), flags))
+            if test_mode != "run":
+                return None
+            with open("tests/sysbench_lua_output.txt", "r") as fout:
+                summary, intervals = sysbench_plugin.read_output(fout)
+            output, results = kwargs["parse"](summary)
+            return output, results, intervals
+
+        params = sysbench_plugin.SysbenchLuaInputParams(
+            threads=2,
+            script="function event() end",
+            script_options={"kv-keys": 100000, "kv-zipf": True, "kv-sizes": [64, 4096]},
+            prepare=True,
+        )
+        with mock.patch.object(
+            sysbench_plugin, "run_sysbench", run_sysbench
+        ), mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+            output_id, output_data = sysbench_plugin.RunSysbenchLua(
+                params=params, run_id="ci_test"
+            )
+            self.assertEqual("success", output_id)
+            self.assertEqual(
+                ["prepare", "run", "cleanup"], [command[0] for command in commands]
+            )
+            self.assertEqual("function event() end", commands[1][1])
+            self.assertEqual(
+                [
+                    "--threads=2",
+                    "--kv-keys=100000",
+                    "--kv-zipf=on",
+                    "--kv-sizes=64,4096",
+                ],
+                commands[1][2],
+            )
+            self.assertIsNone(output_data.sysbench_output_params.script)
+            self.assertEqual(1.65, output_data.sysbench_results.Latency.avg)
+            self.assertEqual(
+                {
+                    "kv gets": 12100.0,
+                    "kv hits": 10900.0,
+                    "transactions": 12100.0,
+                    "transactions per second": 1209.71,
+                    "ignored errors": 0.0,
+                    "ignored errors per second": 0.0,
+                    "mean value size (bytes)": 512.5,
+                },
+                output_data.sysbench_results.custommetrics,
+            )
+            self.assertEqual(
+                10900.0,
+                sysbench_plugin.repetition_metrics(output_data)[
+                    "custommetrics.kv hits"
+                ],
+            )
+            plugin.test_object_serialization(output_data)
+
+            output_id, output_data = sysbench_plugin.RunSysbenchLua(
+                params=sysbench_plugin.SysbenchLuaInputParams(
+                    script="function event() end",
+                    script_file="tests/kv.lua",
+                ),
+                run_id="ci_test",
+            )
+            self.assertEqual("error", output_id)
+            self.assertIn("Exactly one of script and script-file", output_data.error)
+
+            output_id, output_data = sysbench_plugin.RunSysbenchLua(
+                params=sysbench_plugin.SysbenchLuaInputParams(
+                    script="function event() end", script_options={"threads": 4}
+                ),
+                run_id="ci_test",
+            )
+            self.assertEqual("error", output_id)
+            self.assertIn("threads is a step parameter", output_data.error)
+
+    def test_lua_custom_report(self):
+        # a script replacing the report hooks prints no standard sections
+        output_file = os.path.abspath("tests/sysbench_lua_custom_report_output.txt")
+        with tempfile.TemporaryDirectory() as directory:
+            binary = os.path.join(directory, "sysbench")
+            with open(binary, "w") as script:
+                script.write(f"#!/bin/sh\ncat {output_file}\n")
+            os.chmod(binary, 0o755)
+            with mock.patch.dict(
+                os.environ, {"PATH": directory + os.pathsep + os.environ["PATH"]}
+            ), mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+                output_id, output_data = sysbench_plugin.RunSysbenchLua(
+                    params=sysbench_plugin.SysbenchLuaInputParams(
+                        script="function event() end"
+                    ),
+                    run_id="ci_test",
+                )
+        self.assertEqual("success", output_id)
+        self.assertIsNone(output_data.sysbench_results.Latency)
+        self.assertEqual(
+            {"kv gets": 12100.0, "kv hits": 10900.0},
+            output_data.sysbench_results.custommetrics,
+        )
+        plugin.test_object_serialization(output_data)
+
+    def test_io_matrix(self):
+        with open("tests/io_parse_output.txt", "r") as fout:
+            io_output = fout.read()
+        modes = []
+
+        def run_sysbench(
+            flags, operation, test_mode="run", cpus=None, cwd=None, **kwargs
+        ):
+            modes.append(test_mode)
+            if test_mode != "run":
+                return None
+            output, results = sysbench_plugin.parse_output(io_output)
+            return output, results, []
+
+        params = sysbench_plugin.SysbenchIoMatrixInputParams(
+            io=sysbench_plugin.SysbenchIoInputParams(threads=2),
+            file_test_modes=[
+                sysbench_schema.FileTestMode.RNDR,
+                sysbench_schema.FileTestMode.SEQWR,
+            ],
+            file_block_sizes=[4096, 16384],
+        )
+        with mock.patch.object(
+            sysbench_plugin, "run_sysbench", run_sysbench
+        ), mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+            matrix = sysbench_plugin.io_matrix(params, "sysbench 1.0.20")
+
+        self.assertEqual(["prepare"] + ["run"] * 4 + ["cleanup"], modes)
+        self.assertFalse(matrix["Preparedfilesreused"])
+        self.assertEqual(
+            [4096, 16384, 4096, 16384],
+            [point["file_block_size"] for point in matrix["points"]],
+        )
+        self.assertEqual(2, matrix["points"][3]["threads"])
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_io_matrix_results_schema.unserialize(matrix)
+        )
+
+        with self.assertRaises(Exception):
+            sysbench_plugin.io_matrix(
+                sysbench_plugin.SysbenchIoMatrixInputParams(
+                    io=sysbench_plugin.SysbenchIoInputParams()
+                ),
+                "sysbench 1.0.20",
+            )
+
+    def test_io_queue_depth(self):
+        with open("tests/io_parse_output.txt", "r") as fout:
+            io_output = fout.read()
+        commands = []
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            commands.append(flags)
+            if test_mode != "run":
+                return None
+            options = dict(flag[2:].split("=", 1) for flag in flags)
+            queue_depth = int(options["threads"]) * int(options["file-async-backlog"])
+            # the device completes at most 8000 operations per second
+            iops = min(1000.0 * queue_depth, 8000.0)
+            output, results = sysbench_plugin.parse_output(io_output)
+            results["Fileoperations"]["reads_s"] = iops
+            results["Fileoperations"]["writes_s"] = 0.0
+            results["Latency"]["avg"] = 1000.0 * queue_depth / iops
+            return output, results, []
+
+        params = sysbench_plugin.SysbenchIoQueueDepthInputParams(
+            io=sysbench_plugin.SysbenchIoInputParams(
+                file_test_mode=sysbench_schema.FileTestMode.RNDR
+            ),
+            queue_depths=[16, 1, 4],
+            thread_counts=[1, 2],
+        )
+        with mock.patch.object(
+            sysbench_plugin, "run_sysbench", run_sysbench
+        ), mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+            sweep = sysbench_plugin.io_queue_depth_sweep(params, "sysbench 1.0.20")
+
+        self.assertIn("--file-io-mode=async", commands[1])
+        self.assertEqual(
+            [1, 4, 16, 2, 8, 32], [point["queue_depth"] for point in sweep["points"]]
+        )
+        self.assertEqual(
+            [(16, False), (8, True)],
+            [(knee["queue_depth"], knee["saturated"]) for knee in sweep["knees"]],
+        )
+        self.assertEqual(8, sweep["knee"]["queue_depth"])
+        self.assertEqual(2, sweep["knee"]["threads"])
+        self.assertEqual(3.0, sweep["knee"]["latency_added"])
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_io_queue_depth_results_schema.unserialize(sweep)
+        )
+
+        with self.assertRaises(Exception):
+            sysbench_plugin.io_queue_depth_sweep(
+                sysbench_plugin.SysbenchIoQueueDepthInputParams(
+                    io=sysbench_plugin.SysbenchIoInputParams()
+                ),
+                "sysbench 1.0.20",
+            )
+
+    def test_rate_sweep(self):
+        self.assertEqual(
+            [100, 200, 400, 800], sysbench_plugin.geometric_rates(800.0, 4, 0.125)
+        )
+        self.assertEqual([1, 2], sysbench_plugin.geometric_rates(2.0, 4, 0.5))
+
+        with open("tests/cpu_histogram_output.txt", "r") as fout:
+            cpu_output = fout.read()
+        commands = []
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            commands.append(flags)
+            options = dict(flag[2:].split("=", 1) for flag in flags)
+            # the system completes at most 1000 events per second
+            rate = int(options.get("rate", 1000))
+            output, results = sysbench_plugin.parse_output(cpu_output)
+            output["totaltime"] = 10.0
+            output["totalnumberofevents"] = 10 * min(rate, 1000)
+            backlog = max(0, rate - 1000)
+            intervals = [
+                {"time": float(time), "queuelength": backlog * time, "concurrency": 1}
+                for time in (1, 2)
+            ]
+            return output, results, intervals
+
+        with mock.patch.object(sysbench_plugin, "run_sysbench", run_sysbench):
+            sweep = sysbench_plugin.rate_sweep(
+                sysbench_plugin.run_sysbench_workload,
+                sysbench_plugin.SysbenchCpuInputParams(percentiles=[50.0, 99.0]),
+                sysbench_plugin.SysbenchRateSweepInputParams(
+                    ramp_points=3, ramp_min_fraction=0.25
+                ),
+                "sysbench 1.0.20",
+            )
+        self.assertNotIn("--rate", " ".join(commands[0]))
+        self.assertIn("--report-interval=1", commands[0])
+        self.assertIn("--rate=250", commands[1])
+        self.assertEqual(1000.0, sweep["unthrottled_eventspersecond"])
+        self.assertEqual(
+            [250, 500, 1000], [point["target_rate"] for point in sweep["points"]]
+        )
+        self.assertEqual(0.5, sweep["points"][1]["load"])
+        self.assertEqual(1.0, sweep["points"][2]["achieved_fraction"])
+        self.assertEqual(2, len(sweep["points"][0]["latency_percentiles"]))
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_rate_sweep_results_schema.unserialize(sweep)
+        )
+
+        with mock.patch.object(sysbench_plugin, "run_sysbench", run_sysbench):
+            sweep = sysbench_plugin.rate_sweep(
+                sysbench_plugin.run_sysbench_workload,
+                sysbench_plugin.SysbenchCpuInputParams(report_interval=2),
+                sysbench_plugin.SysbenchRateSweepInputParams(rates=[1500, 500]),
+                "sysbench 1.0.20",
+            )
+        self.assertIn("--report-interval=2", commands[-1])
+        self.assertNotIn("unthrottled_eventspersecond", sweep)
+        self.assertNotIn("load", sweep["points"][0])
+        overloaded = sweep["points"][1]
+        self.assertAlmostEqual(2 / 3, overloaded["achieved_fraction"])
+        self.assertEqual(750.0, overloaded["queuelength_avg"])
+        self.assertEqual(1000, overloaded["queuelength_max"])
+        self.assertEqual(1, overloaded["concurrency_max"])
+
+        latencies = iter([1.0, 3.0])
+
+        def repeated_run_sysbench(flags, operation, test_mode="run", **kwargs):
+            output, results, intervals = run_sysbench(flags, operation, test_mode)
+            results["Latencyhistogram"] = {"values": [next(latencies)], "counts": [1]}
+            return output, results, intervals
+
+        with mock.patch.object(sysbench_plugin, "run_sysbench", repeated_run_sysbench):
+            sweep = sysbench_plugin.rate_sweep(
+                sysbench_plugin.run_sysbench_workload,
+                sysbench_plugin.SysbenchCpuInputParams(
+                    percentiles=[99.0], repetitions=2
+                ),
+                sysbench_plugin.SysbenchRateSweepInputParams(rates=[500]),
+                "sysbench 1.0.20",
+            )
+        self.assertEqual(
+            [{"percentile": 99.0, "value": 2.0}],
+            sweep["points"][0]["latency_percentiles"],
+        )
+
+    def test_max_rate(self):
+        with open("tests/cpu_histogram_output.txt", "r") as fout:
+            cpu_output = fout.read()
+        commands = []
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            commands.append(flags)
+            options = dict(flag[2:].split("=", 1) for flag in flags)
+            # events queue up and wait past 700 events per second
+            rate = int(options.get("rate", 1000))
+            output, results = sysbench_plugin.parse_output(cpu_output)
+            output["totaltime"] = 10.0
+            output["totalnumberofevents"] = 10 * min(rate, 1000)
+            latency = 2.0 if rate <= 700 else 20.0
+            results["Latencyhistogram"] = {"values": [latency], "counts": [100]}
+            return output, results, []
+
+        params = sysbench_plugin.SysbenchMaxRateInputParams(
+            slo_latency=5.0, cpu=sysbench_plugin.SysbenchCpuInputParams(time=30)
+        )
+        with mock.patch.object(sysbench_plugin, "run_sysbench", run_sysbench):
+            run_workload, workload_params = sysbench_plugin.selected_workload(params)
+            search = sysbench_plugin.max_sustainable_rate(
+                run_workload, workload_params, params, "sysbench 1.0.20"
+            )
+        self.assertEqual(1000.0, search["unthrottled_eventspersecond"])
+        self.assertIn("--time=5", commands[0])
+        self.assertEqual([1000, 1], [probe["rate"] for probe in search["probes"][:2]])
+        self.assertFalse(search["probes"][0]["latency_met"])
+        self.assertLessEqual(len(search["probes"]), params.max_probes)
+        self.assertGreaterEqual(search["sustainable_rate"], 680)
+        self.assertLessEqual(search["sustainable_rate"], 700)
+        self.assertIn("--time=30", commands[-1])
+        self.assertTrue(search["confirmed"])
+        self.assertEqual(2.0, search["confirmation"]["latency"])
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_max_rate_results_schema.unserialize(search)
+        )
+
+        params = sysbench_plugin.SysbenchMaxRateInputParams(
+            slo_latency=1.0,
+            min_rate=100,
+            max_rate=2000,
+            cpu=sysbench_plugin.SysbenchCpuInputParams(),
+        )
+        with mock.patch.object(sysbench_plugin, "run_sysbench", run_sysbench):
+            search = sysbench_plugin.max_sustainable_rate(
+                sysbench_plugin.run_sysbench_workload,
+                params.cpu,
+                params,
+                "sysbench 1.0.20",
+            )
+        self.assertEqual([2000, 100], [probe["rate"] for probe in search["probes"]])
+        self.assertFalse(search["probes"][0]["rate_met"])
+        self.assertNotIn("sustainable_rate", search)
+        self.assertFalse(search["confirmed"])
+
+        # the first of every three repetitions misses the SLO
+        runs = []
+
+        def noisy_run_sysbench(flags, operation, test_mode="run", **kwargs):
+            output, results, intervals = run_sysbench(flags, operation, test_mode)
+            if len(runs) % 3 == 0:
+                results["Latencyhistogram"] = {"values": [20.0], "counts": [100]}
+            runs.append(flags)
+            return output, results, intervals
+
+        params = sysbench_plugin.SysbenchMaxRateInputParams(
+            slo_latency=5.0,
+            min_rate=100,
+            max_rate=500,
+            cpu=sysbench_plugin.SysbenchCpuInputParams(repetitions=3),
+        )
+        with mock.patch.object(sysbench_plugin, "run_sysbench", noisy_run_sysbench):
+            search = sysbench_plugin.max_sustainable_rate(
+                sysbench_plugin.run_sysbench_workload,
+                params.cpu,
+                params,
+                "sysbench 1.0.20",
+            )
+        self.assertEqual(6, len(runs))
+        self.assertEqual([20.0, 20.0], [probe["latency"] for probe in search["probes"]])
+        self.assertNotIn("sustainable_rate", search)
+
+        output_id, output_data = sysbench_plugin.RunSysbenchMaxRate(
+            params=sysbench_plugin.SysbenchMaxRateInputParams(slo_latency=5.0),
+            run_id="ci_test",
+        )
+        self.assertEqual("error", output_id)
+
+    def test_interference(self):
+        outputs = {}
+        for operation in ("cpu", "memory"):
+            with open(f"tests/{operation}_parse_output.txt", "r") as fout:
+                outputs[operation] = fout.read()
+        commands = []
+        lock = threading.Lock()
+
+        def run_sysbench(flags, operation, test_mode="run", **kwargs):
+            with lock:
+                commands.append((operation, flags))
+                alone = [command[0] for command in commands] == ["cpu"]
+            output, results = sysbench_plugin.parse_output(outputs[operation])
+            if operation == "cpu":
+                output["totaltime"] = 10.0
+                output["totalnumberofevents"] = 10000 if alone else 8000
+                results["Latency"]["avg"] = 1.0 if alone else 1.25
+                results["Latency"]["percentile_value"] = 2.0 if alone else 3.0
+            return output, results, []
+
+        def capabilities(test=None):
+            probed = fake_capabilities()
+            probed["tests"]["memory"] = {
+                "memory-block-size": None,
+                "memory-total-size": None,
+                "memory-scope": ["global", "local"],
+                "memory-hugetlb": None,
+                "memory-oper": ["read", "write", "none"],
+                "memory-access-mode": ["seq", "rnd"],
+            }
+            return probed
+
+        params = sysbench_plugin.SysbenchInterferenceInputParams(
+            primary=sysbench_schema.InterferenceWorkload(
+                cpu=sysbench_plugin.SysbenchCpuInputParams(time=5)
+            ),
+            antagonists=[
+                sysbench_schema.InterferenceWorkload(
+                    memory=sysbench_plugin.SysbenchMemoryInputParams(events=100)
+                ),
+                sysbench_schema.InterferenceWorkload(
+                    name="spinner", cpu=sysbench_plugin.SysbenchCpuInputParams()
+                ),
+            ],
+            combined=True,
+            antagonist_lead=0,
+        )
+        with mock.patch.object(
+            sysbench_plugin, "run_sysbench", run_sysbench
+        ), mock.patch.object(sysbench_capabilities, "probe", capabilities):
+            results = sysbench_plugin.interference(params, "sysbench 1.0.20")
+
+        memory_flags = [flags for operation, flags in commands if operation == "memory"]
+        self.assertEqual(2, len(memory_flags))
+        self.assertIn("--time=5", memory_flags[0])
+        self.assertIn("--events=0", memory_flags[0])
+        self.assertEqual("cpu", results["primary"])
+        self.assertEqual(1000.0, results["baseline"]["eventspersecond"])
+        self.assertEqual(
+            ["memory", "spinner", "combined"],
+            [result["antagonist"] for result in results["interference"]],
+        )
+        memory = results["interference"][0]
+        self.assertAlmostEqual(0.2, memory["throughput_loss"])
+        self.assertAlmostEqual(0.25, memory["latency_avg_increase"])
+        self.assertAlmostEqual(0.5, memory["tail_latency_increase"])
+        self.assertEqual(1, len(memory["antagonist_eventspersecond"]))
+        self.assertEqual(
+            2, len(results["interference"][2]["antagonist_eventspersecond"])
+        )
+        plugin.test_object_serialization(
+            sysbench_plugin.sysbench_interference_results_schema.unserialize(results)
+        )
+
+        params.antagonists[0].cpu = sysbench_plugin.SysbenchCpuInputParams()
+        with mock.patch.object(sysbench_capabilities, "probe", fake_capabilities):
+            output_id, output_data = sysbench_plugin.RunSysbenchInterference(
+                params=params, run_id="ci_test"
+            )
+        self.assertEqual("error", output_id)
+        self.assertIn("Exactly one of the cpu, memory or io", output_data.error)
+
+        # every phase is repeated, only the primary running alone is stored
+        commands.clear()
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, "sysbench.sqlite")
+            params = sysbench_plugin.SysbenchInterferenceInputParams(
+                primary=sysbench_schema.InterferenceWorkload(
+                    cpu=sysbench_plugin.SysbenchCpuInputParams(
+                        time=5, repetitions=2, store_database=database
+                    )
+                ),
+                antagonists=[
+                    sysbench_schema.InterferenceWorkload(
+                        memory=sysbench_plugin.SysbenchMemoryInputParams()
+                    ),
+                ],
+                antagonist_lead=0,
+            )
+            with mock.patch.object(
+                sysbench_plugin, "run_sysbench", run_sysbench
+            ), mock.patch.object(sysbench_capabilities, "probe", capabilities):
+                results = sysbench_plugin.interference(params, "sysbench 1.0.20")
+            stored = sysbench_plugin.sysbench_store.query(database, [])
+        self.assertEqual(
+            ["cpu"] * 4 + ["memory"] * 2,
+            sorted(operation for operation, _ in commands),
+        )
+        self.assertEqual(1, len(stored))
+        self.assertEqual(
+            1, len(results["interference"][0]["antagonist_eventspersecond"])
+        )
+
+        params.antagonists[0].memory.repetitions = 3
+        with mock.patch.object(sysbench_capabilities, "probe", capabilities):
+            output_id, output_data = sysbench_plugin.RunSysbenchInterference(
+                params=params, run_id="ci_test"
+            )
+        self.assertEqual("error", output_id)
+        self.assertIn("take no repetitions", output_data.error)
+
 
 if __name__ == "__main__":
     unittest.main()